@@ -0,0 +1,377 @@
+#!/usr/bin/env python3
+"""
+Benchmark suite for the .NET project generator
+Measures generation speed and memory across schema sizes and feature flags
+"""
+
+import argparse
+import gc
+import itertools
+import json
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from dataclasses import MISSING, field, fields, make_dataclass
+from pathlib import Path
+from typing import Callable, Dict, List
+
+from enhanced_dotnet_generator import (
+    EnhancedDotNetGenerator,
+    ProjectConfig,
+    EntityConfig,
+    PropertyConfig,
+    FrozenPropertyConfig,
+    PropertyColumns,
+    ProjectType,
+    DatabaseProvider,
+    generator_version
+)
+
+
+# Schema sizes (number of entities) benchmarked by default
+DEFAULT_SIZES = [1, 10, 100, 1000]
+
+# Feature flags crossed in every combination
+FLAGS = ["include_database", "include_swagger", "include_cors", "include_authentication", "include_tests"]
+
+# Property types cycled through by the synthetic schemas
+PROPERTY_TYPES = ["string", "int", "decimal", "DateTime", "bool", "double", "long"]
+
+# Property counts of the config memory benchmark
+DEFAULT_PROPERTY_COUNTS = [10000, 100000]
+
+# PropertyConfig as it was before __slots__ (one __dict__ per instance): reference of the memory benchmark
+DictPropertyConfig = make_dataclass("DictPropertyConfig", [
+    (config_field.name, config_field.type) if config_field.default is MISSING
+    else (config_field.name, config_field.type, field(default=config_field.default))
+    for config_field in fields(PropertyConfig)
+])
+
+# Entry points of the scripted (non interactive) paths, whose startup time is budgeted
+HEADLESS_MODULES = ["dotnet_generator_cli", "project_spec", "enhanced_dotnet_generator"]
+
+# Modules only the interactive menu may load
+INTERACTIVE_MODULES = ("rich", "inquirer")
+
+# Default import time budget of a headless entry point
+DEFAULT_IMPORT_BUDGET_MS = 100.0
+
+
+def build_entities(entity_count: int, min_properties: int = 5, max_properties: int = 50) -> List[EntityConfig]:
+    """Build a synthetic schema with entity_count entities of 5-50 properties each"""
+    span = max_properties - min_properties + 1
+    entities = []
+
+    for index in range(entity_count):
+        name = f"Entity{index:04d}"
+        properties = [PropertyConfig("Id", "int", is_required=True, is_key=True)]
+
+        # Deterministic spread of property counts across the schema
+        property_count = min_properties + (index * 7) % span
+        for prop_index in range(1, property_count):
+            prop_type = PROPERTY_TYPES[prop_index % len(PROPERTY_TYPES)]
+            properties.append(PropertyConfig(
+                f"Field{prop_index:02d}",
+                prop_type,
+                is_required=prop_index % 2 == 0,
+                max_length=50 + prop_index if prop_type == "string" else None,
+                foreign_table=f"Entity{index - 1:04d}" if prop_index == 1 and index > 0 else None
+            ))
+
+        entities.append(EntityConfig(name, properties))
+
+    return entities
+
+
+def build_config(entity_count: int, flags: Dict[str, bool], output_path: str = ".") -> ProjectConfig:
+    """Build a synthetic ProjectConfig for one benchmark case"""
+    return ProjectConfig(
+        project_name=f"Bench{entity_count}",
+        project_type=ProjectType.WEBAPI,
+        output_path=output_path,
+        database_provider=DatabaseProvider.SQLSERVER,
+        entities=build_entities(entity_count),
+        deterministic_guids=True,
+        **flags
+    )
+
+
+def case_name(entity_count: int, flags: Dict[str, bool]) -> str:
+    """Stable identifier of a benchmark case, used to match baselines"""
+    enabled = [flag[len("include_"):] for flag in FLAGS if flags[flag]]
+    return f"{entity_count}e[{','.join(enabled) or 'none'}]"
+
+
+def run_case(config: ProjectConfig, repeat: int, disk: bool) -> dict:
+    """Benchmark one config: best-of-N timing, then a separate traced run for peak memory"""
+    best = None
+
+    for _ in range(repeat):
+        generator = EnhancedDotNetGenerator(instrument=True)
+        start = time.perf_counter()
+        if disk:
+            result = generator.generate_project(config)
+            if not result['success']:
+                raise RuntimeError(result['error'])
+        else:
+            generator.render_project(config)
+        seconds = time.perf_counter() - start
+
+        if best is None or seconds < best['seconds']:
+            best = {'seconds': seconds, 'stages': generator.stage_stats}
+
+    files = sum(stage['files'] for stage in best['stages'])
+    size = sum(stage['bytes'] for stage in best['stages'])
+
+    # Memory is measured apart from timing since tracemalloc slows everything down
+    tracemalloc.start()
+    try:
+        if disk:
+            EnhancedDotNetGenerator().generate_project(config)
+        else:
+            EnhancedDotNetGenerator().render_project(config)
+        peak_memory = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+    return {
+        'entities': len(config.entities),
+        'properties': sum(len(entity.properties) for entity in config.entities),
+        'seconds': best['seconds'],
+        'seconds_per_entity': best['seconds'] / max(len(config.entities), 1),
+        'files': files,
+        'bytes': size,
+        'files_per_sec': files / best['seconds'],
+        'bytes_per_sec': size / best['seconds'],
+        'peak_memory': peak_memory,
+        'stages': {stage['stage']: stage['seconds'] for stage in best['stages']}
+    }
+
+
+def run_benchmarks(sizes: List[int], repeat: int = 3, disk: bool = False, all_flags: bool = True) -> dict:
+    """Run every (size, flag combination) case and collect the results"""
+    if all_flags:
+        combinations = [dict(zip(FLAGS, values)) for values in itertools.product([False, True], repeat=len(FLAGS))]
+    else:
+        combinations = [dict.fromkeys(FLAGS, True)]
+
+    results = {
+        'generator_version': generator_version(),
+        'python': sys.version.split()[0],
+        'target': 'disk' if disk else 'memory',
+        'cases': {}
+    }
+
+    with tempfile.TemporaryDirectory() as output_path:
+        for entity_count in sizes:
+            for flags in combinations:
+                name = case_name(entity_count, flags)
+                config = build_config(entity_count, flags, output_path)
+                case = run_case(config, repeat, disk)
+                results['cases'][name] = case
+
+                print(f"{name:<48} {case['seconds'] * 1000:10.2f} ms "
+                      f"{case['seconds_per_entity'] * 1e6:8.0f} µs/entity "
+                      f"{case['files_per_sec']:10.0f} files/s "
+                      f"{case['bytes_per_sec'] / 1e6:8.2f} MB/s "
+                      f"{case['peak_memory'] / 1e6:8.2f} MB peak")
+
+    return results
+
+
+def compare_with_baseline(results: dict, baseline: dict, tolerance: float) -> List[str]:
+    """List the cases slower (or hungrier) than the baseline beyond the tolerance"""
+    regressions = []
+
+    for name, case in results['cases'].items():
+        reference = baseline['cases'].get(name)
+        if reference is None:
+            continue
+
+        for metric in ('seconds', 'peak_memory'):
+            limit = reference[metric] * (1 + tolerance)
+            if case[metric] > limit:
+                regressions.append(
+                    f"{name}: {metric} {case[metric]:.6g} > {reference[metric]:.6g} (+{tolerance:.0%} allowed)"
+                )
+
+    return regressions
+
+
+def property_rows(count: int) -> List[dict]:
+    """Property dicts as parsed from a spec file, following the synthetic schema pattern"""
+    rows = []
+    for index in range(count):
+        prop_type = PROPERTY_TYPES[index % len(PROPERTY_TYPES)]
+        rows.append({
+            'name': f"Field{index:06d}",
+            'type': prop_type,
+            'is_required': index % 2 == 0,
+            'is_key': index % 50 == 0,
+            'max_length': 50 + index % 200 if prop_type == "string" else None,
+            'foreign_table': f"Entity{index // 50:04d}" if index % 50 == 1 else None
+        })
+    # Through JSON so that every string is its own object, as after loading a spec
+    return json.loads(json.dumps(rows))
+
+
+def config_layouts() -> Dict[str, Callable[[List[dict]], object]]:
+    """Ways to hold a property list in memory, by name"""
+    return {
+        'dataclass (__dict__)': lambda rows: [DictPropertyConfig(**row) for row in rows],
+        'PropertyConfig (__slots__)': lambda rows: [PropertyConfig(**row) for row in rows],
+        'FrozenPropertyConfig': lambda rows: [FrozenPropertyConfig(**row) for row in rows],
+        'PropertyColumns': PropertyColumns.from_dicts
+    }
+
+
+def measure_config_memory(counts: List[int]) -> dict:
+    """Memory retained by each property list layout, beyond the parsed spec it is built from"""
+    results = {}
+
+    for count in counts:
+        rows = property_rows(count)
+        baseline = None
+
+        for name, build in config_layouts().items():
+            gc.collect()
+            tracemalloc.start()
+            try:
+                properties = build(rows)
+                retained = tracemalloc.get_traced_memory()[0]
+            finally:
+                tracemalloc.stop()
+            del properties
+
+            baseline = baseline or retained
+            results[f"{count}p[{name}]"] = {'properties': count, 'bytes': retained, 'bytes_per_property': retained / count}
+            print(f"{count:>7} properties  {name:<28} {retained / 1e6:8.2f} MB "
+                  f"{retained / count:7.1f} B/property  {1 - retained / baseline:6.1%} saved")
+
+    return results
+
+
+def measure_import(module: str) -> dict:
+    """Import module in a fresh interpreter under -X importtime: cumulative time and modules loaded.
+
+    The interpreter runs from the directory of this script, so the generator
+    modules are found wherever the benchmark is started from. A failed
+    import is reported under 'error'.
+    """
+    process = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True, text=True, cwd=Path(__file__).resolve().parent
+    )
+    if process.returncode != 0:
+        lines = [line for line in process.stderr.splitlines() if not line.startswith("import time:")]
+        return {'module': module, 'milliseconds': None, 'modules': [],
+                'error': lines[-1] if lines else f"exit status {process.returncode}"}
+
+    cumulative_us = 0
+    loaded = []
+    for line in process.stderr.splitlines():
+        # "import time: self [us] | cumulative | imported package"
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line.split("|")
+        if not cumulative.strip().isdigit():
+            continue
+        name = name.strip()
+        loaded.append(name)
+        if name == module:
+            cumulative_us = int(cumulative)
+
+    return {'module': module, 'milliseconds': cumulative_us / 1000, 'modules': loaded}
+
+
+def check_import_budget(modules: List[str], budget_ms: float, repeat: int = 3) -> List[str]:
+    """List the headless modules importing over budget (best of N) or pulling in an interactive dependency"""
+    failures = []
+
+    for module in modules:
+        runs = [measure_import(module) for _ in range(repeat)]
+        failed = [run for run in runs if 'error' in run]
+        if failed:
+            print(f"{module:<48} {'failed':>10} import: {failed[0]['error']}")
+            failures.append(f"{module}: import failed: {failed[0]['error']}")
+            continue
+        best = min(runs, key=lambda run: run['milliseconds'])
+        heavy = sorted({name for name in best['modules'] if name.split(".")[0] in INTERACTIVE_MODULES})
+
+        print(f"{module:<48} {best['milliseconds']:10.2f} ms import (budget {budget_ms:.0f} ms)")
+        if best['milliseconds'] > budget_ms:
+            failures.append(f"{module}: {best['milliseconds']:.1f} ms > {budget_ms:.0f} ms")
+        if heavy:
+            failures.append(f"{module}: imports {', '.join(heavy)}")
+
+    return failures
+
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark the .NET project generator")
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES,
+                        help="schema sizes (entity counts) to benchmark")
+    parser.add_argument("--repeat", type=int, default=3, help="runs per case, the best one is kept")
+    parser.add_argument("--disk", action="store_true", help="write projects to disk instead of rendering in memory")
+    parser.add_argument("--all-flags-on", action="store_true",
+                        help="only benchmark with every feature flag enabled instead of every combination")
+    parser.add_argument("--output", help="write results as JSON to this file")
+    parser.add_argument("--baseline", help="compare against a baseline JSON file and fail on regressions")
+    parser.add_argument("--tolerance", type=float, default=0.25,
+                        help="allowed slowdown relative to the baseline (default: 0.25 = 25%%)")
+    parser.add_argument("--import-budget", action="store_true",
+                        help="only check the startup time of the headless entry points (-X importtime)")
+    parser.add_argument("--import-budget-ms", type=float, default=DEFAULT_IMPORT_BUDGET_MS,
+                        help=f"import time budget per entry point (default: {DEFAULT_IMPORT_BUDGET_MS:.0f} ms)")
+    parser.add_argument("--config-memory", action="store_true",
+                        help="only measure the memory of property list layouts (dataclass, slots, columns)")
+    parser.add_argument("--property-counts", type=int, nargs="+", default=DEFAULT_PROPERTY_COUNTS,
+                        help="property counts of the config memory benchmark (default: 10000 100000)")
+    args = parser.parse_args(argv)
+
+    if args.config_memory:
+        results = measure_config_memory(args.property_counts)
+        if args.output:
+            with open(args.output, 'w', encoding='utf-8') as f:
+                json.dump(results, f, indent=2, sort_keys=True)
+            print(f"\nResults written to {args.output}")
+        return 0
+
+    if args.import_budget:
+        failures = check_import_budget(HEADLESS_MODULES, args.import_budget_ms, args.repeat)
+        if failures:
+            print(f"\n❌ {len(failures)} startup budget violation(s):")
+            for failure in failures:
+                print(f"   • {failure}")
+            return 1
+
+        print("\n✅ Headless entry points within the startup budget")
+        return 0
+
+    results = run_benchmarks(args.sizes, args.repeat, args.disk, all_flags=not args.all_flags_on)
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2, sort_keys=True)
+        print(f"\nResults written to {args.output}")
+
+    if args.baseline:
+        with open(args.baseline, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)
+
+        regressions = compare_with_baseline(results, baseline, args.tolerance)
+        if regressions:
+            print(f"\n❌ {len(regressions)} performance regression(s) against {args.baseline}:")
+            for regression in regressions:
+                print(f"   • {regression}")
+            return 1
+
+        print(f"\n✅ No regression against {args.baseline}")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+"""
+Shared blob store for generated .NET projects
+Byte-identical files are stored once and reflinked, hardlinked or copied into each project
+"""
+
+import errno
+import os
+import shutil
+import threading
+import uuid
+from pathlib import Path
+
+
+# Placement methods tried, in order, for each link mode
+LINK_METHODS = {
+    "auto": ("reflink", "hardlink", "copy"),
+    "reflink": ("reflink", "copy"),
+    "hardlink": ("hardlink", "copy"),
+    "copy": ("copy",),
+}
+
+# ioctl request cloning a whole file on Linux (Btrfs, XFS, bcachefs...)
+FICLONE = 0x40049409
+
+
+def reflink(source_path: Path, target_path: Path):
+    """Create target_path as a copy-on-write clone of source_path (Linux FICLONE).
+
+    Raises OSError where the platform or filesystem cannot clone files.
+    """
+    try:
+        import fcntl
+    except ImportError:
+        raise OSError(errno.EOPNOTSUPP, "reflinks are not supported on this platform")
+
+    with open(source_path, 'rb') as source, open(target_path, 'xb') as target:
+        try:
+            fcntl.ioctl(target.fileno(), FICLONE, source.fileno())
+        except OSError:
+            target.close()
+            os.unlink(target_path)
+            raise
+
+
+class BlobStore:
+    """Content-addressed store of generated files shared by many projects.
+
+    Each distinct file content is written once to store_dir/<sha[:2]>/<sha>
+    and placed into every project that generates it: as a copy-on-write
+    reflink where the filesystem supports it, else as a hardlink, else as a
+    copy (link_mode restricts the choice). A method that fails once, e.g.
+    because the store sits on another filesystem, is not tried again.
+
+    Reflinked and copied files are independent of the store. Hardlinked
+    files share storage with it and with every other project: they must
+    not be edited in place (the generator itself always replaces them).
+    They also share one modification time, which is set to the time of
+    placement so that build tools see every placed file as just written;
+    the other projects linking the same blob then look newer too, which
+    may cause an unneeded rebuild but never a missed one. Blobs are
+    written aside and renamed, so several processes can share one store.
+    """
+
+    def __init__(self, store_dir: str, link_mode: str = "auto"):
+        if link_mode not in LINK_METHODS:
+            raise ValueError(f"Unsupported link mode: {link_mode}")
+
+        self.store_dir = Path(store_dir)
+        self.link_mode = link_mode
+        self.methods = list(LINK_METHODS[link_mode])
+        self.stats = {'stored': 0, 'reflink': 0, 'hardlink': 0, 'copy': 0}
+        self._lock = threading.Lock()
+
+    def __getstate__(self):
+        # Sent to generate_many workers: the lock stays behind
+        state = self.__dict__.copy()
+        del state['_lock']
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    def blob_path(self, digest: str) -> Path:
+        """Location of the blob of a content hash"""
+        return self.store_dir / digest[:2] / digest
+
+    def _store(self, content: str, digest: str, fsync: bool = False, replace: bool = False) -> Path:
+        """Write the blob of content unless it is already stored (or replace is set)"""
+        blob_path = self.blob_path(digest)
+        if not replace and blob_path.exists():
+            return blob_path
+
+        blob_path.parent.mkdir(parents=True, exist_ok=True)
+        temporary_path = blob_path.with_name(f".{digest[:16]}.{uuid.uuid4().hex[:12]}.tmp")
+        # Written like DiskOutput writes project files, so linked files are byte-identical
+        with open(temporary_path, 'w', encoding='utf-8') as f:
+            f.write(content)
+            if fsync:
+                f.flush()
+                os.fsync(f.fileno())
+        os.replace(temporary_path, blob_path)
+        self._count('stored')
+        return blob_path
+
+    def _count(self, name: str):
+        with self._lock:
+            self.stats[name] += 1
+
+    def place(self, content: str, digest: str, target_path: Path, fsync: bool = False) -> str:
+        """Store content (sha256 digest) if needed and place it at target_path.
+
+        An existing target is replaced, never written through. Returns the
+        method used: "reflink", "hardlink" or "copy".
+        """
+        try:
+            target_path.unlink()
+        except FileNotFoundError:
+            pass
+
+        if self.methods == ["copy"]:
+            # Nothing to share without links: a plain write saves storing the blob
+            with open(target_path, 'w', encoding='utf-8') as f:
+                f.write(content)
+                if fsync:
+                    f.flush()
+                    os.fsync(f.fileno())
+            self._count('copy')
+            return "copy"
+
+        blob_path = self._store(content, digest, fsync)
+
+        for method in list(self.methods):
+            try:
+                if method == "reflink":
+                    reflink(blob_path, target_path)
+                elif method == "hardlink":
+                    try:
+                        os.link(blob_path, target_path)
+                    except OSError as e:
+                        if e.errno != errno.EMLINK:
+                            raise
+                        # The blob reached the filesystem's link limit: start a fresh one
+                        blob_path = self._store(content, digest, fsync, replace=True)
+                        os.link(blob_path, target_path)
+                    # The link carries the blob's mtime, possibly older than the last build
+                    os.utime(target_path)
+                else:
+                    shutil.copyfile(blob_path, target_path)
+            except OSError:
+                if method == "copy":
+                    raise
+                # Unsupported here (platform, filesystem, another device...): stop trying it
+                with self._lock:
+                    if method in self.methods:
+                        self.methods.remove(method)
+                continue
+
+            self._count(method)
+            return method
+
+    def prune(self) -> int:
+        """Remove the blobs no project links to any more; returns how many were removed.
+
+        Only hardlinks are counted: a blob whose projects hold reflinks is
+        removed too (they do not depend on it) and is stored again when a
+        later project generates the same content.
+        """
+        removed = 0
+        for blob_path in self.store_dir.glob("??/*"):
+            try:
+                if blob_path.stat().st_nlink == 1:
+                    blob_path.unlink()
+                    removed += 1
+            except FileNotFoundError:
+                continue
+        return removed
@@ -4,17 +4,12 @@ Enhanced .NET Project Generator CLI
 Un générateur CLI interactif pour créer des projets .NET complets compatibles avec Visual Studio 2015+
 """
 
+import argparse
+import importlib
 import os
 import sys
 from pathlib import Path
 from typing import List, Tuple
-import inquirer
-from rich.console import Console
-from rich.table import Table
-from rich.panel import Panel
-from rich.progress import Progress, SpinnerColumn, TextColumn
-from rich.prompt import Prompt, IntPrompt, Confirm
-from rich.syntax import Syntax
 
 # Import du générateur
 from enhanced_dotnet_generator import (
@@ -26,12 +21,44 @@ from enhanced_dotnet_generator import (
     DatabaseProvider
 )
 
-console = Console()
+# inquirer et rich ne sont importés que pour le mode interactif (voir load_interactive_dependencies)
+inquirer = None
+Console = Table = Panel = Progress = SpinnerColumn = TextColumn = None
+Prompt = IntPrompt = Confirm = Syntax = None
+console = None
+
+# Sous-commandes non interactives : nom -> (module, aide). Le module n'est importé que si la commande est utilisée
+COMMANDS = {
+    "generate": ("project_spec", "génère des projets depuis des specs JSON/YAML, sans question (résumé JSON)"),
+    "watch": ("spec_watcher", "régénère un projet dès que sa spec change (seules les entités modifiées)"),
+    "serve": ("generation_server", "démon local gardant le générateur chargé (HTTP ou socket Unix)")
+}
+
+
+def load_interactive_dependencies():
+    """Importe inquirer et rich (lève ImportError s'ils ne sont pas installés)"""
+    global inquirer, Console, Table, Panel, Progress, SpinnerColumn, TextColumn
+    global Prompt, IntPrompt, Confirm, Syntax, console
+    
+    if console is not None:
+        return
+    
+    import inquirer
+    from rich.console import Console
+    from rich.table import Table
+    from rich.panel import Panel
+    from rich.progress import Progress, SpinnerColumn, TextColumn
+    from rich.prompt import Prompt, IntPrompt, Confirm
+    from rich.syntax import Syntax
+    
+    console = Console()
+
 
 class DotNetGeneratorCLI:
     """CLI interactif pour le générateur .NET amélioré"""
     
     def __init__(self):
+        load_interactive_dependencies()
         self.generator = EnhancedDotNetGenerator()
         self.config = None
         
@@ -520,15 +547,6 @@ class DotNetGeneratorCLI:
     def run(self):
         """Point d'entrée principal du CLI"""
         try:
-            # Vérifier les dépendances
-            try:
-                import inquirer
-                from rich.console import Console
-            except ImportError as e:
-                console.print(f"[red]Erreur :[/red] Dépendance manquante : {e}")
-                console.print("[yellow]Installation requise :[/yellow] pip install inquirer rich")
-                return 1
-            
             self.main_menu()
             return 0
             
@@ -540,32 +558,40 @@ class DotNetGeneratorCLI:
             return 1
 
 
-if __name__ == "__main__":
-    # Installation automatique des dépendances si nécessaire
+def build_parser(command: str = None) -> argparse.ArgumentParser:
+    """Sous-commandes non interactives du CLI (seules les options de command sont chargées)"""
+    parser = argparse.ArgumentParser(
+        description="Générateur de projets .NET complets compatibles Visual Studio 2015+ "
+                    "(sans sous-commande : mode interactif)"
+    )
+    subparsers = parser.add_subparsers(dest="command")
+    
+    for name, (module_name, help_text) in COMMANDS.items():
+        command_parser = subparsers.add_parser(name, help=help_text)
+        if name == command:
+            importlib.import_module(module_name).add_arguments(command_parser)
+    
+    return parser
+
+
+def main(argv: List[str] = None) -> int:
+    """Exécute la sous-commande demandée, ou le CLI interactif à défaut"""
+    argv = sys.argv[1:] if argv is None else list(argv)
+    command = argv[0] if argv and argv[0] in COMMANDS else None
+    args = build_parser(command).parse_args(argv)
+    
+    if args.command:
+        return importlib.import_module(COMMANDS[args.command][0]).run(args)
+    
     try:
-        import inquirer
-        from rich.console import Console
-        from rich.table import Table
-        from rich.panel import Panel
-        from rich.progress import Progress, SpinnerColumn, TextColumn
-        from rich.prompt import Prompt, IntPrompt, Confirm
-        
+        cli = DotNetGeneratorCLI()
     except ImportError as e:
-        print(f"🚨 Dépendance manquante : {e}")
-        print("📦 Installation des dépendances requises...")
-        
-        import subprocess
-        import sys
-        
-        try:
-            subprocess.check_call([sys.executable, "-m", "pip", "install", "inquirer", "rich"])
-            print("✅ Dépendances installées avec succès !")
-            print("🔄 Veuillez relancer le script...")
-        except subprocess.CalledProcessError:
-            print("❌ Erreur lors de l'installation des dépendances")
-            print("🔧 Veuillez installer manuellement : pip install inquirer rich")
-        
-        sys.exit(1)
+        print(f"🚨 Dépendance manquante pour le mode interactif : {e}")
+        print("🔧 Veuillez installer : pip install inquirer rich")
+        return 1
     
-    cli = DotNetGeneratorCLI()
-    sys.exit(cli.run())
\ No newline at end of file
+    return cli.run()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -4,13 +4,36 @@ Enhanced .NET Project Generator with Complete Implementation
 Compatible with Visual Studio 2015 and modern versions
 """
 
+__version__ = "1.1.0"
+
+# asyncio, concurrent.futures, tarfile and zipfile are imported where they are
+# used: they account for most of the import time and many runs never need them
+import copy
+import hashlib
+import importlib
+import io
+import json
 import os
+import shutil
+import threading
+import time
 import uuid
+import zlib
+from array import array
+from collections.abc import Sequence
+from contextlib import contextmanager
+from functools import partial
+from itertools import repeat
 from pathlib import Path
-from typing import List, Dict, Any
-from dataclasses import dataclass
+from typing import TYPE_CHECKING, List, Dict, Any, BinaryIO, Callable, Iterable, Iterator, NamedTuple, Optional, Tuple, Union
+from dataclasses import MISSING, dataclass, field, fields, make_dataclass, replace
 from enum import Enum
 
+from generation_cache import GenerationCache, config_fingerprint
+
+if TYPE_CHECKING:
+    from blob_store import BlobStore
+
 
 class ProjectType(str, Enum):
     """Supported project types"""
@@ -27,6 +50,68 @@ class DatabaseProvider(str, Enum):
     POSTGRESQL = "postgresql"
 
 
+def _config_arguments(config_class, data: Dict[str, Any]) -> Dict[str, Any]:
+    """Check a plain dict against the fields of a config dataclass before building it"""
+    if not isinstance(data, dict):
+        raise ValueError(f"{config_class.__name__} must be an object, not {type(data).__name__}")
+    
+    known = {config_field.name: config_field for config_field in fields(config_class)}
+    unknown = sorted(set(data) - set(known))
+    if unknown:
+        raise ValueError(f"Unknown {config_class.__name__} field(s): {', '.join(unknown)}")
+    
+    missing = [
+        name for name, config_field in known.items()
+        if name not in data and config_field.default is MISSING and config_field.default_factory is MISSING
+    ]
+    if missing:
+        raise ValueError(f"Missing {config_class.__name__} field(s): {', '.join(missing)}")
+    
+    return dict(data)
+
+
+def _slots_state(self) -> tuple:
+    return tuple(getattr(self, name) for name in self.__slots__)
+
+
+def _set_slots_state(self, state: tuple):
+    for name, value in zip(self.__slots__, state):
+        object.__setattr__(self, name, value)
+
+
+def _slotted(config_class):
+    """Rebuild a dataclass with __slots__, without a per-instance __dict__.
+    
+    Same as dataclass(slots=True), which needs Python 3.10.
+    """
+    names = tuple(config_field.name for config_field in fields(config_class))
+    namespace = {
+        key: value for key, value in config_class.__dict__.items()
+        if key not in names and key not in ('__dict__', '__weakref__')
+    }
+    namespace['__slots__'] = names
+    # Explicit state so that frozen variants can be unpickled and copied too
+    namespace['__getstate__'] = _slots_state
+    namespace['__setstate__'] = _set_slots_state
+    return type(config_class)(config_class.__name__, config_class.__bases__, namespace)
+
+
+def _frozen_variant(config_class, doc: str, **defaults):
+    """Immutable, hashable and slotted dataclass with the fields of config_class"""
+    specs = []
+    for config_field in fields(config_class):
+        default = defaults.get(config_field.name, config_field.default)
+        if default is MISSING:
+            specs.append((config_field.name, config_field.type))
+        else:
+            specs.append((config_field.name, config_field.type, field(default=default)))
+    
+    variant = make_dataclass(f"Frozen{config_class.__name__}", specs, frozen=True,
+                             namespace={'__doc__': doc, '__module__': __name__})
+    return _slotted(variant)
+
+
+@_slotted
 @dataclass
 class PropertyConfig:
     """Property configuration for entities"""
@@ -36,16 +121,166 @@ class PropertyConfig:
     is_key: bool = False
     max_length: int = None
     foreign_table: str = None
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'PropertyConfig':
+        """Build a property from a plain dict, e.g. parsed JSON"""
+        return cls(**_config_arguments(cls, data))
+    
+    def freeze(self) -> 'FrozenPropertyConfig':
+        """Immutable, hashable copy of the property"""
+        return FrozenPropertyConfig(self.name, self.type, self.is_required, self.is_key,
+                                    self.max_length, self.foreign_table)
+
+
+FrozenPropertyConfig = _frozen_variant(PropertyConfig, "Immutable, hashable PropertyConfig")
+
+_PROPERTY_FIELDS = frozenset(config_field.name for config_field in fields(PropertyConfig))
+
+
+class PropertyColumns(Sequence):
+    """Read-only, array-backed list of properties for very large schemas.
+    
+    Each attribute is stored as a column: names, type codes, flag bytes and
+    max lengths in arrays, and the rare foreign tables in a dict. This takes
+    several times less memory than one object per property. Items are
+    FrozenPropertyConfig objects built on access, and EntityConfig.properties
+    accepts a PropertyColumns wherever it accepts a list.
+    """
+    
+    __slots__ = ('names', 'type_codes', 'type_names', 'flags', 'max_lengths', 'foreign_tables')
+    
+    REQUIRED = 1
+    KEY = 2
+    NO_MAX_LENGTH = -1
+    
+    def __init__(self):
+        self.names = []
+        self.type_codes = array('H')
+        self.type_names = []  # Type code -> type name, each type stored once
+        self.flags = array('B')
+        self.max_lengths = array('i')
+        self.foreign_tables = {}  # Index -> foreign table, for the few properties having one
+    
+    @classmethod
+    def from_dicts(cls, rows: Iterable[Dict[str, Any]]) -> 'PropertyColumns':
+        """Bulk constructor from plain dicts (e.g. a parsed spec), checked like PropertyConfig.from_dict"""
+        columns = cls()
+        type_codes = {}
+        
+        for row in rows:
+            if not isinstance(row, dict) or not row.keys() <= _PROPERTY_FIELDS or 'name' not in row or 'type' not in row:
+                _config_arguments(PropertyConfig, row)  # Raises the detailed error
+            
+            prop_type = row['type']
+            code = type_codes.get(prop_type)
+            if code is None:
+                code = type_codes[prop_type] = len(columns.type_names)
+                columns.type_names.append(prop_type)
+            
+            max_length = row.get('max_length')
+            foreign_table = row.get('foreign_table')
+            if foreign_table is not None:
+                columns.foreign_tables[len(columns.names)] = foreign_table
+            
+            columns.names.append(row['name'])
+            columns.type_codes.append(code)
+            columns.flags.append((cls.REQUIRED if row.get('is_required') else 0) |
+                                 (cls.KEY if row.get('is_key') else 0))
+            columns.max_lengths.append(cls.NO_MAX_LENGTH if max_length is None else max_length)
+        
+        return columns
+    
+    def __len__(self) -> int:
+        return len(self.names)
+    
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[position] for position in range(*index.indices(len(self)))]
+        
+        name = self.names[index]
+        if index < 0:
+            index += len(self.names)
+        flags = self.flags[index]
+        max_length = self.max_lengths[index]
+        return FrozenPropertyConfig(
+            name,
+            self.type_names[self.type_codes[index]],
+            bool(flags & self.REQUIRED),
+            bool(flags & self.KEY),
+            None if max_length == self.NO_MAX_LENGTH else max_length,
+            self.foreign_tables.get(index)
+        )
+    
+    def __iter__(self) -> Iterator['FrozenPropertyConfig']:
+        type_names = self.type_names
+        foreign_table = self.foreign_tables.get
+        columns = zip(self.names, self.type_codes, self.flags, self.max_lengths)
+        for index, (name, code, flags, max_length) in enumerate(columns):
+            yield FrozenPropertyConfig(
+                name,
+                type_names[code],
+                bool(flags & self.REQUIRED),
+                bool(flags & self.KEY),
+                None if max_length == self.NO_MAX_LENGTH else max_length,
+                foreign_table(index)
+            )
+    
+    def __eq__(self, other):
+        if not isinstance(other, PropertyColumns):
+            return NotImplemented
+        return tuple(self) == tuple(other)
+    
+    def __hash__(self):
+        return hash(tuple(self))
+    
+    def __repr__(self):
+        return f"PropertyColumns({list(self)!r})"
+    
+    def to_dicts(self) -> List[Dict[str, Any]]:
+        """The properties as plain dicts, as asdict() would render a list of properties"""
+        return [
+            {config_field: getattr(prop, config_field) for config_field in FrozenPropertyConfig.__slots__}
+            for prop in self
+        ]
 
 
+@_slotted
 @dataclass
 class EntityConfig:
     """Entity configuration"""
     name: str
     properties: List[PropertyConfig]
     table_name: str = None
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any], columnar: bool = False) -> 'EntityConfig':
+        """Build an entity and its properties from a plain dict, e.g. parsed JSON.
+        
+        With columnar=True the properties are loaded into a PropertyColumns.
+        """
+        arguments = _config_arguments(cls, data)
+        if not isinstance(arguments['properties'], list):
+            raise ValueError(f"Entity {arguments['name']}: properties must be a list")
+        if columnar:
+            arguments['properties'] = PropertyColumns.from_dicts(arguments['properties'])
+        else:
+            arguments['properties'] = [PropertyConfig.from_dict(prop) for prop in arguments['properties']]
+        return cls(**arguments)
+    
+    def freeze(self) -> 'FrozenEntityConfig':
+        """Immutable, hashable copy of the entity (a PropertyColumns is kept as is)"""
+        if isinstance(self.properties, PropertyColumns):
+            properties = self.properties
+        else:
+            properties = tuple(prop.freeze() for prop in self.properties)
+        return FrozenEntityConfig(self.name, properties, self.table_name)
+
 
+FrozenEntityConfig = _frozen_variant(EntityConfig, "Immutable, hashable EntityConfig (properties as a tuple)")
 
+
+@_slotted
 @dataclass
 class ProjectConfig:
     """Project configuration"""
@@ -60,65 +295,1801 @@ class ProjectConfig:
     connection_string: str = ""
     entities: List[EntityConfig] = None
     
-    # Feature flags
-    include_swagger: bool = True
-    include_cors: bool = True
-    include_authentication: bool = False
-    include_tests: bool = True
+    # Feature flags
+    include_swagger: bool = True
+    include_cors: bool = True
+    include_authentication: bool = False
+    include_tests: bool = True
+    
+    # Derive GUIDs from names so identical configs produce byte-identical output
+    deterministic_guids: bool = False
+    
+    def __post_init__(self):
+        if self.entities is None:
+            self.entities = []
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any], columnar: bool = False) -> 'ProjectConfig':
+        """Build a project configuration from a plain dict, e.g. parsed JSON or YAML.
+        
+        Enum fields take their string values ("webapi", "sqlserver"...);
+        unknown or missing fields raise ValueError. columnar=True loads
+        property lists into PropertyColumns, for very large schemas.
+        """
+        arguments = _config_arguments(cls, data)
+        if 'project_type' in arguments:
+            arguments['project_type'] = ProjectType(arguments['project_type'])
+        if 'database_provider' in arguments:
+            arguments['database_provider'] = DatabaseProvider(arguments['database_provider'])
+        if arguments.get('entities') is not None:
+            if not isinstance(arguments['entities'], list):
+                raise ValueError("entities must be a list")
+            arguments['entities'] = [EntityConfig.from_dict(entity, columnar) for entity in arguments['entities']]
+        return cls(**arguments)
+    
+    def freeze(self) -> 'FrozenProjectConfig':
+        """Immutable, hashable copy of the configuration and its entities"""
+        values = {name: getattr(self, name) for name in self.__slots__}
+        values['entities'] = tuple(entity.freeze() for entity in self.entities)
+        return FrozenProjectConfig(**values)
+
+
+FrozenProjectConfig = _frozen_variant(ProjectConfig, "Immutable, hashable ProjectConfig (entities as a tuple)",
+                                      entities=())
+
+
+# C# keywords, which cannot name a class or property
+CSHARP_KEYWORDS = frozenset("""
+    abstract as base bool break byte case catch char checked class const continue decimal default
+    delegate do double else enum event explicit extern false finally fixed float for foreach goto if
+    implicit in int interface internal is lock long namespace new null object operator out override
+    params private protected public readonly ref return sbyte sealed short sizeof stackalloc static
+    string struct switch this throw true try typeof uint ulong unchecked unsafe ushort using virtual
+    void volatile while
+""".split())
+
+
+class ConfigValidationError(ValueError):
+    """A project configuration that cannot be generated, with every problem found"""
+    
+    def __init__(self, errors: List[str]):
+        super().__init__(f"{len(errors)} configuration error(s): " + "; ".join(errors))
+        self.errors = errors
+
+
+def _identifier_error(name: Any) -> Optional[str]:
+    """Why name cannot be used as a C# identifier, or None"""
+    if not isinstance(name, str) or not name.isidentifier():
+        return f"{name!r} is not a valid C# identifier"
+    if name in CSHARP_KEYWORDS:
+        return f"{name!r} is a C# reserved word"
+    return None
+
+
+def _type_error(value: Any, expected: tuple, description: str, optional: bool = False) -> Optional[str]:
+    """Why value is not of the expected types (bool is never accepted as an int), or None"""
+    if optional and value is None:
+        return None
+    if isinstance(value, bool) and bool not in expected:
+        return f"must be {description}, not bool"
+    if not isinstance(value, expected):
+        return f"must be {description}, not {type(value).__name__}"
+    return None
+
+
+def validate_config(config: ProjectConfig) -> List[str]:
+    """Check a project configuration before anything is generated, returning every error found.
+    
+    Fields of the wrong type (e.g. from hand-written JSON) are reported as
+    errors like any other problem, never raised. Names are looked up in
+    hashed indexes, so the pass is linear in the number of entities and
+    properties.
+    """
+    errors = []
+    
+    if not isinstance(config.project_name, str):
+        errors.append(f"project_name: {_type_error(config.project_name, (str,), 'a string')}")
+    else:
+        for part in config.project_name.split("."):
+            error = _identifier_error(part)
+            if error:
+                errors.append(f"project_name: {config.project_name!r}: {error}")
+                break
+    
+    if not isinstance(config.entities, (list, tuple)):
+        errors.append(f"entities: {_type_error(config.entities, (list, tuple), 'a list')}")
+        return errors
+    
+    # Entity names and table names are both accepted as foreign_table targets
+    entity_names = {}
+    table_names = {}
+    valid_entities = []
+    for index, entity in enumerate(config.entities):
+        if not all(hasattr(entity, name) for name in ('name', 'properties', 'table_name')):
+            errors.append(f"entities[{index}]: must be an EntityConfig, not {type(entity).__name__}")
+            continue
+        
+        where = f"entities[{index}] ({entity.name})"
+        error = _identifier_error(entity.name)
+        if error:
+            errors.append(f"{where}: {error}")
+        
+        error = _type_error(entity.properties, (Sequence,), "a list")
+        if error or isinstance(entity.properties, str):
+            errors.append(f"{where}: properties {error or 'must be a list, not str'}")
+        else:
+            valid_entities.append((index, entity))
+        
+        error = _type_error(entity.table_name, (str,), "a string", optional=True)
+        if error:
+            errors.append(f"{where}: table_name {error}")
+        if not isinstance(entity.name, str) or error:
+            continue
+        
+        # Generated file names must not collide on case-insensitive file systems either
+        folded = entity.name.lower()
+        if folded in entity_names:
+            errors.append(f"{where}: duplicate entity name (already used by entities[{entity_names[folded]}])")
+            continue
+        entity_names[folded] = index
+        
+        table_name = entity.table_name or f"{entity.name}s"
+        if table_name.lower() in table_names:
+            errors.append(f"{where}: duplicate table name {table_name!r} "
+                          f"(already used by entities[{table_names[table_name.lower()]}])")
+        else:
+            table_names[table_name.lower()] = index
+    
+    for index, entity in valid_entities:
+        where = f"entities[{index}] ({entity.name})"
+        property_names = set()
+        has_key = False
+        
+        for prop_index, prop in enumerate(entity.properties):
+            if not all(hasattr(prop, name) for name in ('name', 'type', 'is_key', 'max_length', 'foreign_table')):
+                errors.append(f"{where}.properties[{prop_index}]: must be a PropertyConfig, "
+                              f"not {type(prop).__name__}")
+                continue
+            
+            prop_where = f"{where}.{prop.name}"
+            error = _identifier_error(prop.name)
+            if error:
+                errors.append(f"{prop_where}: {error}")
+            elif prop.name == entity.name:
+                errors.append(f"{prop_where}: a property cannot have the name of its entity")
+            
+            if isinstance(prop.name, str):
+                if prop.name in property_names:
+                    errors.append(f"{prop_where}: duplicate property name")
+                property_names.add(prop.name)
+            
+            error = _type_error(prop.type, (str,), "a string")
+            if error:
+                errors.append(f"{prop_where}: type {error}")
+            
+            has_key = has_key or bool(prop.is_key)
+            
+            error = _type_error(prop.max_length, (int,), "an integer", optional=True)
+            if error:
+                errors.append(f"{prop_where}: max_length {error}")
+            elif prop.max_length is not None and prop.max_length < 1:
+                errors.append(f"{prop_where}: max_length must be at least 1")
+            
+            error = _type_error(prop.foreign_table, (str,), "a string", optional=True)
+            if error:
+                errors.append(f"{prop_where}: foreign_table {error}")
+            elif prop.foreign_table and prop.foreign_table.lower() not in entity_names \
+                    and prop.foreign_table.lower() not in table_names:
+                errors.append(f"{prop_where}: foreign_table {prop.foreign_table!r} is not an entity of the project")
+        
+        if not has_key:
+            errors.append(f"{where}: no key property (set is_key on one property)")
+    
+    return errors
+
+
+def check_config(config: ProjectConfig):
+    """Raise ConfigValidationError listing every problem of a project configuration"""
+    errors = validate_config(config)
+    if errors:
+        raise ConfigValidationError(errors)
+
+
+_generator_version = None
+
+
+def generator_version() -> str:
+    """Version identifying the generator output: release number plus a digest of this module"""
+    global _generator_version
+    if _generator_version is None:
+        with open(__file__, 'rb') as f:
+            digest = hashlib.sha256(f.read()).hexdigest()
+        _generator_version = f"{__version__}+{digest[:12]}"
+    return _generator_version
+
+
+class TextBuilder:
+    """Accumulates rendered text as a list of chunks.
+    
+    Renderers append one chunk per entity or property and the chunks are
+    joined once at the end, instead of re-copying a growing string with +=.
+    """
+    
+    __slots__ = ('chunks',)
+    
+    def __init__(self, text: str = ''):
+        self.chunks = [text] if text else []
+    
+    def write(self, text: str):
+        """Append a chunk of text"""
+        self.chunks.append(text)
+    
+    def getvalue(self) -> str:
+        """Return the whole text"""
+        return ''.join(self.chunks)
+    
+    def __iter__(self):
+        return iter(self.chunks)
+
+
+class TextChunks:
+    """Streams the text chunks of one file, measuring (and hashing) them on the way.
+    
+    Output targets iterate over it once to write the chunks as they are
+    produced; size and hexdigest() describe the file afterwards.
+    """
+    
+    __slots__ = ('chunks', 'size', '_digest')
+    
+    def __init__(self, chunks: Iterable[str], hash_content: bool = True):
+        self.chunks = chunks
+        self.size = 0
+        self._digest = hashlib.sha256() if hash_content else None
+    
+    def __iter__(self) -> Iterator[str]:
+        digest = self._digest
+        for chunk in self.chunks:
+            data = chunk.encode('utf-8')
+            self.size += len(data)
+            if digest is not None:
+                digest.update(data)
+            yield chunk
+    
+    def hexdigest(self) -> Optional[str]:
+        """SHA-256 of the streamed content, None when not hashed"""
+        return self._digest.hexdigest() if self._digest is not None else None
+
+
+# C# value types rendered as nullable (T?) when the property is optional
+NULLABLE_VALUE_TYPES = frozenset(["int", "DateTime", "bool", "decimal"])
+
+
+class _FrozenView:
+    """Base for read-only, slotted views precomputed from the configuration"""
+    
+    __slots__ = ()
+    
+    def __setattr__(self, name, value):
+        raise AttributeError(f"{type(self).__name__} is read-only")
+    
+    def __delattr__(self, name):
+        raise AttributeError(f"{type(self).__name__} is read-only")
+    
+    def __getstate__(self):
+        return tuple(getattr(self, name) for name in self.__slots__)
+    
+    def __setstate__(self, state):
+        for name, value in zip(self.__slots__, state):
+            object.__setattr__(self, name, value)
+    
+    def __repr__(self):
+        fields = ", ".join(f"{name}={getattr(self, name)!r}" for name in self.__slots__)
+        return f"{type(self).__name__}({fields})"
+
+
+class PropertyView(_FrozenView):
+    """Property as seen by the templates, with its C# type already resolved"""
+    
+    __slots__ = ('name', 'type', 'cs_type', 'is_required', 'is_key', 'max_length', 'foreign_table')
+    
+    def __init__(self, prop: PropertyConfig):
+        nullable = not prop.is_required and prop.type in NULLABLE_VALUE_TYPES
+        
+        set_field = object.__setattr__
+        set_field(self, 'name', prop.name)
+        set_field(self, 'type', prop.type)
+        set_field(self, 'cs_type', f"{prop.type}?" if nullable else prop.type)
+        set_field(self, 'is_required', prop.is_required)
+        set_field(self, 'is_key', prop.is_key)
+        set_field(self, 'max_length', prop.max_length)
+        set_field(self, 'foreign_table', prop.foreign_table)
+
+
+class EntityView(_FrozenView):
+    """Entity as seen by the templates: names, key and foreign keys derived once"""
+    
+    __slots__ = ('name', 'lower_name', 'plural_name', 'lower_plural_name',
+                 'table_name', 'key_name', 'properties', 'foreign_keys')
+    
+    def __init__(self, entity: EntityConfig):
+        properties = tuple(PropertyView(prop) for prop in entity.properties)
+        
+        set_field = object.__setattr__
+        set_field(self, 'name', entity.name)
+        set_field(self, 'lower_name', entity.name.lower())
+        set_field(self, 'plural_name', f"{entity.name}s")
+        set_field(self, 'lower_plural_name', f"{entity.name.lower()}s")
+        set_field(self, 'table_name', entity.table_name or f"{entity.name}s")
+        set_field(self, 'key_name', next((prop.name for prop in properties if prop.is_key), "Id"))
+        set_field(self, 'properties', properties)
+        set_field(self, 'foreign_keys', tuple(
+            (prop.name, prop.foreign_table) for prop in properties if prop.foreign_table
+        ))
+
+
+# Namespace for name-derived GUIDs (ProjectConfig.deterministic_guids)
+GUID_NAMESPACE = uuid.UUID("6f1c2a4e-8d3b-5e7f-9a0c-2b4d6e8f0a1c")
+
+
+# Manifest of generated files (relative path -> hash) kept in incremental mode
+MANIFEST_FILENAME = ".generator-manifest.json"
+
+
+# Names standing for the project and entity names in override template paths
+PROJECT_PLACEHOLDER = "Project"
+ENTITY_PLACEHOLDER = "Entity"
+
+# What follows the project name in the files named after the project
+_PROJECT_FILE_SUFFIXES = (".sln", ".csproj", ".Tests.csproj", "Context.cs")
+
+
+def template_name(relative_path: str, project_name: str) -> str:
+    """Override template name of a generated file: its path with the project name replaced by Project"""
+    segments = relative_path.split("/")
+    if len(segments) > 1 and segments[0] in ("src", "tests") and segments[1].startswith(project_name):
+        segments[1] = PROJECT_PLACEHOLDER + segments[1][len(project_name):]
+    if segments[-1].startswith(project_name) and segments[-1][len(project_name):] in _PROJECT_FILE_SUFFIXES:
+        segments[-1] = PROJECT_PLACEHOLDER + segments[-1][len(project_name):]
+    return "/".join(segments)
+
+
+class DiskOutput:
+    """Output target writing generated files under the project directory"""
+    
+    def __init__(self, project_path: Path, incremental: bool = False, fsync: bool = False,
+                 previous_path: Optional[Path] = None, blob_store: Optional['BlobStore'] = None):
+        self.project_path = project_path
+        
+        # Incremental mode: only rewrite files whose rendered content changed.
+        # previous_path is the tree this run replaces when writing into a staging
+        # directory; unchanged files are then linked over from it.
+        self.incremental = incremental
+        self.previous_path = previous_path or project_path
+        self.stats = {'written': 0, 'unchanged': 0, 'removed': 0}
+        self._previous_manifest = {}
+        self._manifest = {}
+        
+        # Flush every written file to stable storage before moving on
+        self.fsync = fsync
+        self._directories = set()  # Directories known to exist, to skip redundant mkdir calls
+        
+        # Shared store placing byte-identical files across projects by reflink or hardlink
+        self.blob_store = blob_store
+    
+    def open(self):
+        """Prepare the project directory before the first write"""
+        self.project_path.mkdir(parents=True, exist_ok=True)
+        self._directories = {self.project_path}
+        if self.incremental:
+            self._previous_manifest = self._load_manifest()
+    
+    def make_directories(self, relative_paths: List[str]):
+        """Create (possibly empty) project directories"""
+        for relative_path in relative_paths:
+            self._ensure_directory(self.project_path / relative_path)
+    
+    def write(self, relative_path: str, content: str):
+        """Write one generated file"""
+        file_path = self.project_path / relative_path
+        content_hash = self._content_hash(content)
+        
+        if self._is_unchanged(relative_path, file_path, content_hash):
+            return
+        
+        self._ensure_directory(file_path.parent)
+        self._write_file(file_path, content, content_hash)
+        self._record_written(relative_path, file_path, content_hash)
+    
+    def _content_hash(self, content: str) -> Optional[str]:
+        """SHA-256 of content when the incremental mode or the blob store needs it"""
+        if self.incremental or self.blob_store is not None:
+            return hashlib.sha256(content.encode('utf-8')).hexdigest()
+        return None
+    
+    def _write_file(self, file_path: Path, content: str, content_hash: Optional[str]):
+        """Write content to file_path, through the blob store if there is one"""
+        if self.blob_store is not None:
+            self.blob_store.place(content, content_hash, file_path, fsync=self.fsync)
+        else:
+            self._write_content(file_path, content)
+    
+    def write_chunks(self, relative_path: str, chunks: TextChunks):
+        """Write one generated file chunk by chunk, as the chunks are produced"""
+        file_path = self.project_path / relative_path
+        if self._stream_content(relative_path, file_path, chunks):
+            self._record_written(relative_path, file_path, chunks.hexdigest())
+    
+    def _stream_content(self, relative_path: str, file_path: Path, chunks: TextChunks) -> bool:
+        """Stream chunks to file_path; False when, in incremental mode, the file turned out unchanged"""
+        self._ensure_directory(file_path.parent)
+        if not self.incremental:
+            self._write_content(file_path, chunks)
+            return True
+        
+        # The hash is only known once every chunk is written: stream aside and
+        # keep the previous file (and its mtime) if the content is unchanged
+        temporary_path = file_path.with_name(f".{file_path.name}.{uuid.uuid4().hex[:12]}.tmp")
+        try:
+            self._write_content(temporary_path, chunks)
+            if self._is_unchanged(relative_path, file_path, chunks.hexdigest()):
+                temporary_path.unlink()
+                return False
+            os.replace(temporary_path, file_path)
+        except BaseException:
+            try:
+                temporary_path.unlink()
+            except FileNotFoundError:
+                pass
+            raise
+        return True
+    
+    def _ensure_directory(self, directory: Path):
+        """Create a directory (and its parents) unless it is already known to exist"""
+        if directory not in self._directories:
+            directory.mkdir(parents=True, exist_ok=True)
+            self._directories.add(directory)
+            self._directories.update(directory.parents)
+    
+    def _write_content(self, file_path: Path, content: Union[str, Iterable[str]]):
+        """Write content (text or chunks of text) to file_path, flushed to disk when fsync is enabled"""
+        # A file hardlinked elsewhere (blob store, generation cache) is replaced, never written through
+        try:
+            if file_path.stat().st_nlink > 1:
+                file_path.unlink()
+        except FileNotFoundError:
+            pass
+        
+        with open(file_path, 'w', encoding='utf-8') as f:
+            if isinstance(content, str):
+                f.write(content)
+            else:
+                f.writelines(content)
+            if self.fsync:
+                f.flush()
+                os.fsync(f.fileno())
+    
+    def place(self, relative_path: str, source_path: Path, content_hash: str, hardlink: bool = False):
+        """Copy (or hardlink) an already rendered file, e.g. from the generation cache"""
+        file_path = self.project_path / relative_path
+        
+        if self._is_unchanged(relative_path, file_path, content_hash):
+            return
+        
+        self._ensure_directory(file_path.parent)
+        if hardlink:
+            if file_path.exists():
+                file_path.unlink()
+            os.link(source_path, file_path)
+        else:
+            shutil.copyfile(source_path, file_path)
+        self._record_written(relative_path, file_path, content_hash)
+    
+    def _is_unchanged(self, relative_path: str, file_path: Path, content_hash: Optional[str]) -> bool:
+        """Check (in incremental mode) whether the file on disk is already up to date"""
+        if not self.incremental:
+            return False
+        
+        # Skip the write (and keep the mtime) when the content is unchanged
+        # and the file on disk still has the size we recorded for it
+        previous = self._previous_manifest.get(relative_path)
+        if previous and previous['sha256'] == content_hash:
+            previous_file = self.previous_path / relative_path
+            try:
+                if previous_file.stat().st_size == previous['size']:
+                    if previous_file != file_path:
+                        self._ensure_directory(file_path.parent)
+                        link_or_copy(previous_file, file_path)
+                    self._manifest[relative_path] = previous
+                    self.stats['unchanged'] += 1
+                    return True
+            except OSError:
+                pass
+        return False
+    
+    def _record_written(self, relative_path: str, file_path: Path, content_hash: Optional[str]):
+        """Count a written file and add it to the manifest"""
+        self.stats['written'] += 1
+        
+        if self.incremental:
+            self._manifest[relative_path] = {
+                'sha256': content_hash,
+                'size': file_path.stat().st_size
+            }
+    
+    def close(self):
+        """Finish the run: drop stale files and save the manifest"""
+        if self.incremental:
+            self._remove_stale_files()
+            # A run that changed nothing in place keeps the manifest it read
+            if self._manifest != self._previous_manifest or self.previous_path != self.project_path:
+                self._save_manifest()
+    
+    def abort(self):
+        """Give up a failed run: stale files and the previous manifest are left as they are"""
+    
+    def _load_manifest(self) -> dict:
+        """Load the manifest left by a previous incremental run"""
+        try:
+            with open(self.previous_path / MANIFEST_FILENAME, 'r', encoding='utf-8') as f:
+                return json.load(f).get('files', {})
+        except (OSError, ValueError):
+            return {}
+    
+    def _save_manifest(self):
+        """Save the manifest of the files generated by this run"""
+        manifest = {'version': 1, 'files': self._manifest}
+        with open(self.project_path / MANIFEST_FILENAME, 'w', encoding='utf-8') as f:
+            json.dump(manifest, f, indent=2, sort_keys=True)
+    
+    def _remove_stale_files(self):
+        """Remove files generated by a previous run that this run no longer produces"""
+        for relative_path in self._previous_manifest:
+            if relative_path in self._manifest:
+                continue
+            
+            # A replaced tree goes away as a whole: just count what it loses
+            if self.previous_path != self.project_path:
+                self.stats['removed'] += 1
+                continue
+            
+            stale_file = self.project_path / relative_path
+            try:
+                stale_file.unlink()
+            except FileNotFoundError:
+                continue
+            self.stats['removed'] += 1
+            
+            # Prune directories left empty by the removal
+            parent = stale_file.parent
+            while parent != self.project_path:
+                try:
+                    parent.rmdir()
+                except OSError:
+                    break
+                parent = parent.parent
+
+
+def link_or_copy(source_path: Path, target_path: Path):
+    """Hardlink source_path to target_path, copying (with its mtime) where links are unsupported"""
+    try:
+        os.link(source_path, target_path)
+    except OSError:
+        shutil.copy2(source_path, target_path)
+
+
+@contextmanager
+def project_lock(project_path: Path):
+    """Hold an exclusive lock serializing writers of one project folder.
+    
+    The lock is a sibling file (.<name>.lock) locked with fcntl on POSIX
+    and msvcrt on Windows; it is left in place, since deleting it would let
+    two writers lock different files. Blocks until the lock is available.
+    """
+    lock_path = project_path.parent / f".{project_path.name}.lock"
+    project_path.parent.mkdir(parents=True, exist_ok=True)
+    
+    with open(lock_path, 'a+b') as lock_file:
+        if os.name == 'nt':
+            import msvcrt
+            
+            # LK_LOCK gives up after about 10 seconds: keep trying
+            while True:
+                try:
+                    lock_file.seek(0)
+                    msvcrt.locking(lock_file.fileno(), msvcrt.LK_LOCK, 1)
+                    break
+                except OSError:
+                    continue
+            try:
+                yield
+            finally:
+                lock_file.seek(0)
+                msvcrt.locking(lock_file.fileno(), msvcrt.LK_UNLCK, 1)
+        else:
+            import fcntl
+            
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+
+
+def replace_directory(staging_path: Path, target_path: Path):
+    """Move a fully written staging directory into place, replacing target_path.
+    
+    Both are siblings, so every step is a rename on the same filesystem.
+    An existing target is first renamed aside, then deleted once the new
+    tree is in place: readers see either the old or the new project, never
+    a partial one (the folder is missing only between the two renames).
+    """
+    if not target_path.exists():
+        os.rename(staging_path, target_path)
+        return
+    
+    retired_path = target_path.parent / f".{target_path.name}.old-{uuid.uuid4().hex[:12]}"
+    os.rename(target_path, retired_path)
+    try:
+        os.rename(staging_path, target_path)
+    except OSError:
+        os.rename(retired_path, target_path)
+        raise
+    shutil.rmtree(retired_path, ignore_errors=True)
+
+
+def carry_over_files(previous_path: Path, staging_path: Path) -> List[Tuple[Path, Path]]:
+    """Move the files of previous_path that the generator does not own into staging_path.
+    
+    Build output (bin/, obj/), IDE state (.vs/) and user files thus survive
+    an atomic regeneration. Files listed in the manifest of the previous run
+    were generated: they stay behind, whether regenerated or stale. Without
+    a manifest, every file the new tree does not contain is carried over,
+    as a regeneration in place would leave it. Regenerated files win over
+    carried ones. Whole directories are moved with a single rename; the
+    (source, target) pairs moved are returned so that a failed swap can put
+    them back with restore_carried_files.
+    """
+    try:
+        with open(previous_path / MANIFEST_FILENAME, 'r', encoding='utf-8') as f:
+            generated = set(json.load(f).get('files', {}))
+    except (OSError, ValueError):
+        generated = set()
+    generated.add(MANIFEST_FILENAME)
+    
+    # Directories holding generated files are merged entry by entry
+    generated_directories = set()
+    for relative_path in generated:
+        while "/" in relative_path:
+            relative_path = relative_path.rsplit("/", 1)[0]
+            generated_directories.add(relative_path)
+    
+    moved = []
+    pending = [""]
+    try:
+        while pending:
+            directory = pending.pop()
+            for entry in os.scandir(previous_path / directory):
+                relative_path = f"{directory}/{entry.name}" if directory else entry.name
+                if relative_path in generated:
+                    continue
+                
+                target_path = staging_path / relative_path
+                if entry.is_dir(follow_symlinks=False) and \
+                        (target_path.is_dir() or relative_path in generated_directories):
+                    target_path.mkdir(exist_ok=True)
+                    pending.append(relative_path)
+                elif not os.path.lexists(target_path):
+                    os.rename(entry.path, target_path)
+                    moved.append((Path(entry.path), target_path))
+    except BaseException:
+        restore_carried_files(moved)
+        raise
+    return moved
+
+
+def restore_carried_files(moved: List[Tuple[Path, Path]]):
+    """Move files carried over by carry_over_files back where they came from"""
+    for source_path, target_path in reversed(moved):
+        try:
+            os.rename(target_path, source_path)
+        except OSError:
+            continue
+
+
+def _remove_orphaned_staging(project_path: Path):
+    """Remove staging and retired folders left by interrupted runs (call with the project lock held)"""
+    for pattern in (f".{project_path.name}.staging-*", f".{project_path.name}.old-*"):
+        for leftover in project_path.parent.glob(pattern):
+            shutil.rmtree(leftover, ignore_errors=True)
+
+
+class AsyncDiskOutput(DiskOutput):
+    """Disk output target writing files concurrently from an asyncio event loop.
+    
+    Rendering stays on the calling thread: write() only hands the content
+    over and returns, blocking once max_in_flight writes are pending. Files
+    are written by a thread pool driven from an event loop running in a
+    background thread, which hides per-file latency on network shares and
+    slow disks. Parent directories are created up front, on the calling
+    thread, so concurrent writes never race on mkdir. The first write error
+    is raised from a later write() or from close().
+    """
+    
+    def __init__(self, project_path: Path, incremental: bool = False, fsync: bool = False,
+                 previous_path: Optional[Path] = None, max_in_flight: int = 32,
+                 blob_store: Optional['BlobStore'] = None):
+        super().__init__(project_path, incremental=incremental, fsync=fsync, previous_path=previous_path,
+                         blob_store=blob_store)
+        self.max_in_flight = max_in_flight
+        self._loop = None
+        self._loop_thread = None
+        self._executor = None
+        self._slots = None
+        self._errors = []
+        self._aborted = False
+    
+    def open(self):
+        super().open()
+        self._slots = threading.BoundedSemaphore(self.max_in_flight)
+        self._errors = []
+        self._aborted = False
+        import asyncio
+        from concurrent.futures import ThreadPoolExecutor
+        
+        self._executor = ThreadPoolExecutor(max_workers=self.max_in_flight)
+        self._loop = asyncio.new_event_loop()
+        self._loop_thread = threading.Thread(target=self._loop.run_forever, name="AsyncDiskOutput", daemon=True)
+        self._loop_thread.start()
+    
+    def write(self, relative_path: str, content: str):
+        if self._errors:
+            raise self._errors[0]
+        
+        file_path = self.project_path / relative_path
+        content_hash = self._content_hash(content)
+        
+        if self._is_unchanged(relative_path, file_path, content_hash):
+            return
+        
+        self._ensure_directory(file_path.parent)
+        
+        # Backpressure: wait for a free slot before queuing another write
+        self._slots.acquire()
+        import asyncio
+        asyncio.run_coroutine_threadsafe(
+            self._write_async(relative_path, file_path, content, content_hash), self._loop
+        )
+    
+    def write_chunks(self, relative_path: str, chunks: TextChunks):
+        """Stream one file on the calling thread, which produces its chunks"""
+        if self._errors:
+            raise self._errors[0]
+        
+        file_path = self.project_path / relative_path
+        if self._stream_content(relative_path, file_path, chunks):
+            # Bookkeeping stays on the loop thread, like that of the asynchronous writes
+            self._loop.call_soon_threadsafe(self._record_written, relative_path, file_path, chunks.hexdigest())
+    
+    async def _write_async(self, relative_path: str, file_path: Path, content: str, content_hash: Optional[str]):
+        """Write one file on the thread pool; bookkeeping runs on the loop thread, one file at a time"""
+        try:
+            if self._aborted:
+                return
+            await self._loop.run_in_executor(self._executor, self._write_file, file_path, content, content_hash)
+            self._record_written(relative_path, file_path, content_hash)
+        except Exception as e:
+            self._errors.append(e)
+        finally:
+            self._slots.release()
+    
+    def close(self):
+        """Wait for pending writes, then finish the run like DiskOutput"""
+        self._shutdown()
+        if self._errors:
+            raise self._errors[0]
+        super().close()
+    
+    def abort(self):
+        """Give up a failed run: queued writes are dropped, those in progress are waited for"""
+        self._aborted = True
+        self._shutdown()
+        super().abort()
+    
+    def _shutdown(self):
+        """Wait for pending writes, then stop the event loop and its threads"""
+        if self._loop is None:
+            return
+        try:
+            # Every pending write holds a slot until it is done
+            for _ in range(self.max_in_flight):
+                self._slots.acquire()
+        finally:
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._loop_thread.join()
+            self._loop.close()
+            self._executor.shutdown()
+            self._loop = self._loop_thread = self._executor = None
+
+
+class MemoryOutput:
+    """Output target collecting generated files in memory, without touching disk"""
+    
+    def __init__(self):
+        self.files = {}
+        self.directories = []
+    
+    def open(self):
+        pass
+    
+    def make_directories(self, relative_paths: List[str]):
+        self.directories.extend(relative_paths)
+    
+    def write(self, relative_path: str, content: str):
+        self.files[relative_path] = content
+    
+    def write_chunks(self, relative_path: str, chunks: TextChunks):
+        self.files[relative_path] = ''.join(chunks)
+    
+    def close(self):
+        pass
+    
+    def abort(self):
+        pass
+    
+    def drain(self) -> List[Tuple[str, str]]:
+        """Return and forget the files collected so far"""
+        files = list(self.files.items())
+        self.files.clear()
+        return files
+
+
+# Archive formats supported by ArchiveOutput
+ARCHIVE_FORMATS = ("zip", "tar", "tar.gz")
+
+# Bytes of a streamed tar member held in memory before spooling to a temporary file
+ARCHIVE_SPOOL_SIZE = 1024 * 1024
+
+
+class ArchiveOutput:
+    """Output target streaming generated files into a zip or tar archive.
+    
+    Each file is added to the archive as soon as it is rendered, so only one
+    file is held in memory at a time. The file object does not need to be
+    seekable, which allows streaming to sockets or sys.stdout.buffer.
+    """
+    
+    def __init__(self, fileobj: BinaryIO, archive_format: str = "zip", root: str = ""):
+        if archive_format not in ARCHIVE_FORMATS:
+            raise ValueError(f"Unsupported archive format: {archive_format}")
+        
+        self.fileobj = fileobj
+        self.archive_format = archive_format
+        self.root = f"{root}/" if root else ""
+        self._archive = None
+        self._mtime = None
+    
+    def open(self):
+        import tarfile
+        import zipfile
+        
+        self._mtime = time.time()
+        
+        if self.archive_format == "zip":
+            self._archive = zipfile.ZipFile(self.fileobj, mode='w', compression=zipfile.ZIP_DEFLATED)
+        else:
+            mode = 'w|gz' if self.archive_format == "tar.gz" else 'w|'
+            self._archive = tarfile.open(fileobj=self.fileobj, mode=mode)
+    
+    def make_directories(self, relative_paths: List[str]):
+        import tarfile
+        import zipfile
+        
+        for relative_path in relative_paths:
+            name = f"{self.root}{relative_path}/"
+            
+            if self.archive_format == "zip":
+                info = zipfile.ZipInfo(name, date_time=time.localtime(self._mtime)[:6])
+                info.external_attr = (0o40755 << 16) | 0x10
+                self._archive.writestr(info, b'')
+            else:
+                info = tarfile.TarInfo(name.rstrip('/'))
+                info.type = tarfile.DIRTYPE
+                info.mode = 0o755
+                info.mtime = int(self._mtime)
+                self._archive.addfile(info)
+    
+    def write(self, relative_path: str, content: str):
+        import tarfile
+        import zipfile
+        
+        name = f"{self.root}{relative_path}"
+        data = content.encode('utf-8')
+        
+        if self.archive_format == "zip":
+            info = zipfile.ZipInfo(name, date_time=time.localtime(self._mtime)[:6])
+            info.compress_type = zipfile.ZIP_DEFLATED
+            info.external_attr = 0o644 << 16
+            self._archive.writestr(info, data)
+        else:
+            info = tarfile.TarInfo(name)
+            info.size = len(data)
+            info.mode = 0o644
+            info.mtime = int(self._mtime)
+            self._archive.addfile(info, io.BytesIO(data))
+    
+    def write_chunks(self, relative_path: str, chunks: TextChunks):
+        """Add one file to the archive, chunk by chunk.
+        
+        Zip members are compressed as the chunks arrive. A tar header needs
+        the size up front, so tar members are spooled first, to a temporary
+        file once they outgrow ARCHIVE_SPOOL_SIZE.
+        """
+        import tarfile
+        import tempfile
+        import zipfile
+        
+        name = f"{self.root}{relative_path}"
+        
+        if self.archive_format == "zip":
+            info = zipfile.ZipInfo(name, date_time=time.localtime(self._mtime)[:6])
+            info.compress_type = zipfile.ZIP_DEFLATED
+            info.external_attr = 0o644 << 16
+            with self._archive.open(info, 'w') as member:
+                for chunk in chunks:
+                    member.write(chunk.encode('utf-8'))
+        else:
+            with tempfile.SpooledTemporaryFile(max_size=ARCHIVE_SPOOL_SIZE) as spool:
+                for chunk in chunks:
+                    spool.write(chunk.encode('utf-8'))
+                info = tarfile.TarInfo(name)
+                info.size = spool.tell()
+                info.mode = 0o644
+                info.mtime = int(self._mtime)
+                spool.seek(0)
+                self._archive.addfile(info, spool)
+    
+    def close(self):
+        # Closing the archive writes its trailer; the caller keeps ownership of fileobj
+        self._archive.close()
+    
+    def abort(self):
+        # No trailer: a failed run must not look like a complete archive
+        self._archive = None
+
+
+@contextmanager
+def writing(output):
+    """Open an output target for a run, closing it on success and aborting it on failure"""
+    output.open()
+    try:
+        yield output
+    except BaseException:
+        output.abort()
+        raise
+    output.close()
+
+
+# Profilers available through EnhancedDotNetGenerator(profile=...)
+PROFILERS = ("cprofile", "tracemalloc")
+
+# Pools available for per-entity rendering through EnhancedDotNetGenerator(entity_executor=...)
+ENTITY_EXECUTORS = ("thread", "process")
+
+# ProjectConfig of the run, sent once to each process pool worker instead of with every task
+_worker_config = None
+
+
+def _init_entity_worker(config: 'ProjectConfig'):
+    """Process pool initializer for per-entity rendering"""
+    global _worker_config
+    _worker_config = config
+
+
+def _render_entity_in_worker(renderer: Callable, entity: 'EntityView') -> List[Tuple[str, str]]:
+    """Run a per-entity renderer against the config of the worker process"""
+    return renderer(_worker_config, entity)
+
+
+class GeneratedFile(NamedTuple):
+    """A file produced by a generation run"""
+    path: str
+    size: int  # Bytes, UTF-8 encoded
+    sha256: Optional[str]
+
+
+@dataclass
+class GenerationResult:
+    """Outcome of one generate_project/generate_archive call.
+    
+    Still readable like the plain dicts returned by earlier versions:
+    result['success'], result.get('error'), 'cache_hit' in result...
+    Fields left to None read as missing keys, and result['files_created']
+    gives the paths of files.
+    """
+    success: bool
+    project_name: str
+    project_path: Optional[str] = None
+    files: List[GeneratedFile] = field(default_factory=list)
+    message: str = ''
+    error: Optional[str] = None
+    files_written: Optional[int] = None
+    files_unchanged: Optional[int] = None
+    files_removed: Optional[int] = None
+    cache_hit: Optional[bool] = None
+    archive_format: Optional[str] = None
+    stages: Optional[List[dict]] = None
+    peak_memory: Optional[int] = None
+    profile_path: Optional[str] = None
+    duration: Optional[float] = None  # Seconds, set by generate_many
+    
+    @property
+    def files_created(self) -> List[str]:
+        return [generated.path for generated in self.files]
+    
+    @property
+    def total_bytes(self) -> int:
+        return sum(generated.size for generated in self.files)
+    
+    def _has_key(self, key: str) -> bool:
+        return key == 'files_created' or (key in self.__dataclass_fields__ and getattr(self, key) is not None)
+    
+    def __getitem__(self, key: str):
+        if not self._has_key(key):
+            raise KeyError(key)
+        return getattr(self, key)
+    
+    def __setitem__(self, key: str, value):
+        if key not in self.__dataclass_fields__:
+            raise KeyError(key)
+        setattr(self, key, value)
+    
+    def __contains__(self, key: str) -> bool:
+        return self._has_key(key)
+    
+    def get(self, key: str, default=None):
+        return getattr(self, key) if self._has_key(key) else default
+    
+    def to_dict(self) -> dict:
+        """Plain dict of the set fields, files as [path, size, sha256] lists"""
+        data = {name: getattr(self, name) for name in self.__dataclass_fields__ if self._has_key(name)}
+        data['files'] = [list(generated) for generated in self.files]
+        return data
+
+
+class EntityRenderCache:
+    """Per-entity files rendered by the previous runs of one project.
+    
+    Entities whose definition and project settings are unchanged since the
+    last run are served from the cache instead of being rendered again, so
+    editing one entity only re-renders that entity. Each run keeps only the
+    entries it used, which drops entities removed from the config; share a
+    cache between runs of the same project, not between projects.
+    """
+    
+    def __init__(self):
+        self._files = {}  # (renderer, project settings, entity) -> [(relative path, content)]
+        self._used = set()
+        self.stats = {'hits': 0, 'misses': 0}
+    
+    def render(self, run: 'GenerationRun', renderer: Callable,
+               render_entities: Callable) -> List[List[Tuple[str, str]]]:
+        """Files of every entity of the run, calling render_entities(missing entities) for the cache misses"""
+        if run.entity_keys is None:
+            # Plain strings: their hashes are computed once and cached
+            settings = repr(replace(run.config, entities=[]))
+            run.entity_keys = tuple((settings, repr(entity)) for entity in run.entity_views)
+        
+        entities = run.entity_views
+        keys = [(renderer.__name__,) + entity_key for entity_key in run.entity_keys]
+        missing = [entity for key, entity in zip(keys, entities) if key not in self._files]
+        rendered = iter(render_entities(tuple(missing)) if missing else ())
+        
+        entity_files = []
+        for key in keys:
+            files = self._files.get(key)
+            if files is None:
+                files = self._files[key] = next(rendered)
+                self.stats['misses'] += 1
+            else:
+                self.stats['hits'] += 1
+            self._used.add(key)
+            entity_files.append(files)
+        return entity_files
+    
+    def retain_used(self):
+        """End of a run: forget the entries the run did not use"""
+        self._files = {key: self._files[key] for key in self._used if key in self._files}
+        self._used = set()
+
+
+class GenerationRun:
+    """State of a single generation run.
+    
+    Holds the output target, the GUIDs and entity views of the run and the
+    files it produced. Every call creates its own run, so a generator keeps
+    no per-call state and can serve concurrent calls from several threads.
+    """
+    
+    def __init__(self, project_path: Path, config: ProjectConfig, output=None, hash_files: bool = True,
+                 templates=None):
+        self.project_path = project_path
+        self.config = config
+        self.output = output
+        self.hash_files = hash_files
+        self.templates = templates  # TemplateEngine of the override templates, if any
+        self.guids = {}
+        self.entity_views = tuple(EntityView(entity) for entity in config.entities)
+        self.entity_pool = None
+        self.entity_keys = None  # Per-entity keys of the entity cache, computed on first use
+        self.files = []
+        self.stage_stats = []
+    
+    def guid(self, name: str) -> str:
+        """Upper-case GUID for a named solution element, shared by every file of the run.
+        
+        With deterministic_guids the GUID is derived from the name (uuid5),
+        otherwise it is random but still reused wherever the element is referenced.
+        """
+        guid = self.guids.get(name)
+        if guid is None:
+            if self.config.deterministic_guids:
+                guid = str(uuid.uuid5(GUID_NAMESPACE, name)).upper()
+            else:
+                guid = str(uuid.uuid4()).upper()
+            # setdefault: concurrent stages asking for the same name get the same GUID
+            guid = self.guids.setdefault(name, guid)
+        return guid
+    
+    def fork(self, output) -> 'GenerationRun':
+        """Run sharing the GUIDs, entity views and pools of this one, with its own output and files"""
+        forked = copy.copy(self)
+        forked.output = output
+        forked.files = []
+        forked.stage_stats = []
+        return forked
+    
+    def write_file(self, file_path: Path, content: Union[str, TextBuilder, Iterable[str], None],
+                   template: Optional[str] = None, entity: Optional[EntityView] = None):
+        """Write content to the output target of the run and record the file.
+        
+        Content given as an iterable of chunks is streamed: the chunks are
+        written as they are produced, never joined in memory.
+        When an override template matches the file (template, or the name
+        derived from its path), the template output is written instead, with
+        content available to it as default.
+        """
+        if isinstance(content, TextBuilder):
+            content = content.getvalue()
+        
+        relative_path = file_path.relative_to(self.project_path).as_posix()
+        if self.templates is not None:
+            if template is None:
+                template = template_name(relative_path, self.config.project_name)
+            if template in self.templates:
+                if content is not None and not isinstance(content, str):
+                    content = ''.join(content)
+                content = self.templates.render(
+                    template, config=self.config, project_name=self.config.project_name, entity=entity,
+                    entities=self.entity_views, default=content, guid=self.guid
+                )
+        
+        if not isinstance(content, str):
+            chunks = TextChunks(content, hash_content=self.hash_files)
+            self.output.write_chunks(relative_path, chunks)
+            self.files.append(GeneratedFile(str(file_path), chunks.size, chunks.hexdigest()))
+            return
+        
+        self.output.write(relative_path, content)
+        
+        data = content.encode('utf-8')
+        self.files.append(GeneratedFile(
+            str(file_path),
+            len(data),
+            hashlib.sha256(data).hexdigest() if self.hash_files else None
+        ))
+
+
+# Entry point group through which installed packages declare extra emitters
+EMITTER_ENTRY_POINT_GROUP = "dotnet_generator.emitters"
+
+# Directory of the main project, relative to the project folder
+MAIN_PROJECT_DIRECTORY = "src/{project}"
+
+
+class Emitter(NamedTuple):
+    """A generation step, declared up front and loaded only when a run needs it.
+    
+    target is a "module:attribute" string (or a callable) called as
+    target(generator, run, path, config), where path is the project folder
+    joined with directory ({project} standing for the project name); it
+    writes files with run.write_file or yields (path, chunks) pairs.
+    inputs names the emitters that must run first, outputs the paths the
+    emitter writes. The emitter only runs when the ProjectConfig flag named
+    by enabled is true (always when enabled is None).
+    """
+    name: str
+    target: Union[str, Callable]
+    inputs: Tuple[str, ...] = ()
+    outputs: Tuple[str, ...] = ()
+    enabled: Optional[str] = None
+    directory: str = ""
+
+
+def _builtin_emitter(name: str, method: str, outputs: Tuple[str, ...], enabled: Optional[str] = None,
+                     directory: str = MAIN_PROJECT_DIRECTORY) -> Emitter:
+    """Emitter of a generator method, writing into the tree created by the structure emitter"""
+    return Emitter(name, f"{__name__}:EnhancedDotNetGenerator.{method}", ("structure",), outputs, enabled, directory)
+
+
+BUILTIN_EMITTERS = (
+    Emitter("structure", f"{__name__}:EnhancedDotNetGenerator._create_project_structure"),
+    _builtin_emitter("solution", "_generate_solution_file", ("{project}.sln",), directory=""),
+    _builtin_emitter("main_csproj", "_generate_main_csproj", ("src/{project}/{project}.csproj",)),
+    _builtin_emitter("web_config", "_generate_web_config", ("src/{project}/Web.config",)),
+    _builtin_emitter("global_asax", "_generate_global_asax",
+                     ("src/{project}/Global.asax", "src/{project}/Global.asax.cs")),
+    _builtin_emitter("startup", "_generate_startup", ("src/{project}/App_Start/WebApiConfig.cs",
+                                                      "src/{project}/App_Start/FilterConfig.cs",
+                                                      "src/{project}/App_Start/RouteConfig.cs")),
+    _builtin_emitter("swagger", "_generate_swagger_config", ("src/{project}/App_Start/SwaggerConfig.cs",),
+                     enabled="include_swagger"),
+    _builtin_emitter("models", "_generate_models", ("src/{project}/Models/*.cs",)),
+    _builtin_emitter("data_context", "_generate_data_context",
+                     ("src/{project}/Data/{project}Context.cs", "src/{project}/Data/Configurations/*.cs"),
+                     enabled="include_database"),
+    _builtin_emitter("services", "_generate_services", ("src/{project}/Services/*.cs",)),
+    _builtin_emitter("controllers", "_generate_controllers", ("src/{project}/Controllers/*.cs",)),
+    _builtin_emitter("assembly_info", "_generate_assembly_info", ("src/{project}/Properties/AssemblyInfo.cs",)),
+    _builtin_emitter("packages_config", "_generate_packages_config", ("src/{project}/packages.config",)),
+    _builtin_emitter("test_project", "_generate_test_project", ("tests/{project}.Tests/**",),
+                     enabled="include_tests", directory=""),
+    _builtin_emitter("readme", "_generate_readme", ("README.md",), directory=""),
+    _builtin_emitter("gitignore", "_generate_gitignore", (".gitignore",), directory=""),
+)
+
+
+def _emitter_entry_points() -> list:
+    """Entry points of EMITTER_ENTRY_POINT_GROUP, through whichever metadata API is available.
+
+    importlib.metadata only exists from Python 3.8: on 3.7 the
+    importlib_metadata backport or pkg_resources is used, and without
+    either no plugin emitters are discovered.
+    """
+    try:
+        from importlib.metadata import entry_points
+    except ImportError:
+        try:
+            from importlib_metadata import entry_points
+        except ImportError:
+            try:
+                import pkg_resources
+            except ImportError:
+                return []
+            return list(pkg_resources.iter_entry_points(EMITTER_ENTRY_POINT_GROUP))
+
+    found = entry_points()
+    if hasattr(found, "select"):
+        return list(found.select(group=EMITTER_ENTRY_POINT_GROUP))
+    return list(found.get(EMITTER_ENTRY_POINT_GROUP, []))
+
+
+class EmitterRegistry:
+    """Emitters available to a generator, in registration order.
+    
+    The built-in emitters come first, then those declared by installed
+    packages under EMITTER_ENTRY_POINT_GROUP (an Emitter or a list of them),
+    discovered on first use. Declarations are cheap: the code of an emitter
+    is only imported the first time an enabled emitter runs, so disabled
+    emitters cost nothing.
+    """
+    
+    def __init__(self, emitters: Iterable[Emitter] = BUILTIN_EMITTERS, entry_points: bool = True):
+        self._emitters = {}
+        self._targets = {}
+        self._discover_entry_points = entry_points
+        for emitter in emitters:
+            self.register(emitter)
+    
+    def register(self, emitter: Emitter):
+        """Add an emitter; its name and outputs must not clash with a registered one"""
+        if emitter.name in self._emitters:
+            raise ValueError(f"Emitter already registered: {emitter.name}")
+        for other in self._emitters.values():
+            for output in set(emitter.outputs) & set(other.outputs):
+                raise ValueError(f"Emitters {other.name} and {emitter.name} both write {output}")
+        self._emitters[emitter.name] = emitter
+    
+    def _discover(self):
+        """Register the emitters declared through entry points, once"""
+        if not self._discover_entry_points:
+            return
+        self._discover_entry_points = False
+        
+        for entry_point in _emitter_entry_points():
+            declared = entry_point.load()
+            for emitter in ([declared] if isinstance(declared, Emitter) else declared):
+                self.register(emitter)
     
-    def __post_init__(self):
-        if self.entities is None:
-            self.entities = []
+    def emitters(self) -> List[Emitter]:
+        """Every registered emitter, in registration order"""
+        self._discover()
+        return list(self._emitters.values())
+    
+    def levels(self, config: ProjectConfig, skip: Iterable[str] = ()) -> List[List[Emitter]]:
+        """Enabled emitters of a config grouped by dependency level.
+        
+        An emitter's level is one more than the highest level of its enabled
+        inputs, so the emitters of a level never depend on one another and
+        may run concurrently. Levels, and emitters within a level (in
+        registration order), give a deterministic run order.
+        """
+        self._discover()
+        skip = set(skip)
+        unknown = skip - set(self._emitters)
+        if unknown:
+            raise ValueError(f"Unknown emitters: {', '.join(sorted(unknown))}")
+        
+        enabled = {
+            name: emitter for name, emitter in self._emitters.items()
+            if name not in skip and (emitter.enabled is None or getattr(config, emitter.enabled))
+        }
+        depths = {}
+        
+        def depth(name: str, chain: Tuple[str, ...]) -> int:
+            if name in chain:
+                raise ValueError(f"Emitter dependency cycle: {' -> '.join(chain + (name,))}")
+            if name not in depths:
+                for input_name in self._emitters[name].inputs:
+                    if input_name not in self._emitters:
+                        raise ValueError(f"Emitter {name} depends on unknown emitter {input_name}")
+                depths[name] = 1 + max((depth(input_name, chain + (name,))
+                                        for input_name in self._emitters[name].inputs if input_name in enabled),
+                                       default=-1)
+            return depths[name]
+        
+        levels = []
+        for name, emitter in enabled.items():
+            level = depth(name, ())
+            while len(levels) <= level:
+                levels.append([])
+            levels[level].append(emitter)
+        return [level for level in levels if level]
+    
+    def load(self, emitter: Emitter) -> Callable:
+        """Callable of an emitter, importing its module on first use"""
+        target = self._targets.get(emitter.name)
+        if target is None:
+            target = emitter.target
+            if isinstance(target, str):
+                module_name, _, attribute = target.partition(":")
+                target = importlib.import_module(module_name)
+                for part in attribute.split("."):
+                    target = getattr(target, part)
+            self._targets[emitter.name] = target
+        return target
+
+
+_default_emitters = None
+
+
+def default_emitters() -> EmitterRegistry:
+    """Registry shared by the generators created without an explicit one"""
+    global _default_emitters
+    if _default_emitters is None:
+        _default_emitters = EmitterRegistry()
+    return _default_emitters
 
 
 class EnhancedDotNetGenerator:
     """Enhanced .NET project generator with complete implementation"""
     
-    def __init__(self):
-        self.created_files = []
+    def __init__(self, incremental: bool = False, cache: Optional[GenerationCache] = None,
+                 instrument: bool = False, profile: Optional[str] = None, profile_path: Optional[str] = None,
+                 entity_workers: Optional[int] = None, entity_executor: str = "thread",
+                 write_concurrency: Optional[int] = None, fsync: bool = False, atomic: bool = False,
+                 entity_cache: Optional[EntityRenderCache] = None, template_dirs: Optional[List[str]] = None,
+                 template_cache: Optional[str] = None, template_engine: str = "auto",
+                 emitters: Optional[EmitterRegistry] = None, skip_emitters: Iterable[str] = (),
+                 emitter_workers: Optional[int] = None, blob_store: Optional['BlobStore'] = None):
+        if profile is not None and profile not in PROFILERS:
+            raise ValueError(f"Unsupported profiler: {profile}")
+        if entity_executor not in ENTITY_EXECUTORS:
+            raise ValueError(f"Unsupported entity executor: {entity_executor}")
+        
+        self.incremental = incremental
+        self.cache = cache
+        
+        # Instrumentation: per-stage timings and optional cProfile/tracemalloc capture
+        self.instrument = instrument
+        self.profile = profile
+        self.profile_path = profile_path
+        self.stage_stats = []  # Per-stage statistics of the last finished run
+        
+        # Per-entity files (models, services, controllers...) rendered on a pool; None renders serially
+        self.entity_workers = entity_workers
+        self.entity_executor = entity_executor
         
-    def generate_project(self, config: ProjectConfig) -> dict:
+        # Disk writes: concurrent through AsyncDiskOutput when write_concurrency is set
+        self.write_concurrency = write_concurrency
+        self.fsync = fsync
+        
+        # Atomic mode: stage the project in a sibling folder and swap it in under a lock file
+        self.atomic = atomic
+        
+        # Per-entity files reused across runs of the same project (e.g. by the watch command)
+        self.entity_cache = entity_cache
+        
+        # Override templates, looked up in template_dirs (first directory wins)
+        self.templates = None
+        if template_dirs:
+            from template_engine import TemplateEngine
+            self.templates = TemplateEngine(template_dirs, cache_dir=template_cache, engine=template_engine)
+        
+        # Emitters run for each project: enabled by the config, minus skip_emitters; the
+        # independent emitters of a dependency level run concurrently with emitter_workers
+        self.emitters = emitters if emitters is not None else default_emitters()
+        self.skip_emitters = tuple(skip_emitters)
+        self.emitter_workers = emitter_workers
+        
+        # Opt-in store sharing byte-identical files between projects (see blob_store.BlobStore)
+        self.blob_store = blob_store
+        
+    def generate_project(self, config: ProjectConfig) -> GenerationResult:
         """Generate a complete .NET project"""
+        project_path = None
+        run = None
+        
         try:
             project_path = Path(config.output_path) / config.project_name
-            project_path.mkdir(parents=True, exist_ok=True)
+            # Before any directory is created
+            check_config(config)
+            run = GenerationRun(project_path, config, templates=self.templates)
+            result = GenerationResult(success=True, project_name=config.project_name,
+                                      project_path=str(project_path))
             
-            result = {
-                'success': True,
-                'project_path': str(project_path),
-                'files_created': [],
-                'message': ''
-            }
+            with self._profiling(config, result):
+                if self.atomic:
+                    self._generate_atomically(run, result)
+                else:
+                    run.output = self._disk_output(project_path)
+                    self._generate_to_disk(run, result)
             
-            # Generate project structure
-            self._create_project_structure(project_path, config)
+            if self.instrument:
+                result.stages = run.stage_stats
             
-            # Generate solution file
-            self._generate_solution_file(project_path, config)
+            result.files = run.files
+            result.files_written = run.output.stats['written']
+            result.files_unchanged = run.output.stats['unchanged']
+            result.files_removed = run.output.stats['removed']
+            result.message = f'Project {config.project_name} generated successfully!'
             
-            # Generate main project files
-            self._generate_main_project(project_path, config)
+            return result
+            
+        except Exception as e:
+            return GenerationResult(success=False, project_name=config.project_name,
+                                    project_path=str(project_path) if project_path is not None else None,
+                                    files=run.files if run is not None else [], error=str(e))
+    
+    def generate_archive(self, config: ProjectConfig, fileobj: BinaryIO, archive_format: str = "zip") -> GenerationResult:
+        """Stream a complete .NET project into a zip, tar or tar.gz archive.
+        
+        Files are rendered and written to fileobj one at a time, under a
+        top-level folder named after the project. Nothing touches disk.
+        """
+        run = None
+        
+        try:
+            check_config(config)
+            run = GenerationRun(Path(config.output_path) / config.project_name, config, templates=self.templates)
+            run.output = ArchiveOutput(fileobj, archive_format, root=config.project_name)
+            result = GenerationResult(success=True, project_name=config.project_name,
+                                      archive_format=archive_format)
             
-            # Generate test project if needed
-            if config.include_tests:
-                self._generate_test_project(project_path, config)
+            with self._profiling(config, result):
+                self._run_stages(run)
             
-            # Generate additional files
-            self._generate_additional_files(project_path, config)
+            if self.instrument:
+                result.stages = run.stage_stats
             
-            result['files_created'] = self.created_files
-            result['message'] = f'Project {config.project_name} generated successfully!'
+            result.files = run.files
+            result.message = f'Project {config.project_name} archived successfully!'
             
             return result
             
         except Exception as e:
-            return {
-                'success': False,
-                'error': str(e),
-                'files_created': self.created_files
-            }
+            return GenerationResult(success=False, project_name=config.project_name,
+                                    files=run.files if run is not None else [], error=str(e))
+    
+    def render_project(self, config: ProjectConfig) -> Dict[str, str]:
+        """Render a project in memory as {relative_path: content}, without touching disk"""
+        return dict(self.iter_render_project(config))
+    
+    def iter_render_project(self, config: ProjectConfig) -> Iterator[Tuple[str, str]]:
+        """Lazily render a project as (relative_path, content) pairs.
+        
+        Files are produced stage by stage, so consumers can start hashing,
+        diffing or archiving before the whole project has been rendered.
+        Paths are relative to the project folder and use forward slashes.
+        Raises ConfigValidationError for an invalid config.
+        """
+        check_config(config)
+        output = MemoryOutput()
+        run = GenerationRun(Path(config.output_path) / config.project_name, config, output, hash_files=False,
+                            templates=self.templates)
+        
+        for _ in self._iter_stages(run):
+            yield from output.drain()
+    
+    def _disk_output(self, project_path: Path, previous_path: Optional[Path] = None) -> DiskOutput:
+        """Disk output target for a project, asynchronous when write_concurrency is set"""
+        if self.write_concurrency:
+            return AsyncDiskOutput(project_path, incremental=self.incremental, fsync=self.fsync,
+                                   previous_path=previous_path, max_in_flight=self.write_concurrency,
+                                   blob_store=self.blob_store)
+        return DiskOutput(project_path, incremental=self.incremental, fsync=self.fsync,
+                          previous_path=previous_path, blob_store=self.blob_store)
+    
+    def _generate_to_disk(self, run: GenerationRun, result: GenerationResult):
+        """Generate a project through the disk output target of the run, using the cache if there is one"""
+        if self.cache is not None:
+            result.cache_hit = self._generate_with_cache(run)
+        else:
+            self._run_stages(run)
+    
+    def _generate_atomically(self, run: GenerationRun, result: GenerationResult):
+        """Generate into a sibling staging folder, then swap it in place of the project.
+        
+        Writers of the same project are serialized by a lock file. A failed
+        run only leaves a staging folder behind, removed right away (or by the
+        next run if the process died), and the previous project stays intact.
+        Files the generator does not own (bin/, obj/, user files) are moved
+        into the new tree just before the swap, see carry_over_files.
+        """
+        project_path = run.project_path
+        
+        with project_lock(project_path):
+            _remove_orphaned_staging(project_path)
+            # Created with mkdir (not mkdtemp) so the project keeps the usual permissions
+            staging_path = project_path.parent / f".{project_path.name}.staging-{uuid.uuid4().hex[:12]}"
+            staging_path.mkdir()
+            
+            carried = []
+            try:
+                run.output = self._disk_output(staging_path, previous_path=project_path)
+                self._generate_to_disk(run, result)
+                if project_path.is_dir():
+                    carried = carry_over_files(project_path, staging_path)
+                replace_directory(staging_path, project_path)
+            except BaseException:
+                restore_carried_files(carried)
+                shutil.rmtree(staging_path, ignore_errors=True)
+                raise
+    
+    def _generate_with_cache(self, run: GenerationRun) -> bool:
+        """Generate through the generation cache, returning True on a cache hit"""
+        version = generator_version()
+        if self.templates is not None:
+            version += f"+templates-{self.templates.fingerprint[:12]}"
+        version += "+emitters-" + ",".join(
+            emitter.name for level in self.emitters.levels(run.config, self.skip_emitters) for emitter in level
+        )
+        key = config_fingerprint(run.config, version)
+        entry = self.cache.lookup(key)
+        output = run.output
+        
+        if entry is not None:
+            try:
+                with writing(output):
+                    output.make_directories(entry.directories)
+                    for relative_path, content_hash in entry.files.items():
+                        cached_file = entry.file_path(relative_path)
+                        output.place(relative_path, cached_file, content_hash, hardlink=self.cache.hardlink)
+                        run.files.append(GeneratedFile(
+                            str(run.project_path / relative_path), cached_file.stat().st_size, content_hash
+                        ))
+                return True
+            except FileNotFoundError:
+                # Entry evicted while being copied: render it again
+                run.files.clear()
+        
+        rendered = MemoryOutput()
+        run.output = rendered
+        try:
+            self._run_stages(run)
+        finally:
+            run.output = output
+        self.cache.store(key, rendered.files, rendered.directories)
+        
+        with writing(output):
+            output.make_directories(rendered.directories)
+            for relative_path, content in rendered.files.items():
+                output.write(relative_path, content)
+        return False
+    
+    def _run_stages(self, run: GenerationRun):
+        """Run every generation stage against the output target of the run"""
+        for _ in self._iter_stages(run):
+            pass
+    
+    def _iter_stages(self, run: GenerationRun) -> Iterator[str]:
+        """Run the generation stages one at a time, yielding each stage name once done"""
+        with writing(run.output), self._entity_rendering(run):
+            for level in self._stages(run):
+                if self.emitter_workers and self.emitter_workers > 1 and len(level) > 1:
+                    yield from self._run_level_concurrently(run, level)
+                    continue
+                for name, stage in level:
+                    self._run_stage(run, name, stage)
+                    yield name
+        if self.entity_cache is not None:
+            self.entity_cache.retain_used()
+        self.stage_stats = run.stage_stats
+    
+    def _run_stage(self, run: GenerationRun, name: str, stage: Callable):
+        """Run one stage against run, instrumented if enabled"""
+        if self.instrument:
+            self._run_instrumented(run, name, partial(stage, run))
+        else:
+            stage(run)
+    
+    def _run_level_concurrently(self, run: GenerationRun, level: List[Tuple[str, Callable]]) -> Iterator[str]:
+        """Run the independent stages of a dependency level on a thread pool.
+        
+        Each stage renders into its own in-memory run; the files are then
+        written in level order, so the output does not depend on scheduling.
+        """
+        from concurrent.futures import ThreadPoolExecutor
+        
+        stage_runs = [run.fork(MemoryOutput()) for _ in level]
+        with ThreadPoolExecutor(max_workers=min(self.emitter_workers, len(level))) as pool:
+            futures = [pool.submit(self._run_stage, stage_run, name, stage)
+                       for stage_run, (name, stage) in zip(stage_runs, level)]
+            for future in futures:
+                future.result()
+        
+        for stage_run, (name, _) in zip(stage_runs, level):
+            if stage_run.output.directories:
+                run.output.make_directories(stage_run.output.directories)
+            for relative_path, content in stage_run.output.files.items():
+                run.output.write(relative_path, content)
+            run.files.extend(stage_run.files)
+            run.stage_stats.extend(stage_run.stage_stats)
+            yield name
+    
+    @contextmanager
+    def _entity_rendering(self, run: GenerationRun):
+        """Start the per-entity rendering pool for the duration of a run, if enabled"""
+        if self.entity_workers is None or self.entity_workers == 1 or len(run.entity_views) <= 1:
+            yield
+            return
+        
+        from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+        
+        if self.entity_executor == "process":
+            pool = ProcessPoolExecutor(max_workers=self.entity_workers,
+                                       initializer=_init_entity_worker, initargs=(run.config,))
+        else:
+            pool = ThreadPoolExecutor(max_workers=self.entity_workers)
+        
+        run.entity_pool = pool
+        try:
+            yield
+        finally:
+            run.entity_pool = None
+            pool.shutdown()
+    
+    def _map_entities(self, run: GenerationRun, renderer: Callable) -> Iterable[List[Tuple[str, str]]]:
+        """Render every entity with renderer, in entity order, reusing the entity cache if there is one"""
+        if self.entity_cache is not None:
+            return self.entity_cache.render(run, renderer, partial(self._render_entities, run, renderer))
+        return self._render_entities(run, renderer, run.entity_views)
+    
+    def _render_entities(self, run: GenerationRun, renderer: Callable,
+                         entities: Tuple[EntityView, ...]) -> Iterable[List[Tuple[str, str]]]:
+        """Render entities with renderer, on the entity pool when there is one, in entity order"""
+        if run.entity_pool is None:
+            return (renderer(run.config, entity) for entity in entities)
+        
+        if self.entity_executor == "process":
+            # Batch entities to amortise inter-process overhead
+            chunksize = max(1, len(entities) // (self.entity_workers * 4))
+            return run.entity_pool.map(_render_entity_in_worker, repeat(renderer), entities,
+                                       chunksize=chunksize)
+        
+        return run.entity_pool.map(renderer, repeat(run.config), entities)
+    
+    def _write_entity_files(self, run: GenerationRun, base_path: Path, renderer: Callable):
+        """Render per-entity files and write them below base_path in deterministic order"""
+        if run.templates is None:
+            for files in self._map_entities(run, renderer):
+                for relative_path, content in files:
+                    run.write_file(base_path / relative_path, content)
+            return
+        
+        # Override template names, from the paths the renderer gives a placeholder entity
+        base_name = template_name(base_path.relative_to(run.project_path).as_posix(), run.config.project_name)
+        placeholder_paths = [path for path, _ in renderer(run.config, EntityView(EntityConfig(ENTITY_PLACEHOLDER, [])))]
+        templates = [f"{base_name}/{path}" for path in placeholder_paths]
+        
+        if all(name in run.templates and not run.templates.needs_default(name) for name in templates):
+            # Every file is overridden without its built-in content: skip the built-in renderer
+            for entity in run.entity_views:
+                for path, name in zip(placeholder_paths, templates):
+                    directory, _, filename = path.rpartition("/")
+                    run.write_file(base_path / directory / filename.replace(ENTITY_PLACEHOLDER, entity.name, 1),
+                                   None, name, entity)
+            return
+        
+        for entity, files in zip(run.entity_views, self._map_entities(run, renderer)):
+            for (relative_path, content), name in zip(files, templates):
+                run.write_file(base_path / relative_path, content, name, entity)
+    
+    def _run_instrumented(self, run: GenerationRun, name: str, stage: Callable):
+        """Run one stage, recording its wall time and the files and bytes it wrote"""
+        files_before = len(run.files)
+        start = time.perf_counter()
+        
+        stage()
+        
+        new_files = run.files[files_before:]
+        run.stage_stats.append({
+            'stage': name,
+            'seconds': time.perf_counter() - start,
+            'files': len(new_files),
+            'bytes': sum(generated.size for generated in new_files)
+        })
+    
+    @contextmanager
+    def _profiling(self, config: ProjectConfig, result: dict):
+        """Capture a cProfile or tracemalloc profile of the run when enabled"""
+        if self.profile is None:
+            yield
+            return
+        
+        extension = "prof" if self.profile == "cprofile" else "tracemalloc"
+        profile_path = self.profile_path or str(Path(config.output_path) / f"{config.project_name}.{extension}")
+        
+        if self.profile == "cprofile":
+            import cProfile
+            
+            profiler = cProfile.Profile()
+            profiler.enable()
+            try:
+                yield
+            finally:
+                profiler.disable()
+                profiler.dump_stats(profile_path)
+        else:
+            import tracemalloc
+            
+            # Leave tracing on if someone else (e.g. a benchmark) started it
+            already_tracing = tracemalloc.is_tracing()
+            if not already_tracing:
+                tracemalloc.start()
+            try:
+                yield
+            finally:
+                result['peak_memory'] = tracemalloc.get_traced_memory()[1]
+                tracemalloc.take_snapshot().dump(profile_path)
+                if not already_tracing:
+                    tracemalloc.stop()
+        
+        result['profile_path'] = profile_path
     
-    def _create_project_structure(self, project_path: Path, config: ProjectConfig):
+    def _stages(self, run: GenerationRun) -> List[List[Tuple[str, Callable]]]:
+        """(name, stage) pairs of the enabled emitters, grouped by dependency level; stages take the run"""
+        config = run.config
+        levels = []
+        for level in self.emitters.levels(config, self.skip_emitters):
+            stages = []
+            for emitter in level:
+                path = run.project_path / emitter.directory.format(project=config.project_name)
+                target = self.emitters.load(emitter)
+                stages.append((emitter.name, partial(_emit, target, self, path=path, config=config)))
+            levels.append(stages)
+        return levels
+    
+    def _create_project_structure(self, run: GenerationRun, project_path: Path, config: ProjectConfig):
         """Create the project directory structure"""
         # Main project directories
         main_project = project_path / f"src/{config.project_name}"
@@ -147,29 +2118,30 @@ class EnhancedDotNetGenerator:
             ])
         
         # Create all directories
-        for directory in directories:
-            directory.mkdir(parents=True, exist_ok=True)
+        run.output.make_directories([
+            directory.relative_to(project_path).as_posix() for directory in directories
+        ])
     
-    def _generate_solution_file(self, project_path: Path, config: ProjectConfig):
+    def _generate_solution_file(self, run: GenerationRun, project_path: Path, config: ProjectConfig):
         """Generate Visual Studio solution file"""
-        main_project_guid = str(uuid.uuid4()).upper()
-        test_project_guid = str(uuid.uuid4()).upper() if config.include_tests else None
-        solution_guid = str(uuid.uuid4()).upper()
+        main_project_guid = run.guid(config.project_name)
+        test_project_guid = run.guid(f"{config.project_name}.Tests") if config.include_tests else None
+        solution_guid = run.guid(f"{config.project_name}.sln")
         
         # Solution content for VS 2015 compatibility
-        solution_content = f'''Microsoft Visual Studio Solution File, Format Version 12.00
+        solution_content = TextBuilder(f'''Microsoft Visual Studio Solution File, Format Version 12.00
 # Visual Studio 14
 VisualStudioVersion = 14.0.25420.1
 MinimumVisualStudioVersion = 10.0.40219.1
 Project("{{FAE04EC0-301F-11D3-BF4B-00C04F79EFBC}}") = "{config.project_name}", "src\\{config.project_name}\\{config.project_name}.csproj", "{{{main_project_guid}}}"
-EndProject'''
+EndProject''')
 
         if config.include_tests:
-            solution_content += f'''
+            solution_content.write(f'''
 Project("{{FAE04EC0-301F-11D3-BF4B-00C04F79EFBC}}") = "{config.project_name}.Tests", "tests\\{config.project_name}.Tests\\{config.project_name}.Tests.csproj", "{{{test_project_guid}}}"
-EndProject'''
+EndProject''')
 
-        solution_content += f'''
+        solution_content.write(f'''
 Global
 	GlobalSection(SolutionConfigurationPlatforms) = preSolution
 		Debug|Any CPU = Debug|Any CPU
@@ -179,16 +2151,16 @@ Global
 		{{{main_project_guid}}}.Debug|Any CPU.ActiveCfg = Debug|Any CPU
 		{{{main_project_guid}}}.Debug|Any CPU.Build.0 = Debug|Any CPU
 		{{{main_project_guid}}}.Release|Any CPU.ActiveCfg = Release|Any CPU
-		{{{main_project_guid}}}.Release|Any CPU.Build.0 = Release|Any CPU'''
+		{{{main_project_guid}}}.Release|Any CPU.Build.0 = Release|Any CPU''')
 
         if config.include_tests:
-            solution_content += f'''
+            solution_content.write(f'''
 		{{{test_project_guid}}}.Debug|Any CPU.ActiveCfg = Debug|Any CPU
 		{{{test_project_guid}}}.Debug|Any CPU.Build.0 = Debug|Any CPU
 		{{{test_project_guid}}}.Release|Any CPU.ActiveCfg = Release|Any CPU
-		{{{test_project_guid}}}.Release|Any CPU.Build.0 = Release|Any CPU'''
+		{{{test_project_guid}}}.Release|Any CPU.Build.0 = Release|Any CPU''')
 
-        solution_content += f'''
+        solution_content.write(f'''
 	EndGlobalSection
 	GlobalSection(SolutionProperties) = preSolution
 		HideSolutionNode = FALSE
@@ -197,51 +2169,21 @@ Global
 		SolutionGuid = {{{solution_guid}}}
 	EndGlobalSection
 EndGlobal
-'''
+''')
         
         solution_file = project_path / f"{config.project_name}.sln"
-        self._write_file(solution_file, solution_content)
-    
-    def _generate_main_project(self, project_path: Path, config: ProjectConfig):
-        """Generate the main project files"""
-        main_project_path = project_path / f"src/{config.project_name}"
-        
-        # Generate project file (.csproj)
-        self._generate_main_csproj(main_project_path, config)
-        
-        # Generate web.config for VS 2015 compatibility
-        self._generate_web_config(main_project_path, config)
-        
-        # Generate Global.asax
-        self._generate_global_asax(main_project_path, config)
-        
-        # Generate Startup.cs
-        self._generate_startup(main_project_path, config)
-        
-        # Generate Models
-        self._generate_models(main_project_path, config)
-        
-        # Generate Data Context
-        if config.include_database:
-            self._generate_data_context(main_project_path, config)
-        
-        # Generate Services
-        self._generate_services(main_project_path, config)
-        
-        # Generate Controllers
-        self._generate_controllers(main_project_path, config)
-        
-        # Generate AssemblyInfo
-        self._generate_assembly_info(main_project_path, config)
-        
-        # Generate packages.config
-        self._generate_packages_config(main_project_path, config)
+        run.write_file(solution_file, solution_content)
     
-    def _generate_main_csproj(self, project_path: Path, config: ProjectConfig):
+    def _generate_main_csproj(self, run: GenerationRun, project_path: Path, config: ProjectConfig):
         """Generate main project .csproj file for VS 2015"""
-        project_guid = str(uuid.uuid4()).upper()
+        # Streamed: the Compile items grow with the entity count
+        yield project_path / f"{config.project_name}.csproj", self._iter_main_csproj(run, config)
+    
+    def _iter_main_csproj(self, run: GenerationRun, config: ProjectConfig) -> Iterator[str]:
+        """Chunks of the main project .csproj"""
+        project_guid = run.guid(config.project_name)
         
-        csproj_content = f'''<?xml version="1.0" encoding="utf-8"?>
+        yield f'''<?xml version="1.0" encoding="utf-8"?>
 <Project ToolsVersion="14.0" DefaultTargets="Build" xmlns="http://schemas.microsoft.com/developer/msbuild/2003">
   <Import Project="$(MSBuildExtensionsPath)\\$(MSBuildToolsVersion)\\Microsoft.Common.props" Condition="Exists('$(MSBuildExtensionsPath)\\$(MSBuildToolsVersion)\\Microsoft.Common.props')" />
   <PropertyGroup>
@@ -344,7 +2286,7 @@ EndGlobal
     </Reference>'''
 
         if config.include_database:
-            csproj_content += f'''
+            yield f'''
     <Reference Include="EntityFramework">
       <HintPath>packages\\EntityFramework.6.4.4\\lib\\net45\\EntityFramework.dll</HintPath>
     </Reference>
@@ -353,7 +2295,7 @@ EndGlobal
     </Reference>'''
 
         if config.include_swagger:
-            csproj_content += f'''
+            yield f'''
     <Reference Include="Swashbuckle.Core">
       <HintPath>packages\\Swashbuckle.Core.5.6.0\\lib\\net40\\Swashbuckle.Core.dll</HintPath>
     </Reference>
@@ -361,7 +2303,7 @@ EndGlobal
       <HintPath>packages\\WebActivatorEx.2.2.0\\lib\\net40\\WebActivatorEx.dll</HintPath>
     </Reference>'''
 
-        csproj_content += '''
+        yield '''
   </ItemGroup>
   <ItemGroup>
     <Compile Include="Global.asax.cs">
@@ -373,22 +2315,17 @@ EndGlobal
     <Compile Include="App_Start\\RouteConfig.cs" />'''
 
         if config.include_swagger:
-            csproj_content += '''
+            yield '''
     <Compile Include="App_Start\\SwaggerConfig.cs" />'''
 
         if config.include_database:
-            csproj_content += f'''
+            yield f'''
     <Compile Include="Data\\{config.project_name}Context.cs" />'''
             
-            for entity in config.entities:
-                csproj_content += f'''
-    <Compile Include="Models\\{entity.name}.cs" />
-    <Compile Include="Data\\Configurations\\{entity.name}Configuration.cs" />
-    <Compile Include="Services\\{entity.name}Service.cs" />
-    <Compile Include="Services\\I{entity.name}Service.cs" />
-    <Compile Include="Controllers\\{entity.name}Controller.cs" />'''
+            for entity in run.entity_views:
+                yield self._render_compile_items(config, entity)
 
-        csproj_content += '''
+        yield '''
   </ItemGroup>
   <ItemGroup>
     <Content Include="Global.asax" />
@@ -424,7 +2361,9 @@ EndGlobal
           <AutoAssignPort>True</AutoAssignPort>
           <DevelopmentServerPort>0</DevelopmentServerPort>
           <DevelopmentServerVPath>/</DevelopmentServerVPath>
-          <IISUrl>http://localhost:''' + str(hash(config.project_name) % 10000 + 50000) + f'''</IISUrl>
+          <IISUrl>http://localhost:'''
+        yield str(zlib.crc32(config.project_name.encode('utf-8')) % 10000 + 50000)
+        yield '''</IISUrl>
           <NTLMAuthentication>False</NTLMAuthentication>
           <UseCustomServer>False</UseCustomServer>
           <CustomServerUrl>
@@ -435,17 +2374,25 @@ EndGlobal
     </VisualStudio>
   </ProjectExtensions>
 </Project>'''
-
-        self._write_file(project_path / f"{config.project_name}.csproj", csproj_content)
     
-    def _generate_web_config(self, project_path: Path, config: ProjectConfig):
+    @staticmethod
+    def _render_compile_items(config: ProjectConfig, entity: EntityView) -> str:
+        """Render the main project Compile items of one entity"""
+        return f'''
+    <Compile Include="Models\\{entity.name}.cs" />
+    <Compile Include="Data\\Configurations\\{entity.name}Configuration.cs" />
+    <Compile Include="Services\\{entity.name}Service.cs" />
+    <Compile Include="Services\\I{entity.name}Service.cs" />
+    <Compile Include="Controllers\\{entity.name}Controller.cs" />'''
+    
+    def _generate_web_config(self, run: GenerationRun, project_path: Path, config: ProjectConfig):
         """Generate web.config file"""
-        web_config_content = '''<?xml version="1.0" encoding="utf-8"?>
+        web_config_content = TextBuilder('''<?xml version="1.0" encoding="utf-8"?>
 <configuration>
   <configSections>
     <section name="entityFramework" type="System.Data.Entity.Internal.ConfigFile.EntityFrameworkSection, EntityFramework, Version=6.0.0.0, Culture=neutral, PublicKeyToken=b77a5c561934e089" requirePermission="false" />
   </configSections>
-  <connectionStrings>'''
+  <connectionStrings>''')
 
         if config.include_database:
             if config.database_provider == DatabaseProvider.SQLSERVER:
@@ -455,10 +2402,10 @@ EndGlobal
             else:
                 conn_str = config.connection_string or f"Server=localhost;Database={config.project_name}Db;Trusted_Connection=true;"
             
-            web_config_content += f'''
-    <add name="DefaultConnection" connectionString="{conn_str}" providerName="System.Data.SqlClient" />'''
+            web_config_content.write(f'''
+    <add name="DefaultConnection" connectionString="{conn_str}" providerName="System.Data.SqlClient" />''')
 
-        web_config_content += '''
+        web_config_content.write('''
   </connectionStrings>
   <appSettings>
     <add key="webpages:Version" value="3.0.0.0" />
@@ -506,10 +2453,10 @@ EndGlobal
         <bindingRedirect oldVersion="1.0.0.0-5.2.7.0" newVersion="5.2.7.0" />
       </dependentAssembly>
     </assemblyBinding>
-  </runtime>'''
+  </runtime>''')
 
         if config.include_database:
-            web_config_content += '''
+            web_config_content.write('''
   <entityFramework>
     <defaultConnectionFactory type="System.Data.Entity.Infrastructure.LocalDbConnectionFactory, EntityFramework">
       <parameters>
@@ -519,12 +2466,12 @@ EndGlobal
     <providers>
       <provider invariantName="System.Data.SqlClient" type="System.Data.Entity.SqlServer.SqlProviderServices, EntityFramework.SqlServer" />
     </providers>
-  </entityFramework>'''
+  </entityFramework>''')
 
-        web_config_content += '''
-</configuration>'''
+        web_config_content.write('''
+</configuration>''')
 
-        self._write_file(project_path / "Web.config", web_config_content)
+        run.write_file(project_path / "Web.config", web_config_content)
         
         # Generate Web.Debug.config
         debug_config = '''<?xml version="1.0" encoding="utf-8"?>
@@ -533,7 +2480,7 @@ EndGlobal
     <compilation xdt:Transform="RemoveAttributes(debug)" />
   </system.web>
 </configuration>'''
-        self._write_file(project_path / "Web.Debug.config", debug_config)
+        run.write_file(project_path / "Web.Debug.config", debug_config)
         
         # Generate Web.Release.config
         release_config = '''<?xml version="1.0" encoding="utf-8"?>
@@ -542,12 +2489,12 @@ EndGlobal
     <compilation xdt:Transform="RemoveAttributes(debug)" />
   </system.web>
 </configuration>'''
-        self._write_file(project_path / "Web.Release.config", release_config)
+        run.write_file(project_path / "Web.Release.config", release_config)
     
-    def _generate_global_asax(self, project_path: Path, config: ProjectConfig):
+    def _generate_global_asax(self, run: GenerationRun, project_path: Path, config: ProjectConfig):
         """Generate Global.asax file"""
         global_asax_content = f'''<%@ Application Codebehind="Global.asax.cs" Inherits="{config.project_name}.MvcApplication" Language="C#" %>'''
-        self._write_file(project_path / "Global.asax", global_asax_content)
+        run.write_file(project_path / "Global.asax", global_asax_content)
         
         # Generate Global.asax.cs
         global_asax_cs_content = f'''using System;
@@ -570,15 +2517,14 @@ namespace {config.project_name}
     }}
 }}'''
         
-        self._write_file(project_path / "Global.asax.cs", global_asax_cs_content)
+        run.write_file(project_path / "Global.asax.cs", global_asax_cs_content)
     
-    def _generate_startup(self, project_path: Path, config: ProjectConfig):
+    def _generate_startup(self, run: GenerationRun, project_path: Path, config: ProjectConfig):
         """Generate App_Start configuration files"""
         app_start_path = project_path / "App_Start"
-        app_start_path.mkdir(exist_ok=True)
         
         # WebApiConfig.cs
-        webapi_config = f'''using System.Web.Http;
+        webapi_config = TextBuilder(f'''using System.Web.Http;
 using Newtonsoft.Json;
 using Newtonsoft.Json.Serialization;
 
@@ -602,19 +2548,19 @@ namespace {config.project_name}
             // Configure JSON serialization
             var settings = config.Formatters.JsonFormatter.SerializerSettings;
             settings.ContractResolver = new CamelCasePropertyNamesContractResolver();
-            settings.Formatting = Formatting.Indented;'''
+            settings.Formatting = Formatting.Indented;''')
 
         if config.include_cors:
-            webapi_config += '''
+            webapi_config.write('''
             
             // Enable CORS
-            config.EnableCors();'''
+            config.EnableCors();''')
 
-        webapi_config += '''
+        webapi_config.write('''
         }
     }
-}'''
-        self._write_file(app_start_path / "WebApiConfig.cs", webapi_config)
+}''')
+        run.write_file(app_start_path / "WebApiConfig.cs", webapi_config)
         
         # FilterConfig.cs
         filter_config = f'''using System.Web.Mvc;
@@ -629,7 +2575,7 @@ namespace {config.project_name}
         }}
     }}
 }}'''
-        self._write_file(app_start_path / "FilterConfig.cs", filter_config)
+        run.write_file(app_start_path / "FilterConfig.cs", filter_config)
         
         # RouteConfig.cs
         route_config = f'''using System.Web.Mvc;
@@ -651,11 +2597,11 @@ namespace {config.project_name}
         }}
     }}
 }}'''
-        self._write_file(app_start_path / "RouteConfig.cs", route_config)
-        
-        # SwaggerConfig.cs (if Swagger is enabled)
-        if config.include_swagger:
-            swagger_config = f'''using System.Web.Http;
+        run.write_file(app_start_path / "RouteConfig.cs", route_config)
+    
+    def _generate_swagger_config(self, run: GenerationRun, project_path: Path, config: ProjectConfig):
+        """Generate App_Start/SwaggerConfig.cs"""
+        swagger_config = f'''using System.Web.Http;
 using Swashbuckle.Application;
 
 [assembly: PreApplicationStartMethod(typeof({config.project_name}.SwaggerConfig), "Register")]
@@ -681,57 +2627,63 @@ namespace {config.project_name}
         }}
     }}
 }}'''
-            self._write_file(app_start_path / "SwaggerConfig.cs", swagger_config)
+        run.write_file(project_path / "App_Start/SwaggerConfig.cs", swagger_config)
     
-    def _generate_models(self, project_path: Path, config: ProjectConfig):
+    def _generate_models(self, run: GenerationRun, project_path: Path, config: ProjectConfig):
         """Generate model classes"""
-        models_path = project_path / "Models"
-        
-        for entity in config.entities:
-            model_content = f'''using System;
+        self._write_entity_files(run, project_path, self._render_model)
+    
+    @staticmethod
+    def _render_model(config: ProjectConfig, entity: EntityView) -> List[Tuple[str, str]]:
+        """Render the model class of one entity"""
+        model_content = TextBuilder(f'''using System;
 using System.ComponentModel.DataAnnotations;
 using System.ComponentModel.DataAnnotations.Schema;
 
 namespace {config.project_name}.Models
 {{
     public class {entity.name}
-    {{'''
+    {{''')
+        
+        for prop in entity.properties:
+            # Add data annotations
+            if prop.is_key:
+                model_content.write(f'''
+        [Key]''')
             
-            for prop in entity.properties:
-                # Add data annotations
-                if prop.is_key:
-                    model_content += f'''
-        [Key]'''
-                
-                if prop.is_required:
-                    model_content += f'''
-        [Required]'''
-                
-                if prop.max_length:
-                    model_content += f'''
-        [MaxLength({prop.max_length})]'''
-                
-                if prop.foreign_table:
-                    model_content += f'''
-        [ForeignKey("{prop.foreign_table}")]'''
-                
-                # Add property
-                nullable = "?" if not prop.is_required and prop.type in ["int", "DateTime", "bool", "decimal"] else ""
-                model_content += f'''
-        public {prop.type}{nullable} {prop.name} {{ get; set; }}'''
+            if prop.is_required:
+                model_content.write(f'''
+        [Required]''')
             
-            model_content += '''
-    }
-}'''
+            if prop.max_length:
+                model_content.write(f'''
+        [MaxLength({prop.max_length})]''')
             
-            self._write_file(models_path / f"{entity.name}.cs", model_content)
+            if prop.foreign_table:
+                model_content.write(f'''
+        [ForeignKey("{prop.foreign_table}")]''')
+            
+            # Add property
+            model_content.write(f'''
+        public {prop.cs_type} {prop.name} {{ get; set; }}''')
+        
+        model_content.write('''
+    }
+}''')
+        
+        return [(f"Models/{entity.name}.cs", model_content.getvalue())]
     
-    def _generate_data_context(self, project_path: Path, config: ProjectConfig):
+    def _generate_data_context(self, run: GenerationRun, project_path: Path, config: ProjectConfig):
         """Generate Entity Framework data context"""
-        data_path = project_path / "Data"
+        # DbContext, streamed: it lists every entity twice
+        yield project_path / f"Data/{config.project_name}Context.cs", self._iter_data_context(run, config)
         
-        # DbContext
-        context_content = f'''using System.Data.Entity;
+        # Generate Entity Configurations
+        self._write_entity_files(run, project_path, self._render_entity_configuration)
+    
+    def _iter_data_context(self, run: GenerationRun, config: ProjectConfig) -> Iterator[str]:
+        """Chunks of the DbContext"""
+        yield f'''using System.Data.Entity;
 using {config.project_name}.Models;
 
 namespace {config.project_name}.Data
@@ -742,34 +2694,41 @@ namespace {config.project_name}.Data
         {{
         }}'''
         
-        for entity in config.entities:
-            context_content += f'''
+        for entity in run.entity_views:
+            yield self._render_db_set(config, entity)
         
-        public DbSet<{entity.name}> {entity.name}s {{ get; set; }}'''
-        
-        context_content += f'''
+        yield f'''
         
         protected override void OnModelCreating(DbModelBuilder modelBuilder)
         {{
             base.OnModelCreating(modelBuilder);'''
         
-        for entity in config.entities:
-            context_content += f'''
-            
-            modelBuilder.Configurations.Add(new Configurations.{entity.name}Configuration());'''
+        for entity in run.entity_views:
+            yield self._render_configuration_registration(config, entity)
         
-        context_content += '''
+        yield '''
         }
     }
 }'''
+    
+    @staticmethod
+    def _render_db_set(config: ProjectConfig, entity: EntityView) -> str:
+        """Render the DbSet property of one entity in the DbContext"""
+        return f'''
         
-        self._write_file(data_path / f"{config.project_name}Context.cs", context_content)
-        
-        # Generate Entity Configurations
-        configurations_path = data_path / "Configurations"
-        
-        for entity in config.entities:
-            config_content = f'''using System.Data.Entity.ModelConfiguration;
+        public DbSet<{entity.name}> {entity.plural_name} {{ get; set; }}'''
+    
+    @staticmethod
+    def _render_configuration_registration(config: ProjectConfig, entity: EntityView) -> str:
+        """Render the OnModelCreating registration of one entity configuration"""
+        return f'''
+            
+            modelBuilder.Configurations.Add(new Configurations.{entity.name}Configuration());'''
+    
+    @staticmethod
+    def _render_entity_configuration(config: ProjectConfig, entity: EntityView) -> List[Tuple[str, str]]:
+        """Render the Entity Framework configuration of one entity"""
+        config_content = TextBuilder(f'''using System.Data.Entity.ModelConfiguration;
 using {config.project_name}.Models;
 
 namespace {config.project_name}.Data.Configurations
@@ -779,36 +2738,38 @@ namespace {config.project_name}.Data.Configurations
         public {entity.name}Configuration()
         {{
             // Table name
-            ToTable("{entity.table_name or entity.name + 's'}");
+            ToTable("{entity.table_name}");
             
             // Primary key
-            HasKey(x => x.{next((p.name for p in entity.properties if p.is_key), "Id")});'''
-            
-            for prop in entity.properties:
-                if prop.max_length:
-                    config_content += f'''
+            HasKey(x => x.{entity.key_name});''')
+        
+        for prop in entity.properties:
+            if prop.max_length:
+                config_content.write(f'''
             
             // {prop.name} configuration
-            Property(x => x.{prop.name}).HasMaxLength({prop.max_length});'''
-                
-                if prop.is_required:
-                    config_content += f'''
-            Property(x => x.{prop.name}).IsRequired();'''
+            Property(x => x.{prop.name}).HasMaxLength({prop.max_length});''')
             
-            config_content += '''
+            if prop.is_required:
+                config_content.write(f'''
+            Property(x => x.{prop.name}).IsRequired();''')
+        
+        config_content.write('''
         }
     }
-}'''
-            
-            self._write_file(configurations_path / f"{entity.name}Configuration.cs", config_content)
+}''')
+        
+        return [(f"Data/Configurations/{entity.name}Configuration.cs", config_content.getvalue())]
     
-    def _generate_services(self, project_path: Path, config: ProjectConfig):
+    def _generate_services(self, run: GenerationRun, project_path: Path, config: ProjectConfig):
         """Generate service layer"""
-        services_path = project_path / "Services"
-        
-        for entity in config.entities:
-            # Interface
-            interface_content = f'''using System;
+        self._write_entity_files(run, project_path, self._render_services)
+    
+    @staticmethod
+    def _render_services(config: ProjectConfig, entity: EntityView) -> List[Tuple[str, str]]:
+        """Render the service interface and implementation of one entity"""
+        # Interface
+        interface_content = f'''using System;
 using System.Collections.Generic;
 using {config.project_name}.Models;
 
@@ -818,16 +2779,14 @@ namespace {config.project_name}.Services
     {{
         IEnumerable<{entity.name}> GetAll();
         {entity.name} GetById(int id);
-        {entity.name} Create({entity.name} {entity.name.lower()});
-        {entity.name} Update({entity.name} {entity.name.lower()});
+        {entity.name} Create({entity.name} {entity.lower_name});
+        {entity.name} Update({entity.name} {entity.lower_name});
         bool Delete(int id);
     }}
 }}'''
-            
-            self._write_file(services_path / f"I{entity.name}Service.cs", interface_content)
-            
-            # Implementation
-            service_content = f'''using System;
+        
+        # Implementation
+        service_content = f'''using System;
 using System.Collections.Generic;
 using System.Linq;
 using {config.project_name}.Data;
@@ -846,87 +2805,92 @@ namespace {config.project_name}.Services
 
         public IEnumerable<{entity.name}> GetAll()
         {{
-            return _context.{entity.name}s.ToList();
+            return _context.{entity.plural_name}.ToList();
         }}
 
         public {entity.name} GetById(int id)
         {{
-            return _context.{entity.name}s.Find(id);
+            return _context.{entity.plural_name}.Find(id);
         }}
 
-        public {entity.name} Create({entity.name} {entity.name.lower()})
+        public {entity.name} Create({entity.name} {entity.lower_name})
         {{
-            _context.{entity.name}s.Add({entity.name.lower()});
+            _context.{entity.plural_name}.Add({entity.lower_name});
             _context.SaveChanges();
-            return {entity.name.lower()};
+            return {entity.lower_name};
         }}
 
-        public {entity.name} Update({entity.name} {entity.name.lower()})
+        public {entity.name} Update({entity.name} {entity.lower_name})
         {{
-            _context.Entry({entity.name.lower()}).State = System.Data.Entity.EntityState.Modified;
+            _context.Entry({entity.lower_name}).State = System.Data.Entity.EntityState.Modified;
             _context.SaveChanges();
-            return {entity.name.lower()};
+            return {entity.lower_name};
         }}
 
         public bool Delete(int id)
         {{
-            var {entity.name.lower()} = _context.{entity.name}s.Find(id);
-            if ({entity.name.lower()} == null)
+            var {entity.lower_name} = _context.{entity.plural_name}.Find(id);
+            if ({entity.lower_name} == null)
                 return false;
 
-            _context.{entity.name}s.Remove({entity.name.lower()});
+            _context.{entity.plural_name}.Remove({entity.lower_name});
             _context.SaveChanges();
             return true;
         }}
     }}
 }}'''
-            
-            self._write_file(services_path / f"{entity.name}Service.cs", service_content)
+        
+        return [
+            (f"Services/I{entity.name}Service.cs", interface_content),
+            (f"Services/{entity.name}Service.cs", service_content)
+        ]
     
-    def _generate_controllers(self, project_path: Path, config: ProjectConfig):
+    def _generate_controllers(self, run: GenerationRun, project_path: Path, config: ProjectConfig):
         """Generate Web API controllers"""
-        controllers_path = project_path / "Controllers"
-        
-        for entity in config.entities:
-            controller_content = f'''using System;
+        self._write_entity_files(run, project_path, self._render_controller)
+    
+    @staticmethod
+    def _render_controller(config: ProjectConfig, entity: EntityView) -> List[Tuple[str, str]]:
+        """Render the Web API controller of one entity"""
+        controller_content = TextBuilder(f'''using System;
 using System.Collections.Generic;
-using System.Web.Http;'''
+using System.Web.Http;''')
 
-            if config.include_cors:
-                controller_content += f'''
-using System.Web.Http.Cors;'''
+        if config.include_cors:
+            controller_content.write(f'''
+using System.Web.Http.Cors;''')
 
-            controller_content += f'''
+        controller_content.write(f'''
 using {config.project_name}.Models;
 using {config.project_name}.Services;
 
 namespace {config.project_name}.Controllers
-{{'''
+{{''')
 
-            if config.include_cors:
-                controller_content += f'''
-    [EnableCors(origins: "*", headers: "*", methods: "*")]'''
+        if config.include_cors:
+            controller_content.write(f'''
+    [EnableCors(origins: "*", headers: "*", methods: "*")]''')
 
-            controller_content += f'''
-    [RoutePrefix("api/{entity.name.lower()}")]
+        controller_content.write(f'''
+    [RoutePrefix("api/{entity.lower_name}")]
     public class {entity.name}Controller : ApiController
     {{
-        private readonly I{entity.name}Service _{entity.name.lower()}Service;
+        private readonly I{entity.name}Service _{entity.lower_name}Service;
 
-        public {entity.name}Controller(I{entity.name}Service {entity.name.lower()}Service)
+        public {entity.name}Controller(I{entity.name}Service {entity.lower_name}Service)
         {{
-            _{entity.name.lower()}Service = {entity.name.lower()}Service;
+            _{entity.lower_name}Service = {entity.lower_name}Service;
         }}
 
-        // GET api/{entity.name.lower()}
+        // GET api/{entity.lower_name}
         [HttpGet]
         [Route("")]
         public IHttpActionResult Get()
         {{
             try
             {{
-                var {entity.name.lower()}s = _{entity.name.lower()}Service.GetAll();
-                return Ok({entity.name.lower()}s);
+                var {entity.lower_plural_name} = _{entity.lower_name}Service.GetAll();
+                return Ok({entity.lower_plural_name});
             }}
             catch (Exception ex)
             {{
@@ -934,18 +2898,18 @@ namespace {config.project_name}.Controllers
             }}
         }}
 
-        // GET api/{entity.name.lower()}/5
+        // GET api/{entity.lower_name}/5
         [HttpGet]
         [Route("{{id:int}}")]
         public IHttpActionResult Get(int id)
         {{
             try
             {{
-                var {entity.name.lower()} = _{entity.name.lower()}Service.GetById(id);
-                if ({entity.name.lower()} == null)
+                var {entity.lower_name} = _{entity.lower_name}Service.GetById(id);
+                if ({entity.lower_name} == null)
                     return NotFound();
 
-                return Ok({entity.name.lower()});
+                return Ok({entity.lower_name});
             }}
             catch (Exception ex)
             {{
@@ -953,18 +2917,18 @@ namespace {config.project_name}.Controllers
             }}
         }}
 
-        // POST api/{entity.name.lower()}
+        // POST api/{entity.lower_name}
         [HttpPost]
         [Route("")]
-        public IHttpActionResult Post([FromBody]{entity.name} {entity.name.lower()})
+        public IHttpActionResult Post([FromBody]{entity.name} {entity.lower_name})
         {{
             if (!ModelState.IsValid)
                 return BadRequest(ModelState);
 
             try
             {{
-                var created{entity.name} = _{entity.name.lower()}Service.Create({entity.name.lower()});
-                return Created($"api/{entity.name.lower()}/{{created{entity.name}.{next((p.name for p in entity.properties if p.is_key), "Id")}}}", created{entity.name});
+                var created{entity.name} = _{entity.lower_name}Service.Create({entity.lower_name});
+                return Created($"api/{entity.lower_name}/{{created{entity.name}.{entity.key_name}}}", created{entity.name});
             }}
             catch (Exception ex)
             {{
@@ -972,21 +2936,21 @@ namespace {config.project_name}.Controllers
             }}
         }}
 
-        // PUT api/{entity.name.lower()}/5
+        // PUT api/{entity.lower_name}/5
         [HttpPut]
         [Route("{{id:int}}")]
-        public IHttpActionResult Put(int id, [FromBody]{entity.name} {entity.name.lower()})
+        public IHttpActionResult Put(int id, [FromBody]{entity.name} {entity.lower_name})
         {{
             if (!ModelState.IsValid)
                 return BadRequest(ModelState);
 
             try
             {{
-                var existing{entity.name} = _{entity.name.lower()}Service.GetById(id);
+                var existing{entity.name} = _{entity.lower_name}Service.GetById(id);
                 if (existing{entity.name} == null)
                     return NotFound();
 
-                var updated{entity.name} = _{entity.name.lower()}Service.Update({entity.name.lower()});
+                var updated{entity.name} = _{entity.lower_name}Service.Update({entity.lower_name});
                 return Ok(updated{entity.name});
             }}
             catch (Exception ex)
@@ -995,14 +2959,14 @@ namespace {config.project_name}.Controllers
             }}
         }}
 
-        // DELETE api/{entity.name.lower()}/5
+        // DELETE api/{entity.lower_name}/5
         [HttpDelete]
         [Route("{{id:int}}")]
         public IHttpActionResult Delete(int id)
         {{
             try
             {{
-                var result = _{entity.name.lower()}Service.Delete(id);
+                var result = _{entity.lower_name}Service.Delete(id);
                 if (!result)
                     return NotFound();
 
@@ -1014,11 +2978,11 @@ namespace {config.project_name}.Controllers
             }}
         }}
     }}
-}}'''
-            
-            self._write_file(controllers_path / f"{entity.name}Controller.cs", controller_content)
+}}''')
+        
+        return [(f"Controllers/{entity.name}Controller.cs", controller_content.getvalue())]
     
-    def _generate_assembly_info(self, project_path: Path, config: ProjectConfig):
+    def _generate_assembly_info(self, run: GenerationRun, project_path: Path, config: ProjectConfig):
         """Generate AssemblyInfo.cs"""
         properties_path = project_path / "Properties"
         
@@ -1044,7 +3008,7 @@ using System.Runtime.InteropServices;
 [assembly: ComVisible(false)]
 
 // The following GUID is for the ID of the typelib if this project is exposed to COM
-[assembly: Guid("{str(uuid.uuid4()).lower()}")]
+[assembly: Guid("{run.guid(f"{config.project_name}.typelib").lower()}")]
 
 // Version information for an assembly consists of the following four values:
 //
@@ -1058,11 +3022,11 @@ using System.Runtime.InteropServices;
 [assembly: AssemblyVersion("1.0.0.0")]
 [assembly: AssemblyFileVersion("1.0.0.0")]'''
         
-        self._write_file(properties_path / "AssemblyInfo.cs", assembly_info)
+        run.write_file(properties_path / "AssemblyInfo.cs", assembly_info)
     
-    def _generate_packages_config(self, project_path: Path, config: ProjectConfig):
+    def _generate_packages_config(self, run: GenerationRun, project_path: Path, config: ProjectConfig):
         """Generate packages.config for NuGet packages"""
-        packages_content = '''<?xml version="1.0" encoding="utf-8"?>
+        packages_content = TextBuilder('''<?xml version="1.0" encoding="utf-8"?>
 <packages>
   <package id="Microsoft.AspNet.Mvc" version="5.2.7" targetFramework="net48" />
   <package id="Microsoft.AspNet.Razor" version="3.2.7" targetFramework="net48" />
@@ -1074,35 +3038,74 @@ using System.Runtime.InteropServices;
   <package id="Microsoft.AspNet.WebPages" version="3.2.7" targetFramework="net48" />
   <package id="Microsoft.Web.Infrastructure" version="1.0.0.0" targetFramework="net48" />
   <package id="Newtonsoft.Json" version="12.0.2" targetFramework="net48" />
-  <package id="WebGrease" version="1.5.2" targetFramework="net48" />'''
+  <package id="WebGrease" version="1.5.2" targetFramework="net48" />''')
 
         if config.include_database:
-            packages_content += '''
-  <package id="EntityFramework" version="6.4.4" targetFramework="net48" />'''
+            packages_content.write('''
+  <package id="EntityFramework" version="6.4.4" targetFramework="net48" />''')
 
         if config.include_swagger:
-            packages_content += '''
+            packages_content.write('''
   <package id="Swashbuckle" version="5.6.0" targetFramework="net48" />
   <package id="Swashbuckle.Core" version="5.6.0" targetFramework="net48" />
-  <package id="WebActivatorEx" version="2.2.0" targetFramework="net48" />'''
+  <package id="WebActivatorEx" version="2.2.0" targetFramework="net48" />''')
 
         if config.include_cors:
-            packages_content += '''
-  <package id="Microsoft.AspNet.WebApi.Cors" version="5.2.7" targetFramework="net48" />'''
+            packages_content.write('''
+  <package id="Microsoft.AspNet.WebApi.Cors" version="5.2.7" targetFramework="net48" />''')
 
-        packages_content += '''
-</packages>'''
+        packages_content.write('''
+</packages>''')
         
-        self._write_file(project_path / "packages.config", packages_content)
+        run.write_file(project_path / "packages.config", packages_content)
     
-    def _generate_test_project(self, project_path: Path, config: ProjectConfig):
+    def _generate_test_project(self, run: GenerationRun, project_path: Path, config: ProjectConfig):
         """Generate test project files"""
         test_project_path = project_path / f"tests/{config.project_name}.Tests"
         
-        # Generate test project .csproj
-        test_guid = str(uuid.uuid4()).upper()
+        # Generate test project .csproj, streamed: its Compile items grow with the entity count
+        yield test_project_path / f"{config.project_name}.Tests.csproj", self._iter_test_csproj(run, config)
+        
+        # Generate test AssemblyInfo
+        test_assembly_info = f'''using System.Reflection;
+using System.Runtime.CompilerServices;
+using System.Runtime.InteropServices;
+
+[assembly: AssemblyTitle("{config.project_name}.Tests")]
+[assembly: AssemblyDescription("")]
+[assembly: AssemblyConfiguration("")]
+[assembly: AssemblyCompany("")]
+[assembly: AssemblyProduct("{config.project_name}.Tests")]
+[assembly: AssemblyCopyright("Copyright ©  2023")]
+[assembly: AssemblyTrademark("")]
+[assembly: AssemblyCulture("")]
+
+[assembly: ComVisible(false)]
+
+[assembly: Guid("{run.guid(f"{config.project_name}.Tests.typelib").lower()}")]
+
+[assembly: AssemblyVersion("1.0.0.0")]
+[assembly: AssemblyFileVersion("1.0.0.0")]'''
+        
+        run.write_file(test_project_path / "Properties/AssemblyInfo.cs", test_assembly_info)
+        
+        # Generate test packages.config
+        test_packages = '''<?xml version="1.0" encoding="utf-8"?>
+<packages>
+  <package id="MSTest.TestAdapter" version="2.1.2" targetFramework="net48" />
+  <package id="MSTest.TestFramework" version="2.1.2" targetFramework="net48" />
+</packages>'''
+        
+        run.write_file(test_project_path / "packages.config", test_packages)
+        
+        # Generate test files for services and controllers
+        self._write_entity_files(run, test_project_path, self._render_entity_tests)
+    
+    def _iter_test_csproj(self, run: GenerationRun, config: ProjectConfig) -> Iterator[str]:
+        """Chunks of the test project .csproj"""
+        test_guid = run.guid(f"{config.project_name}.Tests")
         
-        test_csproj = f'''<?xml version="1.0" encoding="utf-8"?>
+        yield f'''<?xml version="1.0" encoding="utf-8"?>
 <Project ToolsVersion="14.0" DefaultTargets="Build" xmlns="http://schemas.microsoft.com/developer/msbuild/2003">
   <PropertyGroup>
     <Configuration Condition=" '$(Configuration)' == '' ">Debug</Configuration>
@@ -1147,16 +3150,14 @@ using System.Runtime.InteropServices;
     <Compile Include="Properties\\AssemblyInfo.cs" />'''
 
         # Add test files for each entity
-        for entity in config.entities:
-            test_csproj += f'''
-    <Compile Include="Services\\{entity.name}ServiceTests.cs" />
-    <Compile Include="Controllers\\{entity.name}ControllerTests.cs" />'''
+        for entity in run.entity_views:
+            yield self._render_test_compile_items(config, entity)
 
-        test_csproj += f'''
+        yield f'''
   </ItemGroup>
   <ItemGroup>
     <ProjectReference Include="..\\..\\src\\{config.project_name}\\{config.project_name}.csproj">
-      <Project>{{{str(uuid.uuid4()).upper()}}}</Project>
+      <Project>{{{run.guid(config.project_name)}}}</Project>
       <Name>{config.project_name}</Name>
     </ProjectReference>
   </ItemGroup>
@@ -1166,48 +3167,27 @@ using System.Runtime.InteropServices;
   <Import Project="$(VSToolsPath)\\TeamTest\\Microsoft.TestTools.targets" Condition="Exists('$(VSToolsPath)\\TeamTest\\Microsoft.TestTools.targets')" />
   <Import Project="$(MSBuildToolsPath)\\Microsoft.CSharp.targets" />
 </Project>'''
-        
-        self._write_file(test_project_path / f"{config.project_name}.Tests.csproj", test_csproj)
-        
-        # Generate test AssemblyInfo
-        test_assembly_info = f'''using System.Reflection;
-using System.Runtime.CompilerServices;
-using System.Runtime.InteropServices;
-
-[assembly: AssemblyTitle("{config.project_name}.Tests")]
-[assembly: AssemblyDescription("")]
-[assembly: AssemblyConfiguration("")]
-[assembly: AssemblyCompany("")]
-[assembly: AssemblyProduct("{config.project_name}.Tests")]
-[assembly: AssemblyCopyright("Copyright ©  2023")]
-[assembly: AssemblyTrademark("")]
-[assembly: AssemblyCulture("")]
-
-[assembly: ComVisible(false)]
-
-[assembly: Guid("{str(uuid.uuid4()).lower()}")]
-
-[assembly: AssemblyVersion("1.0.0.0")]
-[assembly: AssemblyFileVersion("1.0.0.0")]'''
-        
-        self._write_file(test_project_path / "Properties/AssemblyInfo.cs", test_assembly_info)
-        
-        # Generate test packages.config
-        test_packages = '''<?xml version="1.0" encoding="utf-8"?>
-<packages>
-  <package id="MSTest.TestAdapter" version="2.1.2" targetFramework="net48" />
-  <package id="MSTest.TestFramework" version="2.1.2" targetFramework="net48" />
-</packages>'''
-        
-        self._write_file(test_project_path / "packages.config", test_packages)
-        
-        # Generate test files for services and controllers
-        for entity in config.entities:
-            self._generate_service_tests(test_project_path, config, entity)
-            self._generate_controller_tests(test_project_path, config, entity)
     
-    def _generate_service_tests(self, test_project_path: Path, config: ProjectConfig, entity: EntityConfig):
-        """Generate service test files"""
+    @staticmethod
+    def _render_test_compile_items(config: ProjectConfig, entity: EntityView) -> str:
+        """Render the test project Compile items of one entity"""
+        return f'''
+    <Compile Include="Services\\{entity.name}ServiceTests.cs" />
+    <Compile Include="Controllers\\{entity.name}ControllerTests.cs" />'''
+    
+    @staticmethod
+    def _render_entity_tests(config: ProjectConfig, entity: EntityView) -> List[Tuple[str, str]]:
+        """Render the service and controller tests of one entity"""
+        return [
+            (f"Services/{entity.name}ServiceTests.cs",
+             EnhancedDotNetGenerator._render_service_tests(config, entity)),
+            (f"Controllers/{entity.name}ControllerTests.cs",
+             EnhancedDotNetGenerator._render_controller_tests(config, entity)),
+        ]
+    
+    @staticmethod
+    def _render_service_tests(config: ProjectConfig, entity: EntityView) -> str:
+        """Render the service test class of one entity"""
         test_content = f'''using Microsoft.VisualStudio.TestTools.UnitTesting;
 using {config.project_name}.Data;
 using {config.project_name}.Models;
@@ -1237,14 +3217,14 @@ namespace {config.project_name}.Tests.Services
         }}
 
         [TestMethod]
-        public void GetAll_ReturnsAll{entity.name}s()
+        public void GetAll_ReturnsAll{entity.plural_name}()
         {{
             // Arrange
-            var {entity.name.lower()}1 = new {entity.name} {{ /* Set properties */ }};
-            var {entity.name.lower()}2 = new {entity.name} {{ /* Set properties */ }};
+            var {entity.lower_name}1 = new {entity.name} {{ /* Set properties */ }};
+            var {entity.lower_name}2 = new {entity.name} {{ /* Set properties */ }};
             
-            _context.{entity.name}s.Add({entity.name.lower()}1);
-            _context.{entity.name}s.Add({entity.name.lower()}2);
+            _context.{entity.plural_name}.Add({entity.lower_name}1);
+            _context.{entity.plural_name}.Add({entity.lower_name}2);
             _context.SaveChanges();
 
             // Act
@@ -1259,12 +3239,12 @@ namespace {config.project_name}.Tests.Services
         public void GetById_ReturnsCorrect{entity.name}()
         {{
             // Arrange
-            var {entity.name.lower()} = new {entity.name} {{ /* Set properties */ }};
-            _context.{entity.name}s.Add({entity.name.lower()});
+            var {entity.lower_name} = new {entity.name} {{ /* Set properties */ }};
+            _context.{entity.plural_name}.Add({entity.lower_name});
             _context.SaveChanges();
 
             // Act
-            var result = _service.GetById({entity.name.lower()}.{next((p.name for p in entity.properties if p.is_key), "Id")});
+            var result = _service.GetById({entity.lower_name}.{entity.key_name});
 
             // Assert
             Assert.IsNotNull(result);
@@ -1274,40 +3254,39 @@ namespace {config.project_name}.Tests.Services
         public void Create_Adds{entity.name}Successfully()
         {{
             // Arrange
-            var {entity.name.lower()} = new {entity.name} {{ /* Set properties */ }};
+            var {entity.lower_name} = new {entity.name} {{ /* Set properties */ }};
 
             // Act
-            var result = _service.Create({entity.name.lower()});
+            var result = _service.Create({entity.lower_name});
 
             // Assert
             Assert.IsNotNull(result);
-            Assert.AreEqual(1, _context.{entity.name}s.Count());
+            Assert.AreEqual(1, _context.{entity.plural_name}.Count());
         }}
 
         [TestMethod]
         public void Delete_Removes{entity.name}Successfully()
         {{
             // Arrange
-            var {entity.name.lower()} = new {entity.name} {{ /* Set properties */ }};
-            _context.{entity.name}s.Add({entity.name.lower()});
+            var {entity.lower_name} = new {entity.name} {{ /* Set properties */ }};
+            _context.{entity.plural_name}.Add({entity.lower_name});
             _context.SaveChanges();
 
             // Act
-            var result = _service.Delete({entity.name.lower()}.{next((p.name for p in entity.properties if p.is_key), "Id")});
+            var result = _service.Delete({entity.lower_name}.{entity.key_name});
 
             // Assert
             Assert.IsTrue(result);
-            Assert.AreEqual(0, _context.{entity.name}s.Count());
+            Assert.AreEqual(0, _context.{entity.plural_name}.Count());
         }}
     }}
 }}'''
         
-        services_path = test_project_path / "Services"
-        services_path.mkdir(exist_ok=True)
-        self._write_file(services_path / f"{entity.name}ServiceTests.cs", test_content)
+        return test_content
     
-    def _generate_controller_tests(self, test_project_path: Path, config: ProjectConfig, entity: EntityConfig):
-        """Generate controller test files"""
+    @staticmethod
+    def _render_controller_tests(config: ProjectConfig, entity: EntityView) -> str:
+        """Render the controller test class of one entity"""
         test_content = f'''using Microsoft.VisualStudio.TestTools.UnitTesting;
 using {config.project_name}.Controllers;
 using {config.project_name}.Models;
@@ -1344,8 +3323,8 @@ namespace {config.project_name}.Tests.Controllers
         public void GetById_WithValidId_ReturnsOkResult()
         {{
             // Arrange
-            var {entity.name.lower()} = new {entity.name} {{ /* Set properties */ }};
-            _mockService.SetupGetById({entity.name.lower()});
+            var {entity.lower_name} = new {entity.name} {{ /* Set properties */ }};
+            _mockService.SetupGetById({entity.lower_name});
 
             // Act
             var result = _controller.Get(1);
@@ -1371,11 +3350,11 @@ namespace {config.project_name}.Tests.Controllers
         public void Post_WithValidModel_ReturnsCreatedResult()
         {{
             // Arrange
-            var {entity.name.lower()} = new {entity.name} {{ /* Set properties */ }};
-            _mockService.SetupCreate({entity.name.lower()});
+            var {entity.lower_name} = new {entity.name} {{ /* Set properties */ }};
+            _mockService.SetupCreate({entity.lower_name});
 
             // Act
-            var result = _controller.Post({entity.name.lower()});
+            var result = _controller.Post({entity.lower_name});
 
             // Assert
             Assert.IsInstanceOfType(result, typeof(CreatedNegotiatedContentResult<{entity.name}>));
@@ -1439,14 +3418,14 @@ namespace {config.project_name}.Tests.Controllers
             return _returnValue;
         }}
 
-        public {entity.name} Create({entity.name} {entity.name.lower()})
+        public {entity.name} Create({entity.name} {entity.lower_name})
         {{
-            return _returnValue ?? {entity.name.lower()};
+            return _returnValue ?? {entity.lower_name};
         }}
 
-        public {entity.name} Update({entity.name} {entity.name.lower()})
+        public {entity.name} Update({entity.name} {entity.lower_name})
         {{
-            return _returnValue ?? {entity.name.lower()};
+            return _returnValue ?? {entity.lower_name};
         }}
 
         public bool Delete(int id)
@@ -1456,14 +3435,28 @@ namespace {config.project_name}.Tests.Controllers
     }}
 }}'''
         
-        controllers_path = test_project_path / "Controllers"
-        controllers_path.mkdir(exist_ok=True)
-        self._write_file(controllers_path / f"{entity.name}ControllerTests.cs", test_content)
+        return test_content
+    
+    @staticmethod
+    def _render_readme_endpoints(config: ProjectConfig, entity: EntityView) -> str:
+        """Render the README endpoint list of one entity"""
+        return f'''
+
+#### {entity.name}
+- `GET /api/{entity.lower_name}` - Get all {entity.lower_plural_name}
+- `GET /api/{entity.lower_name}/{{id}}` - Get specific {entity.lower_name}
+- `POST /api/{entity.lower_name}` - Create new {entity.lower_name}
+- `PUT /api/{entity.lower_name}/{{id}}` - Update {entity.lower_name}
+- `DELETE /api/{entity.lower_name}/{{id}}` - Delete {entity.lower_name}'''
     
-    def _generate_additional_files(self, project_path: Path, config: ProjectConfig):
-        """Generate additional project files"""
-        # Generate README.md
-        readme_content = f'''# {config.project_name}
+    def _generate_readme(self, run: GenerationRun, project_path: Path, config: ProjectConfig):
+        """Generate README.md"""
+        # Streamed: the endpoint list grows with the entity count
+        yield project_path / "README.md", self._iter_readme(run, config)
+    
+    def _iter_readme(self, run: GenerationRun, config: ProjectConfig) -> Iterator[str]:
+        """Chunks of README.md"""
+        yield f'''# {config.project_name}
 
 A .NET Framework 4.8 Web API project generated automatically.
 
@@ -1495,25 +3488,17 @@ A .NET Framework 4.8 Web API project generated automatically.
 
 The following endpoints are available:'''
 
-        if config.entities:
-            for entity in config.entities:
-                readme_content += f'''
-
-#### {entity.name}
-- `GET /api/{entity.name.lower()}` - Get all {entity.name.lower()}s
-- `GET /api/{entity.name.lower()}/{{id}}` - Get specific {entity.name.lower()}
-- `POST /api/{entity.name.lower()}` - Create new {entity.name.lower()}
-- `PUT /api/{entity.name.lower()}/{{id}}` - Update {entity.name.lower()}
-- `DELETE /api/{entity.name.lower()}/{{id}}` - Delete {entity.name.lower()}'''
+        for entity in run.entity_views:
+            yield self._render_readme_endpoints(config, entity)
 
         if config.include_swagger:
-            readme_content += f'''
+            yield f'''
 
 ### Documentation
 
 Swagger documentation is available at: `/swagger`'''
 
-        readme_content += f'''
+        yield f'''
 
 ## Project Structure
 
@@ -1536,10 +3521,9 @@ Swagger documentation is available at: `/swagger`'''
 
 MIT License
 '''
-        
-        self._write_file(project_path / "README.md", readme_content)
-        
-        # Generate .gitignore
+    
+    def _generate_gitignore(self, run: GenerationRun, project_path: Path, config: ProjectConfig):
+        """Generate .gitignore"""
         gitignore_content = '''# Build results
 [Dd]ebug/
 [Dd]ebugPublic/
@@ -1597,14 +3581,75 @@ npm-debug.log*
 *.scc
 '''
         
-        self._write_file(project_path / ".gitignore", gitignore_content)
+        run.write_file(project_path / ".gitignore", gitignore_content)
+
+
+def _emit(target: Callable, generator: 'EnhancedDotNetGenerator', run: GenerationRun, path: Path,
+          config: ProjectConfig):
+    """Call an emitter target with the arguments of its declaration.
     
-    def _write_file(self, file_path: Path, content: str):
-        """Write content to file and track created files"""
-        file_path.parent.mkdir(parents=True, exist_ok=True)
-        with open(file_path, 'w', encoding='utf-8') as f:
-            f.write(content)
-        self.created_files.append(str(file_path))
+    An emitter may write files itself or yield (path, chunks) pairs: each
+    file is then written chunk by chunk, as its chunks are produced.
+    """
+    produced = target(generator, run, path, config)
+    if produced is not None:
+        for file_path, chunks in produced:
+            run.write_file(file_path, chunks)
+
+
+def _generate_one(config: ProjectConfig, generator_options: dict) -> GenerationResult:
+    """Generate a single project and time it (worker entry point for generate_many)"""
+    start = time.perf_counter()
+    try:
+        result = EnhancedDotNetGenerator(**generator_options).generate_project(config)
+    except Exception as e:
+        result = GenerationResult(success=False, project_name=config.project_name, error=str(e))
+    result.duration = time.perf_counter() - start
+    return result
+
+
+def generate_many(configs: Iterable[ProjectConfig], workers: Optional[int] = None,
+                  **generator_options) -> List[GenerationResult]:
+    """Generate several projects in parallel over a process pool.
+
+    Each project is generated by a fresh generator in a worker process.
+    Results are returned in input order, as GenerationResult objects
+    with their duration (seconds) set.
+    A failing project is reported with success=False and does not abort
+    the rest of the batch. workers=1 runs serially in the current process.
+    Extra keyword arguments are passed to each EnhancedDotNetGenerator.
+    """
+    configs = list(configs)
+
+    # Invalid configs are rejected up front instead of occupying a worker
+    results = {}
+    for index, config in enumerate(configs):
+        try:
+            errors = validate_config(config)
+        except Exception as e:
+            errors = [f"{type(e).__name__}: {e}"]
+        if errors:
+            results[index] = GenerationResult(success=False, project_name=getattr(config, 'project_name', None),
+                                              error=str(ConfigValidationError(errors)), duration=0.0)
+    pending = [(index, config) for index, config in enumerate(configs) if index not in results]
+
+    if workers == 1 or len(pending) <= 1:
+        for index, config in pending:
+            results[index] = _generate_one(config, generator_options)
+        return [results[index] for index in range(len(configs))]
+
+    from concurrent.futures import ProcessPoolExecutor
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [(index, config, pool.submit(_generate_one, config, generator_options)) for index, config in pending]
+        for index, config, future in futures:
+            try:
+                results[index] = future.result()
+            except Exception as e:
+                # Pool-level failures (unpicklable config, crashed worker)
+                results[index] = GenerationResult(success=False, project_name=config.project_name,
+                                                  error=str(e), duration=0.0)
+    return [results[index] for index in range(len(configs))]
 
 
 # Usage example function
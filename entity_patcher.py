@@ -0,0 +1,278 @@
+#!/usr/bin/env python3
+"""
+In-place entity patches for generated .NET projects
+Adds or removes a single entity without regenerating the rest of the project
+"""
+
+import hashlib
+import json
+import re
+from pathlib import Path
+from typing import Callable, List, Tuple, Union
+
+from enhanced_dotnet_generator import (
+    ConfigValidationError,
+    DiskOutput,
+    EnhancedDotNetGenerator,
+    EntityConfig,
+    EntityView,
+    GeneratedFile,
+    GenerationResult,
+    MANIFEST_FILENAME,
+    ProjectConfig,
+    project_lock,
+    validate_config
+)
+
+
+# Text following the entity list of each shared file: a new entity is inserted
+# right before it, exactly where a full generation would have rendered it
+DB_SET_ANCHORS = ("\n        \n        protected override void OnModelCreating",)
+REGISTRATION_ANCHORS = ("\n        }\n    }\n}",)
+COMPILE_ITEMS_ANCHORS = ('\n  </ItemGroup>\n  <ItemGroup>\n    <Content Include="Global.asax" />',)
+TEST_COMPILE_ITEMS_ANCHORS = ("\n  </ItemGroup>\n  <ItemGroup>\n    <ProjectReference",)
+README_ANCHORS = ("\n\n### Documentation", "\n\n## Project Structure")
+
+TABLE_NAME_PATTERN = re.compile(r'ToTable\("([^"]*)"\)')
+
+
+def read_project_settings(project_path: Union[str, Path]) -> ProjectConfig:
+    """Infer the settings of a generated project from the files it contains.
+
+    Only the settings that shape entity files are recovered: project name,
+    database, Swagger, CORS and tests.
+    """
+    project_path = Path(project_path)
+    solutions = sorted(project_path.glob("*.sln"))
+    if len(solutions) != 1:
+        raise ValueError(f"{project_path} is not a generated project (expected one .sln file)")
+
+    project_name = solutions[0].stem
+    main_path = project_path / f"src/{project_name}"
+    if not (main_path / f"{project_name}.csproj").is_file():
+        raise ValueError(f"{project_path} is not a generated project (missing {project_name}.csproj)")
+
+    packages = (main_path / "packages.config").read_text(encoding='utf-8')
+
+    return ProjectConfig(
+        project_name=project_name,
+        output_path=str(project_path.parent),
+        include_database=(main_path / f"Data/{project_name}Context.cs").is_file(),
+        include_swagger=(main_path / "App_Start/SwaggerConfig.cs").is_file(),
+        include_cors='id="Microsoft.AspNet.WebApi.Cors"' in packages,
+        include_tests=(project_path / f"tests/{project_name}.Tests/{project_name}.Tests.csproj").is_file()
+    )
+
+
+def _model_names(project_path: Path, config: ProjectConfig) -> List[str]:
+    """Names of the entities of a generated project, from its model files"""
+    return sorted(model_file.stem for model_file in (project_path / f"src/{config.project_name}/Models").glob("*.cs"))
+
+
+def read_project_entities(project_path: Union[str, Path], config: ProjectConfig) -> List[EntityConfig]:
+    """Entities of a generated project, recovered from its model files.
+
+    Only names and table names are recovered (properties are left empty):
+    enough to check a new entity against the existing ones.
+    """
+    project_path = Path(project_path)
+    main_path = project_path / f"src/{config.project_name}"
+    entities = []
+    for name in _model_names(project_path, config):
+        table_name = None
+        configuration_file = main_path / f"Data/Configurations/{name}Configuration.cs"
+        if config.include_database and configuration_file.is_file():
+            match = TABLE_NAME_PATTERN.search(configuration_file.read_text(encoding='utf-8'))
+            table_name = match.group(1) if match else None
+        entities.append(EntityConfig(name, [], table_name))
+    return entities
+
+
+def check_new_entity(config: ProjectConfig, existing: List[EntityConfig], entity: EntityConfig):
+    """Raise ConfigValidationError if entity cannot be added next to the existing entities.
+
+    The entity is validated like the last entity of a full generation
+    (validate_config on the merged entity list), so names, keys and
+    foreign tables are checked as they would be up front, and name
+    collisions are found case-insensitively. Problems of the existing
+    entities, whose properties are not recovered, are not reported.
+    """
+    folded = {existing_entity.name.lower(): existing_entity.name for existing_entity in existing}
+    if isinstance(entity.name, str) and entity.name.lower() in folded:
+        existing_name = folded[entity.name.lower()]
+        spelling = f" (as {existing_name})" if existing_name != entity.name else ""
+        raise ValueError(f"Entity {entity.name} already exists in {config.project_name}{spelling}")
+
+    merged = ProjectConfig(
+        project_name=config.project_name,
+        include_database=config.include_database,
+        entities=list(existing) + [entity]
+    )
+    prefix = f"entities[{len(existing)}]"
+    errors = [error for error in validate_config(merged) if error.startswith(prefix)]
+    if errors:
+        raise ConfigValidationError(errors)
+
+
+def _entity_files(config: ProjectConfig, entity: EntityView) -> List[Tuple[str, str]]:
+    """(relative path, content) of every file of one entity, as a full generation renders them"""
+    main_path = f"src/{config.project_name}"
+    renderers = [(main_path, EnhancedDotNetGenerator._render_model)]
+    if config.include_database:
+        renderers.append((main_path, EnhancedDotNetGenerator._render_entity_configuration))
+    renderers.append((main_path, EnhancedDotNetGenerator._render_services))
+    renderers.append((main_path, EnhancedDotNetGenerator._render_controller))
+    if config.include_tests:
+        renderers.append((f"tests/{config.project_name}.Tests", EnhancedDotNetGenerator._render_entity_tests))
+
+    return [
+        (f"{base_path}/{relative_path}", content)
+        for base_path, renderer in renderers
+        for relative_path, content in renderer(config, entity)
+    ]
+
+
+def _shared_fragments(config: ProjectConfig) -> List[Tuple[str, Callable, Tuple[str, ...]]]:
+    """(relative path, fragment renderer, anchors) of every entity list in the shared files"""
+    name = config.project_name
+    fragments = []
+
+    if config.include_database:
+        fragments.extend([
+            (f"src/{name}/Data/{name}Context.cs", EnhancedDotNetGenerator._render_db_set, DB_SET_ANCHORS),
+            (f"src/{name}/Data/{name}Context.cs", EnhancedDotNetGenerator._render_configuration_registration,
+             REGISTRATION_ANCHORS),
+            (f"src/{name}/{name}.csproj", EnhancedDotNetGenerator._render_compile_items, COMPILE_ITEMS_ANCHORS),
+        ])
+    if config.include_tests:
+        fragments.append((f"tests/{name}.Tests/{name}.Tests.csproj", EnhancedDotNetGenerator._render_test_compile_items,
+                          TEST_COMPILE_ITEMS_ANCHORS))
+    fragments.append(("README.md", EnhancedDotNetGenerator._render_readme_endpoints, README_ANCHORS))
+
+    return fragments
+
+
+def _insert_fragment(text: str, fragment: str, anchors: Tuple[str, ...], relative_path: str) -> str:
+    """Insert fragment before the first anchor found in text"""
+    positions = [position for position in (text.find(anchor) for anchor in anchors) if position >= 0]
+    if not positions:
+        raise ValueError(f"{relative_path} was modified by hand: cannot find where to add the entity")
+    position = min(positions)
+    return text[:position] + fragment + text[position:]
+
+
+def _remove_fragment(text: str, fragment: str, relative_path: str) -> str:
+    """Remove the fragment of an entity from text"""
+    if fragment not in text:
+        raise ValueError(f"{relative_path} was modified by hand: cannot find the entity to remove")
+    return text.replace(fragment, "", 1)
+
+
+def _patch_project(project_path: Path, config: ProjectConfig, entity: EntityConfig, add: bool) -> GenerationResult:
+    """Add or remove the files of one entity and its entries in the shared files"""
+    if add:
+        # Before anything is rendered or written
+        check_new_entity(config, read_project_entities(project_path, config), entity)
+    elif entity.name not in _model_names(project_path, config):
+        # Exact names only, even on case-insensitive file systems: paths are derived from it
+        raise ValueError(f"Entity {entity.name} does not exist in {config.project_name}")
+
+    entity = EntityView(entity)
+    entity_files = _entity_files(config, entity)
+
+    # Patch the shared files in memory first, so a hand-edited file leaves the project untouched
+    shared_files = {}
+    for relative_path, renderer, anchors in _shared_fragments(config):
+        if relative_path not in shared_files:
+            shared_files[relative_path] = (project_path / relative_path).read_text(encoding='utf-8')
+        fragment = renderer(config, entity)
+        if add:
+            shared_files[relative_path] = _insert_fragment(shared_files[relative_path], fragment, anchors, relative_path)
+        else:
+            shared_files[relative_path] = _remove_fragment(shared_files[relative_path], fragment, relative_path)
+
+    written = list(shared_files.items()) + (entity_files if add else [])
+    output = DiskOutput(project_path)
+    output.open()
+    for relative_path, content in written:
+        output.write(relative_path, content)
+    output.close()
+
+    removed = []
+    if not add:
+        for relative_path, _ in entity_files:
+            try:
+                (project_path / relative_path).unlink()
+            except FileNotFoundError:
+                continue
+            removed.append(relative_path)
+
+    files = []
+    for relative_path, content in written:
+        data = content.encode('utf-8')
+        files.append(GeneratedFile(str(project_path / relative_path), len(data), hashlib.sha256(data).hexdigest()))
+    _update_manifest(project_path, files, removed)
+
+    return GenerationResult(
+        success=True,
+        project_name=config.project_name,
+        project_path=str(project_path),
+        files=files,
+        files_written=len(files),
+        files_removed=len(removed),
+        message=f"Entity {entity.name} {'added to' if add else 'removed from'} {config.project_name}"
+    )
+
+
+def _update_manifest(project_path: Path, files: List[GeneratedFile], removed: List[str]):
+    """Keep the manifest of an incremental project in step with the patched files"""
+    manifest_path = project_path / MANIFEST_FILENAME
+    try:
+        with open(manifest_path, 'r', encoding='utf-8') as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return
+
+    entries = manifest.setdefault('files', {})
+    for generated in files:
+        relative_path = Path(generated.path).relative_to(project_path).as_posix()
+        entries[relative_path] = {'sha256': generated.sha256, 'size': generated.size}
+    for relative_path in removed:
+        entries.pop(relative_path, None)
+
+    with open(manifest_path, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+
+
+def add_entity(project_path: Union[str, Path], entity: EntityConfig) -> GenerationResult:
+    """Add one entity to a generated project, in place.
+
+    Only the files of the entity are rendered; the DbContext, the csproj
+    Compile items, the test csproj and the README endpoint list are patched
+    to list it last, as if it had been the last entity of a full generation.
+    """
+    project_path = Path(project_path)
+    try:
+        config = read_project_settings(project_path)
+        with project_lock(project_path):
+            return _patch_project(project_path, config, entity, add=True)
+    except Exception as e:
+        return GenerationResult(success=False, project_name=project_path.name,
+                                project_path=str(project_path), error=str(e))
+
+
+def remove_entity(project_path: Union[str, Path], entity_name: str) -> GenerationResult:
+    """Remove one entity from a generated project, in place.
+
+    Its files are deleted and its entries removed from the shared files.
+    """
+    project_path = Path(project_path)
+    try:
+        config = read_project_settings(project_path)
+        # Paths and shared file entries only depend on the entity name
+        entity = EntityConfig(entity_name, [])
+        with project_lock(project_path):
+            return _patch_project(project_path, config, entity, add=False)
+    except Exception as e:
+        return GenerationResult(success=False, project_name=project_path.name,
+                                project_path=str(project_path), error=str(e))
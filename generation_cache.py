@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+"""
+Content-addressed cache of generated .NET projects
+Entries are keyed by a stable hash of the ProjectConfig tree and the generator version
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+from dataclasses import asdict
+from pathlib import Path
+from typing import Dict, List, Optional
+
+
+# Metadata file stored next to the cached files of each entry
+ENTRY_FILENAME = "entry.json"
+
+
+def _json_value(value):
+    """JSON form of the values json does not know: columnar property lists, enums..."""
+    # A PropertyColumns hashes like the equivalent list of properties
+    if hasattr(value, 'to_dicts'):
+        return value.to_dicts()
+    return str(value)
+
+
+def config_fingerprint(config, generator_version: str) -> str:
+    """Stable hash of a ProjectConfig/EntityConfig/PropertyConfig tree.
+
+    output_path is left out since it does not affect the rendered files;
+    entity and property order is kept since it does.
+    """
+    data = asdict(config)
+    data.pop('output_path', None)
+
+    payload = json.dumps(
+        {'generator': generator_version, 'config': data},
+        sort_keys=True,
+        separators=(',', ':'),
+        default=_json_value
+    )
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+class CacheEntry:
+    """A cached project: its files (relative path -> sha256) and directories"""
+
+    def __init__(self, path: Path, files: Dict[str, str], directories: List[str]):
+        self.path = path
+        self.files = files
+        self.directories = directories
+
+    def file_path(self, relative_path: str) -> Path:
+        """Location of a cached file"""
+        return self.path / "files" / relative_path
+
+
+class GenerationCache:
+    """On-disk cache of rendered projects with size-bounded LRU eviction.
+
+    Each entry lives in cache_dir/<key[:2]>/<key>/ and is created atomically
+    (rendered in a temporary folder, then renamed), so several processes can
+    share one cache. Entry folders are touched on every hit and the least
+    recently used ones are evicted once the cache grows beyond max_bytes.
+
+    With hardlink=True, cache hits hardlink files into the project instead of
+    copying them; the generated files then share storage with the cache and
+    must not be edited in place.
+    """
+
+    def __init__(self, cache_dir: str, max_bytes: int = 512 * 1024 * 1024, hardlink: bool = False):
+        self.cache_dir = Path(cache_dir)
+        self.max_bytes = max_bytes
+        self.hardlink = hardlink
+
+    def _entry_path(self, key: str) -> Path:
+        return self.cache_dir / key[:2] / key
+
+    def lookup(self, key: str) -> Optional[CacheEntry]:
+        """Return the cached entry for key, or None on a miss"""
+        entry_path = self._entry_path(key)
+
+        try:
+            with open(entry_path / ENTRY_FILENAME, 'r', encoding='utf-8') as f:
+                metadata = json.load(f)
+
+            # Mark the entry as recently used
+            os.utime(entry_path)
+        except (OSError, ValueError):
+            return None
+
+        return CacheEntry(entry_path, metadata['files'], metadata['directories'])
+
+    def store(self, key: str, files: Dict[str, str], directories: List[str]):
+        """Store rendered files ({relative_path: content}) under key"""
+        # Imported here: enhanced_dotnet_generator imports this module
+        from enhanced_dotnet_generator import DiskOutput
+
+        entry_path = self._entry_path(key)
+        if entry_path.exists():
+            return
+
+        entry_path.parent.mkdir(parents=True, exist_ok=True)
+        staging_path = Path(tempfile.mkdtemp(prefix=f".{key[:8]}-", dir=entry_path.parent))
+
+        try:
+            # Written like a regular project so copies are byte-identical to a fresh render
+            output = DiskOutput(staging_path / "files")
+            output.open()
+            output.make_directories(directories)
+            hashes = {}
+            for relative_path, content in files.items():
+                output.write(relative_path, content)
+                hashes[relative_path] = hashlib.sha256(content.encode('utf-8')).hexdigest()
+
+            size = sum(
+                (staging_path / "files" / relative_path).stat().st_size
+                for relative_path in files
+            )
+            metadata = {'files': hashes, 'directories': directories, 'size': size}
+            with open(staging_path / ENTRY_FILENAME, 'w', encoding='utf-8') as f:
+                json.dump(metadata, f)
+
+            os.rename(staging_path, entry_path)
+        except OSError:
+            # Another process stored the same entry first
+            shutil.rmtree(staging_path, ignore_errors=True)
+            return
+
+        self._evict(keep=key)
+
+    def _evict(self, keep: str = None):
+        """Evict least recently used entries until the cache fits in max_bytes"""
+        entries = []
+        total = 0
+
+        for entry_path in self.cache_dir.glob("??/*"):
+            if entry_path.name.startswith('.'):
+                continue
+            try:
+                with open(entry_path / ENTRY_FILENAME, 'r', encoding='utf-8') as f:
+                    size = json.load(f)['size']
+                entries.append((entry_path.stat().st_mtime, size, entry_path))
+            except (OSError, ValueError, KeyError):
+                continue
+            total += size
+
+        entries.sort(key=lambda entry: entry[0])
+        for _, size, entry_path in entries:
+            if total <= self.max_bytes:
+                break
+            if entry_path.name == keep:
+                continue
+            shutil.rmtree(entry_path, ignore_errors=True)
+            total -= size
+
+    def clear(self):
+        """Remove every cached entry"""
+        shutil.rmtree(self.cache_dir, ignore_errors=True)
@@ -0,0 +1,255 @@
+#!/usr/bin/env python3
+"""
+Local generation daemon for the .NET project generator
+Keeps the generator loaded and renders JSON ProjectConfig payloads over HTTP (TCP or Unix socket)
+"""
+
+import argparse
+import io
+import json
+import os
+import socketserver
+import sys
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import List, Optional, Tuple
+from urllib.parse import parse_qs, urlparse
+
+from enhanced_dotnet_generator import (
+    __version__,
+    ARCHIVE_FORMATS,
+    EnhancedDotNetGenerator,
+    ProjectConfig,
+    generator_version,
+    validate_config
+)
+from generation_cache import GenerationCache
+
+
+# Response formats of POST /generate: an archive, or a JSON manifest of a project written to disk
+RESPONSE_FORMATS = ARCHIVE_FORMATS + ("manifest",)
+
+CONTENT_TYPES = {
+    "zip": "application/zip",
+    "tar": "application/x-tar",
+    "tar.gz": "application/gzip"
+}
+
+# Largest accepted request body
+MAX_PAYLOAD_BYTES = 16 * 1024 * 1024
+
+# Generator of the worker (process or thread pool), created once and reused by every request
+_worker_generator = None
+
+
+def _init_worker(generator_options: dict):
+    """Pool initializer: load the generator once per worker"""
+    global _worker_generator
+    _worker_generator = EnhancedDotNetGenerator(**generator_options)
+
+
+def _archive_job(config: ProjectConfig, archive_format: str) -> Tuple[dict, Optional[bytes]]:
+    """Render a project into an in-memory archive, returning (result, archive bytes)"""
+    buffer = io.BytesIO()
+    result = _worker_generator.generate_archive(config, buffer, archive_format)
+    return result.to_dict(), buffer.getvalue() if result.success else None
+
+
+def _manifest_job(config: ProjectConfig) -> Tuple[dict, None]:
+    """Generate a project on disk, returning (result, None)"""
+    result = _worker_generator.generate_project(config)
+    return result.to_dict(), None
+
+
+class GenerationRequestHandler(BaseHTTPRequestHandler):
+    """HTTP API of the daemon.
+
+    GET  /health                          -> {"status": "ok", ...}
+    POST /generate?format=zip|tar|tar.gz  -> the project archive
+    POST /generate?format=manifest        -> JSON result of a project generated in output_dir
+
+    The request body of /generate is a ProjectConfig as JSON.
+    """
+
+    server_version = f"DotNetGenerator/{__version__}"
+
+    def do_GET(self):
+        if urlparse(self.path).path != "/health":
+            self._send_json(404, {'error': f"Unknown endpoint: {self.path}"})
+            return
+
+        self._send_json(200, {
+            'status': 'ok',
+            'generator_version': generator_version(),
+            'workers': self.server.workers
+        })
+
+    def do_POST(self):
+        url = urlparse(self.path)
+        if url.path != "/generate":
+            self._send_json(404, {'error': f"Unknown endpoint: {self.path}"})
+            return
+
+        response_format = parse_qs(url.query).get('format', ['zip'])[0]
+        if response_format not in RESPONSE_FORMATS:
+            self._send_json(400, {'error': f"Unsupported format: {response_format}"})
+            return
+
+        try:
+            length = int(self.headers.get('Content-Length', 0))
+        except ValueError:
+            length = -1
+        if length <= 0 or length > MAX_PAYLOAD_BYTES:
+            self._send_json(411 if length <= 0 else 413, {'error': "Invalid or missing Content-Length"})
+            return
+
+        try:
+            config = ProjectConfig.from_dict(json.loads(self.rfile.read(length)))
+        except (ValueError, TypeError) as e:
+            self._send_json(400, {'error': f"Invalid project configuration: {e}"})
+            return
+
+        try:
+            errors = validate_config(config)
+        except Exception as e:
+            self._send_json(400, {'error': f"Invalid project configuration: {e}"})
+            return
+        if errors:
+            self._send_json(400, {'error': "Invalid project configuration", 'errors': errors})
+            return
+
+        if config.project_name in ("", ".", "..") or Path(config.project_name).name != config.project_name:
+            self._send_json(400, {'error': f"Invalid project name: {config.project_name!r}"})
+            return
+
+        if response_format == "manifest":
+            # Projects are only ever written below the output directory of the daemon
+            config.output_path = self.server.output_dir
+            future = self.server.pool.submit(_manifest_job, config)
+        else:
+            future = self.server.pool.submit(_archive_job, config, response_format)
+
+        try:
+            result, archive = future.result()
+        except Exception as e:
+            self._send_json(500, {'error': str(e)})
+            return
+
+        if not result['success']:
+            self._send_json(500, result)
+        elif archive is None:
+            self._send_json(200, result)
+        else:
+            self.send_response(200)
+            self.send_header('Content-Type', CONTENT_TYPES[response_format])
+            self.send_header('Content-Length', str(len(archive)))
+            self.send_header('Content-Disposition', f'attachment; filename="{config.project_name}.{response_format}"')
+            self.end_headers()
+            self.wfile.write(archive)
+
+    def _send_json(self, status: int, payload: dict):
+        body = json.dumps(payload, default=str).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def address_string(self) -> str:
+        # Unix socket clients have no (host, port) address
+        return self.client_address[0] if isinstance(self.client_address, tuple) else "unix"
+
+    def log_message(self, format: str, *args):
+        if not self.server.quiet:
+            super().log_message(format, *args)
+
+
+class GenerationHTTPServer(ThreadingHTTPServer):
+    """Daemon listening on a TCP address"""
+    daemon_threads = True
+
+
+class GenerationUnixServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    """Daemon listening on a Unix socket"""
+    daemon_threads = True
+
+
+def create_server(host: str = "127.0.0.1", port: int = 8765, unix_socket: Optional[str] = None,
+                  workers: Optional[int] = None, executor: str = "process", output_dir: str = ".",
+                  quiet: bool = False, **generator_options):
+    """Create the daemon and its worker pool (call serve_forever() to run it).
+
+    Requests are accepted on their own threads and rendered on a pool of
+    warm workers, each holding an EnhancedDotNetGenerator built from
+    generator_options. executor="process" renders on several cores,
+    "thread" keeps everything in one process.
+    """
+    workers = workers or os.cpu_count() or 1
+    if executor == "process":
+        pool = ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(generator_options,))
+    elif executor == "thread":
+        _init_worker(generator_options)
+        pool = ThreadPoolExecutor(max_workers=workers)
+    else:
+        raise ValueError(f"Unsupported executor: {executor}")
+
+    if unix_socket:
+        if os.path.exists(unix_socket):
+            os.unlink(unix_socket)
+        server = GenerationUnixServer(unix_socket, GenerationRequestHandler)
+    else:
+        server = GenerationHTTPServer((host, port), GenerationRequestHandler)
+
+    server.pool = pool
+    server.workers = workers
+    server.output_dir = str(Path(output_dir).resolve())
+    server.quiet = quiet
+    return server
+
+
+def add_arguments(parser: argparse.ArgumentParser):
+    """Options of the serve command"""
+    parser.add_argument("--host", default="127.0.0.1", help="address to listen on (default: 127.0.0.1)")
+    parser.add_argument("--port", type=int, default=8765, help="port to listen on (default: 8765)")
+    parser.add_argument("--unix-socket", help="listen on this Unix socket instead of TCP")
+    parser.add_argument("--workers", type=int, help="rendering workers (default: CPU count)")
+    parser.add_argument("--executor", choices=["process", "thread"], default="process",
+                        help="worker pool type (default: process)")
+    parser.add_argument("--output-dir", default="./generated_projects",
+                        help="where format=manifest requests write their projects")
+    parser.add_argument("--cache", help="generation cache directory shared by the workers")
+    parser.add_argument("--quiet", action="store_true", help="do not log requests")
+
+
+def run(args: argparse.Namespace) -> int:
+    """Run the daemon until interrupted"""
+    generator_options = {}
+    if args.cache:
+        generator_options['cache'] = GenerationCache(args.cache)
+
+    server = create_server(args.host, args.port, args.unix_socket, args.workers, args.executor,
+                           args.output_dir, args.quiet, **generator_options)
+    where = args.unix_socket or f"http://{args.host}:{args.port}"
+    print(f"🚀 .NET generator daemon listening on {where} ({server.workers} {args.executor} workers)")
+
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        server.pool.shutdown()
+        if args.unix_socket and os.path.exists(args.unix_socket):
+            os.unlink(args.unix_socket)
+    return 0
+
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(description="Serve the .NET project generator over HTTP")
+    add_arguments(parser)
+    return run(parser.parse_args(argv))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,284 @@
+#!/usr/bin/env python3
+"""
+JSON/YAML project specs for the .NET project generator
+Loads, validates and generates ProjectConfig specs without any interactive prompt
+"""
+
+import argparse
+import glob
+import json
+import re
+import sys
+from pathlib import Path
+from typing import Any, List, Optional
+
+from blob_store import LINK_METHODS, BlobStore
+from enhanced_dotnet_generator import (
+    DatabaseProvider,
+    ProjectConfig,
+    ProjectType,
+    generate_many,
+    validate_config
+)
+
+
+# Extensions recognised when a directory of specs is given
+SPEC_EXTENSIONS = (".json", ".yaml", ".yml")
+
+IDENTIFIER_PATTERN = r"^[A-Za-z_][A-Za-z0-9_]*$"
+
+PROPERTY_SCHEMA = {
+    "type": "object",
+    "required": ["name", "type"],
+    "additionalProperties": False,
+    "properties": {
+        "name": {"type": "string", "pattern": IDENTIFIER_PATTERN},
+        "type": {"type": "string", "minLength": 1},
+        "is_required": {"type": "boolean"},
+        "is_key": {"type": "boolean"},
+        "max_length": {"type": ["integer", "null"], "minimum": 1},
+        "foreign_table": {"type": ["string", "null"]}
+    }
+}
+
+ENTITY_SCHEMA = {
+    "type": "object",
+    "required": ["name", "properties"],
+    "additionalProperties": False,
+    "properties": {
+        "name": {"type": "string", "pattern": IDENTIFIER_PATTERN},
+        "properties": {"type": "array", "items": PROPERTY_SCHEMA},
+        "table_name": {"type": ["string", "null"]}
+    }
+}
+
+# JSON Schema (draft-07 subset) of a project spec, mirroring ProjectConfig
+PROJECT_SPEC_SCHEMA = {
+    "$schema": "http://json-schema.org/draft-07/schema#",
+    "title": "ProjectConfig",
+    "type": "object",
+    "required": ["project_name"],
+    "additionalProperties": False,
+    "properties": {
+        "project_name": {"type": "string", "pattern": r"^[A-Za-z_][A-Za-z0-9_.]*$"},
+        "project_type": {"enum": [project_type.value for project_type in ProjectType]},
+        "target_framework": {"type": "string"},
+        "output_path": {"type": "string"},
+        "include_database": {"type": "boolean"},
+        "database_provider": {"enum": [provider.value for provider in DatabaseProvider]},
+        "connection_string": {"type": "string"},
+        "entities": {"type": ["array", "null"], "items": ENTITY_SCHEMA},
+        "include_swagger": {"type": "boolean"},
+        "include_cors": {"type": "boolean"},
+        "include_authentication": {"type": "boolean"},
+        "include_tests": {"type": "boolean"},
+        "deterministic_guids": {"type": "boolean"}
+    }
+}
+
+JSON_TYPES = {
+    "object": dict,
+    "array": list,
+    "string": str,
+    "integer": int,
+    "boolean": bool,
+    "null": type(None)
+}
+
+
+class SpecError(ValueError):
+    """A spec file that cannot be loaded or does not match the schema"""
+
+    def __init__(self, path: str, errors: List[str]):
+        super().__init__(f"{path}: " + "; ".join(errors))
+        self.path = path
+        self.errors = errors
+
+
+def _matches_type(data: Any, allowed: List[str]) -> bool:
+    """Check data against a JSON type name or list of names"""
+    # bool is an int subclass, but not a JSON integer
+    if type(data) is bool:
+        return "boolean" in allowed
+    return any(isinstance(data, JSON_TYPES[name]) for name in allowed)
+
+
+def validate_spec(data: Any, schema: dict = PROJECT_SPEC_SCHEMA, location: str = "") -> List[str]:
+    """Validate data against a (draft-07 subset) JSON schema, returning every error found"""
+    errors = []
+    where = location or "spec"
+
+    if "enum" in schema and data not in schema["enum"]:
+        errors.append(f"{where}: {data!r} is not one of {', '.join(map(repr, schema['enum']))}")
+        return errors
+
+    if "type" in schema:
+        allowed = schema["type"] if isinstance(schema["type"], list) else [schema["type"]]
+        if not _matches_type(data, allowed):
+            errors.append(f"{where}: expected {' or '.join(allowed)}, got {type(data).__name__}")
+            return errors
+
+    if isinstance(data, dict):
+        properties = schema.get("properties", {})
+        for name in schema.get("required", []):
+            if name not in data:
+                errors.append(f"{where}: missing required field '{name}'")
+        for name, value in data.items():
+            if name in properties:
+                errors.extend(validate_spec(value, properties[name], f"{location}.{name}" if location else name))
+            elif schema.get("additionalProperties") is False:
+                errors.append(f"{where}: unknown field '{name}'")
+
+    elif isinstance(data, list) and "items" in schema:
+        for index, item in enumerate(data):
+            errors.extend(validate_spec(item, schema["items"], f"{where}[{index}]"))
+
+    elif isinstance(data, str):
+        if len(data) < schema.get("minLength", 0):
+            errors.append(f"{where}: must not be empty")
+        if "pattern" in schema and not re.match(schema["pattern"], data):
+            errors.append(f"{where}: {data!r} does not match {schema['pattern']}")
+
+    elif isinstance(data, int) and not isinstance(data, bool):
+        if "minimum" in schema and data < schema["minimum"]:
+            errors.append(f"{where}: must be at least {schema['minimum']}")
+
+    return errors
+
+
+def read_spec_file(path: str) -> Any:
+    """Parse a JSON or YAML spec file (YAML needs PyYAML)"""
+    with open(path, 'r', encoding='utf-8') as f:
+        if Path(path).suffix.lower() in (".yaml", ".yml"):
+            try:
+                import yaml
+            except ImportError:
+                raise SpecError(path, ["PyYAML is required for YAML specs (pip install pyyaml)"])
+            try:
+                return yaml.safe_load(f)
+            except yaml.YAMLError as e:
+                raise SpecError(path, [f"invalid YAML: {e}"])
+        return json.load(f)
+
+
+def load_project_config(path: str, output_path: Optional[str] = None) -> ProjectConfig:
+    """Load, validate and convert a spec file into a ProjectConfig.
+
+    Raises SpecError listing every schema violation of the file, or else
+    every problem found by validate_config.
+    output_path, when given, overrides the one of the spec.
+    """
+    try:
+        data = read_spec_file(path)
+    except SpecError:
+        raise
+    except (OSError, ValueError) as e:
+        raise SpecError(path, [str(e)])
+
+    errors = validate_spec(data)
+    if errors:
+        raise SpecError(path, errors)
+
+    # Property lists are loaded column-wise: specs can hold tens of thousands of columns
+    config = ProjectConfig.from_dict(data, columnar=True)
+    errors = validate_config(config)
+    if errors:
+        raise SpecError(path, errors)
+
+    if output_path is not None:
+        config.output_path = output_path
+    return config
+
+
+def expand_spec_paths(inputs: List[str]) -> List[str]:
+    """Expand files, directories and glob patterns into a sorted, de-duplicated list of spec files"""
+    paths = []
+
+    for spec_input in inputs:
+        if Path(spec_input).is_dir():
+            matches = [
+                str(path) for path in Path(spec_input).iterdir()
+                if path.is_file() and path.suffix.lower() in SPEC_EXTENSIONS
+            ]
+        elif any(character in spec_input for character in "*?["):
+            matches = glob.glob(spec_input, recursive=True)
+        else:
+            matches = [spec_input]
+        paths.extend(sorted(matches))
+
+    return list(dict.fromkeys(paths))
+
+
+def add_arguments(parser: argparse.ArgumentParser):
+    """Options of the generate command"""
+    parser.add_argument("--spec", nargs="+", required=True, metavar="PATH",
+                        help="spec files (JSON/YAML), directories or glob patterns")
+    parser.add_argument("--output-path", help="override the output_path of every spec")
+    parser.add_argument("--workers", type=int, help="projects generated in parallel (default: CPU count)")
+    parser.add_argument("--incremental", action="store_true", help="only rewrite files whose content changed")
+    parser.add_argument("--atomic", action="store_true", help="stage each project and swap it in atomically")
+    parser.add_argument("--check", action="store_true", help="only validate the specs, generate nothing")
+    parser.add_argument("--template-dir", action="append", metavar="DIR",
+                        help="override template directory, repeatable (the first one wins)")
+    parser.add_argument("--template-cache", metavar="DIR", help="directory caching compiled templates across runs")
+    parser.add_argument("--skip-emitter", action="append", default=[], metavar="NAME",
+                        help="emitter not to run, repeatable (e.g. readme, swagger, test_project)")
+    parser.add_argument("--blob-store", metavar="DIR",
+                        help="store identical files once in DIR and link them into each project")
+    parser.add_argument("--blob-link", choices=list(LINK_METHODS), default="auto",
+                        help="how stored files are placed in projects (default: auto = reflink, hardlink, copy)")
+
+
+def run(args: argparse.Namespace) -> int:
+    """Generate every spec and print a JSON summary on stdout; non-zero exit if anything failed"""
+    spec_paths = expand_spec_paths(args.spec)
+    entries = {}  # spec path -> summary entry, in spec order
+    configs = {}
+
+    for spec_path in spec_paths:
+        try:
+            configs[spec_path] = load_project_config(spec_path, args.output_path)
+        except SpecError as e:
+            entries[spec_path] = {'spec': spec_path, 'success': False, 'errors': e.errors}
+            continue
+        entries[spec_path] = {'spec': spec_path, 'success': True, 'project_name': configs[spec_path].project_name}
+
+    if not args.check and configs:
+        generator_options = {'incremental': args.incremental, 'atomic': args.atomic,
+                             'template_dirs': args.template_dir, 'template_cache': args.template_cache,
+                             'skip_emitters': args.skip_emitter}
+        if args.blob_store:
+            generator_options['blob_store'] = BlobStore(args.blob_store, args.blob_link)
+        results = generate_many(configs.values(), workers=args.workers, **generator_options)
+        for spec_path, result in zip(configs, results):
+            entry = entries[spec_path]
+            entry.update({
+                'success': result.success,
+                'project_path': result.project_path,
+                'files': len(result.files),
+                'bytes': result.total_bytes,
+                'duration': round(result.duration, 4)
+            })
+            if not result.success:
+                entry['errors'] = [result.error]
+
+    projects = list(entries.values())
+    if not projects:
+        projects.append({'spec': None, 'success': False, 'errors': ["no spec file matched"]})
+
+    succeeded = sum(1 for project in projects if project['success'])
+    summary = {'succeeded': succeeded, 'failed': len(projects) - succeeded, 'projects': projects}
+
+    json.dump(summary, sys.stdout, indent=2)
+    sys.stdout.write("\n")
+    return 1 if summary['failed'] else 0
+
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(description="Generate .NET projects from JSON/YAML spec files")
+    add_arguments(parser)
+    return run(parser.parse_args(argv))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
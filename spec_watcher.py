@@ -0,0 +1,183 @@
+#!/usr/bin/env python3
+"""
+Watch mode for the .NET project generator
+Polls spec files and regenerates a project as soon as its spec changes, re-rendering only the edited entities
+"""
+
+import argparse
+import os
+import sys
+import time
+from dataclasses import replace
+from typing import List, Optional, Tuple
+
+from enhanced_dotnet_generator import EnhancedDotNetGenerator, EntityRenderCache, ProjectConfig
+from project_spec import SpecError, expand_spec_paths, load_project_config
+
+
+# Seconds between two scans of the spec files
+DEFAULT_INTERVAL = 0.25
+
+# Changed entities named in a watch event line
+MAX_LISTED_ENTITIES = 5
+
+
+def spec_signature(path: str) -> Optional[Tuple[int, int]]:
+    """(mtime, size) of a spec file, None once it is gone"""
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+def changed_entities(previous: Optional[ProjectConfig], config: ProjectConfig) -> List[str]:
+    """Names of the entities added, edited or removed between two versions of a config.
+
+    Any change to the project settings affects every entity.
+    """
+    if previous is None or replace(previous, entities=[]) != replace(config, entities=[]):
+        return [entity.name for entity in config.entities]
+
+    before = {entity.name: entity for entity in previous.entities}
+    current = {entity.name for entity in config.entities}
+    return (
+        [entity.name for entity in config.entities if before.get(entity.name) != entity] +
+        [name for name in before if name not in current]
+    )
+
+
+class WatchedSpec:
+    """A spec file being watched, with the generator and entity cache of its project"""
+
+    def __init__(self, path: str, atomic: bool = False):
+        self.path = path
+        self.signature = None
+        self.config = None
+        self.generator = EnhancedDotNetGenerator(incremental=True, atomic=atomic, entity_cache=EntityRenderCache())
+
+
+class SpecWatcher:
+    """Regenerates the project of every watched spec whenever the spec file changes.
+
+    Each spec keeps a warm generator in incremental mode with an entity
+    cache: unchanged entities are not rendered again, and only the files
+    whose content changed (the edited entities and the aggregates listing
+    them: DbContext, csproj, README...) are rewritten.
+    """
+
+    def __init__(self, inputs: List[str], output_path: Optional[str] = None, atomic: bool = False):
+        self.inputs = inputs
+        self.output_path = output_path
+        self.atomic = atomic
+        self._specs = {}  # spec path -> WatchedSpec
+
+    def poll(self) -> List[dict]:
+        """Scan the spec files once, regenerating the changed ones; returns one event per change"""
+        events = []
+        present = set()
+
+        for path in expand_spec_paths(self.inputs):
+            signature = spec_signature(path)
+            if signature is None:
+                continue
+            present.add(path)
+
+            spec = self._specs.get(path)
+            if spec is None:
+                spec = self._specs[path] = WatchedSpec(path, self.atomic)
+            if signature == spec.signature:
+                continue
+            spec.signature = signature
+            events.append(self._regenerate(spec))
+
+        for path in [path for path in self._specs if path not in present]:
+            del self._specs[path]
+            events.append({'spec': path, 'success': True, 'removed': True})
+
+        return events
+
+    def _regenerate(self, spec: WatchedSpec) -> dict:
+        """Reload a spec and regenerate its project"""
+        start = time.perf_counter()
+
+        try:
+            config = load_project_config(spec.path, self.output_path)
+        except SpecError as e:
+            return {'spec': spec.path, 'success': False, 'errors': e.errors}
+
+        entities = changed_entities(spec.config, config)
+        result = spec.generator.generate_project(config)
+        if not result.success:
+            return {'spec': spec.path, 'success': False, 'errors': [result.error]}
+
+        spec.config = config
+        return {
+            'spec': spec.path,
+            'success': True,
+            'project_name': config.project_name,
+            'entities': entities,
+            'files_written': result.files_written,
+            'files_unchanged': result.files_unchanged,
+            'files_removed': result.files_removed,
+            'milliseconds': (time.perf_counter() - start) * 1000
+        }
+
+
+def format_event(event: dict) -> str:
+    """One line describing a watch event"""
+    stamp = time.strftime("%H:%M:%S")
+
+    if event.get('removed'):
+        return f"[{stamp}] {event['spec']}: spec removed, no longer watched (project left in place)"
+    if not event['success']:
+        return f"[{stamp}] ❌ {event['spec']}: " + "; ".join(event['errors'])
+
+    entities = ", ".join(event['entities'][:MAX_LISTED_ENTITIES]) or "none"
+    if len(event['entities']) > MAX_LISTED_ENTITIES:
+        entities += f" and {len(event['entities']) - MAX_LISTED_ENTITIES} more"
+    return (f"[{stamp}] ✅ {event['project_name']}: {event['files_written']} written, "
+            f"{event['files_unchanged']} unchanged, {event['files_removed']} removed "
+            f"(entities: {entities}) in {event['milliseconds']:.1f} ms")
+
+
+def add_arguments(parser: argparse.ArgumentParser):
+    """Options of the watch command"""
+    parser.add_argument("--spec", nargs="+", required=True, metavar="PATH",
+                        help="spec files (JSON/YAML), directories or glob patterns to watch")
+    parser.add_argument("--output-path", help="override the output_path of every spec")
+    parser.add_argument("--interval", type=float, default=DEFAULT_INTERVAL,
+                        help=f"seconds between two scans of the specs (default: {DEFAULT_INTERVAL})")
+    parser.add_argument("--atomic", action="store_true", help="stage each project and swap it in atomically")
+    parser.add_argument("--once", action="store_true", help="generate every spec once and exit")
+
+
+def run(args: argparse.Namespace) -> int:
+    """Watch the specs until interrupted (or once with --once)"""
+    watcher = SpecWatcher(args.spec, args.output_path, atomic=args.atomic)
+    if not args.once:
+        print(f"👀 Watching {' '.join(args.spec)} every {args.interval}s (Ctrl+C to stop)", flush=True)
+
+    failed = False
+    try:
+        while True:
+            for event in watcher.poll():
+                failed = failed or not event['success']
+                print(format_event(event), flush=True)
+            if args.once:
+                break
+            time.sleep(args.interval)
+    except KeyboardInterrupt:
+        pass
+
+    return 1 if args.once and failed else 0
+
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(description="Regenerate .NET projects whenever their spec files change")
+    add_arguments(parser)
+    return run(parser.parse_args(argv))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
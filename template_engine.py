@@ -0,0 +1,240 @@
+#!/usr/bin/env python3
+"""
+Template overrides for the .NET project generator
+Loads, compiles and caches the templates of override directories (Jinja2 or a small built-in engine)
+"""
+
+import hashlib
+import importlib.util
+import marshal
+import os
+import re
+import tempfile
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+
+# Template engines available through TemplateEngine(engine=...); "auto" picks Jinja2 when installed
+TEMPLATE_ENGINES = ("auto", "builtin", "jinja2")
+
+# Variables available to every template
+TEMPLATE_VARIABLES = ("config", "project_name", "entity", "entities", "default", "guid")
+
+# Bumped whenever the built-in compiler changes, to invalidate its bytecode cache
+BUILTIN_ENGINE_VERSION = "1"
+
+TOKEN_PATTERN = re.compile(r"({{.*?}}|{%.*?%}|{#.*?#})", re.DOTALL)
+
+# Compiled templates shared by every engine of the process: (engine, template digest) -> render function
+_compiled = {}
+
+# Jinja2 environments shared by every engine of the process: (directories, cache directory) -> environment
+_jinja_environments = {}
+
+
+class TemplateError(ValueError):
+    """A template that cannot be compiled or rendered"""
+
+
+def compile_builtin(text: str, name: str) -> str:
+    """Translate a template into the Python source of a render function.
+
+    The built-in engine understands the Jinja2 subset {{ expression }},
+    {% for ... in ... %} / {% endfor %}, {% if %} / {% elif %} / {% else %} /
+    {% endif %} and {# comments #}; expressions are Python expressions.
+    """
+    lines = [f"def render({', '.join(TEMPLATE_VARIABLES)}):", "    _out = []", "    _append = _out.append"]
+    blocks = []  # Keywords of the open blocks
+    template_line = 1
+
+    for token in TOKEN_PATTERN.split(text):
+        indent = "    " * (len(blocks) + 1)
+
+        if token.startswith("{{") and token.endswith("}}"):
+            lines.append(f"{indent}_append(str({token[2:-2].strip()}))  # line {template_line}")
+        elif token.startswith("{%") and token.endswith("%}"):
+            statement = token[2:-2].strip()
+            keyword = statement.split(None, 1)[0] if statement else ""
+            if keyword in ("for", "if"):
+                lines.append(f"{indent}{statement}:  # line {template_line}")
+                lines.append(f"{indent}    pass")
+                blocks.append(keyword)
+            elif keyword in ("elif", "else"):
+                if not blocks or blocks[-1] != "if":
+                    raise TemplateError(f"{name}:{template_line}: {keyword} outside of an if block")
+                lines.append(f"{indent[4:]}{statement}:  # line {template_line}")
+                lines.append(f"{indent}pass")
+            elif keyword in ("endfor", "endif"):
+                if not blocks or blocks[-1] != keyword[3:]:
+                    raise TemplateError(f"{name}:{template_line}: unexpected {keyword}")
+                blocks.pop()
+            else:
+                raise TemplateError(f"{name}:{template_line}: unsupported statement {statement!r}")
+        elif not token.startswith("{#") and token:
+            lines.append(f"{indent}_append({token!r})")
+
+        template_line += token.count("\n")
+
+    if blocks:
+        raise TemplateError(f"{name}: missing end{blocks[-1]}")
+
+    lines.append("    return ''.join(_out)")
+    return "\n".join(lines) + "\n"
+
+
+def _save_bytecode(code, cache_file: Path):
+    """Save compiled bytecode to the cache; a cache that cannot be written is skipped"""
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        # Written aside under a unique name and renamed, so concurrent threads and
+        # workers never read half a file nor remove each other's temporary file
+        handle, temporary_name = tempfile.mkstemp(prefix=f".{cache_file.stem[:16]}-", suffix=".tmp",
+                                                  dir=cache_file.parent)
+        try:
+            with os.fdopen(handle, 'wb') as f:
+                f.write(importlib.util.MAGIC_NUMBER + marshal.dumps(code))
+            os.replace(temporary_name, cache_file)
+        except BaseException:
+            os.unlink(temporary_name)
+            raise
+    except OSError:
+        # Read-only or full disk: the template still renders from the compiled code
+        pass
+
+
+def _load_builtin(text: str, name: str, cache_dir: Optional[Path]) -> Callable:
+    """Compiled render function of a built-in template, through the on-disk bytecode cache"""
+    key = hashlib.sha256(f"{BUILTIN_ENGINE_VERSION}\0{text}".encode('utf-8')).hexdigest()
+    cache_file = cache_dir / f"{key}.bytecode" if cache_dir is not None else None
+    code = None
+
+    if cache_file is not None:
+        try:
+            data = cache_file.read_bytes()
+            # Bytecode of another Python version is ignored
+            if data.startswith(importlib.util.MAGIC_NUMBER):
+                code = marshal.loads(data[len(importlib.util.MAGIC_NUMBER):])
+        except (OSError, EOFError, ValueError, TypeError):
+            code = None
+
+    if code is None:
+        try:
+            code = compile(compile_builtin(text, name), f"<template {name}>", "exec")
+        except SyntaxError as e:
+            raise TemplateError(f"{name}: invalid expression: {e.text.strip() if e.text else e.msg}") from e
+
+        if cache_file is not None:
+            _save_bytecode(code, cache_file)
+
+    namespace = {}
+    exec(code, namespace)
+    return namespace['render']
+
+
+class TemplateEngine:
+    """Override templates looked up in one or more directories.
+
+    Each directory mirrors the generated project, with "Project" standing
+    for the project name and "Entity" for the entity name, e.g.
+    src/Project/Models/Entity.cs or README.md. Earlier directories take
+    precedence, so an organization directory can be listed before a shared
+    one. Templates are compiled once per process (and cached as bytecode in
+    cache_dir), so batch runs only pay their load time once.
+    """
+
+    def __init__(self, template_dirs: List[str], cache_dir: Optional[str] = None, engine: str = "auto"):
+        if engine not in TEMPLATE_ENGINES:
+            raise ValueError(f"Unsupported template engine: {engine}")
+        if engine == "auto":
+            engine = "jinja2" if importlib.util.find_spec("jinja2") is not None else "builtin"
+        elif engine == "jinja2" and importlib.util.find_spec("jinja2") is None:
+            raise ValueError("Jinja2 is required for the jinja2 template engine (pip install jinja2)")
+
+        self.template_dirs = [Path(template_dir).resolve() for template_dir in template_dirs]
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        self.engine = engine
+        self._sources = self._scan()  # template name -> (text, digest)
+        self._renderers = {}
+
+        # Identifies the set of overrides, e.g. for generation cache keys
+        digest = hashlib.sha256(engine.encode('utf-8'))
+        for name in sorted(self._sources):
+            digest.update(f"\0{name}\0{self._sources[name][1]}".encode('utf-8'))
+        self.fingerprint = digest.hexdigest()
+
+        if engine == "jinja2":
+            self._environment = self._jinja_environment()
+
+    def _scan(self) -> Dict[str, Tuple[str, str]]:
+        """Read every template of the override directories, the first directory winning"""
+        sources = {}
+        for template_dir in self.template_dirs:
+            if not template_dir.is_dir():
+                raise ValueError(f"Template directory not found: {template_dir}")
+            for directory, _, filenames in os.walk(template_dir):
+                for filename in filenames:
+                    path = Path(directory) / filename
+                    name = path.relative_to(template_dir).as_posix()
+                    if name not in sources:
+                        text = path.read_text(encoding='utf-8')
+                        sources[name] = (text, hashlib.sha256(text.encode('utf-8')).hexdigest())
+        return sources
+
+    def _jinja_environment(self):
+        """Jinja2 environment of the directories, shared by every engine of the process"""
+        key = (tuple(self.template_dirs), self.cache_dir)
+        environment = _jinja_environments.get(key)
+        if environment is None:
+            import jinja2
+
+            bytecode_cache = None
+            if self.cache_dir is not None:
+                self.cache_dir.mkdir(parents=True, exist_ok=True)
+                bytecode_cache = jinja2.FileSystemBytecodeCache(str(self.cache_dir))
+            environment = _jinja_environments[key] = jinja2.Environment(
+                loader=jinja2.FileSystemLoader([str(template_dir) for template_dir in self.template_dirs]),
+                bytecode_cache=bytecode_cache,
+                keep_trailing_newline=True,
+                undefined=jinja2.StrictUndefined,
+                auto_reload=False
+            )
+        return environment
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._sources
+
+    def needs_default(self, name: str) -> bool:
+        """Whether a template may use the built-in rendering (the default variable)"""
+        return "default" in self._sources[name][0]
+
+    def _renderer(self, name: str) -> Callable:
+        """Compiled render function of a template"""
+        renderer = self._renderers.get(name)
+        if renderer is None:
+            text, digest = self._sources[name]
+            key = (self.engine, digest)
+            renderer = _compiled.get(key)
+            if renderer is None:
+                if self.engine == "jinja2":
+                    import jinja2
+
+                    try:
+                        template = self._environment.get_template(name)
+                    except jinja2.TemplateError as e:
+                        raise TemplateError(f"{name}: {e}") from e
+                    renderer = template.render
+                else:
+                    renderer = _load_builtin(text, name, self.cache_dir)
+                _compiled[key] = renderer
+            self._renderers[name] = renderer
+        return renderer
+
+    def render(self, name: str, **context) -> str:
+        """Render an override template with the variables of TEMPLATE_VARIABLES"""
+        values = {variable: context.get(variable) for variable in TEMPLATE_VARIABLES}
+        try:
+            return self._renderer(name)(**values)
+        except TemplateError:
+            raise
+        except Exception as e:
+            raise TemplateError(f"{name}: {type(e).__name__}: {e}") from e